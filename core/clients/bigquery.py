@@ -5,6 +5,7 @@ Provides audit-aware BigQuery operations with automatic schema handling.
 """
 
 import logging
+import threading
 from datetime import datetime
 from functools import lru_cache
 from typing import Any, Optional
@@ -23,6 +24,11 @@ class BigQueryClient:
         client = BigQueryClient(project, dataset)
         client.log_audit(context, "job_started", {"job": "clean_old_orders"})
         client.write_kpis(job_result.to_kpi_dict())
+
+    Thread safety:
+        The underlying google-cloud client is created once under a lock, and
+        audit inserts (the calls made from worker threads, via SentinelLogger)
+        go through it one at a time.
     """
 
     def __init__(
@@ -43,16 +49,20 @@ class BigQueryClient:
         self.feedback_table = feedback_table
         self.tasks_table = tasks_table
         self._client = None
+        # Guards lazy client creation and audit inserts
+        self._lock = threading.Lock()
 
     def _get_client(self):
         """Get or create BigQuery client."""
         if self._client is None:
-            try:
-                from google.cloud import bigquery
-                self._client = bigquery.Client(project=self.project)
-            except ImportError:
-                logger.warning("google-cloud-bigquery not installed")
-                raise
+            with self._lock:
+                if self._client is None:
+                    try:
+                        from google.cloud import bigquery
+                        self._client = bigquery.Client(project=self.project)
+                    except ImportError:
+                        logger.warning("google-cloud-bigquery not installed")
+                        raise
         return self._client
 
     def _get_table_id(self, table: str) -> str:
@@ -229,7 +239,8 @@ class BigQueryClient:
                 "data": json.dumps(data) if data else None,
             }
 
-            errors = client.insert_rows_json(table_id, [row])
+            with self._lock:
+                errors = client.insert_rows_json(table_id, [row])
             if errors:
                 logger.error(f"BigQuery audit insert errors: {errors}")
                 return False
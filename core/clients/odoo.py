@@ -5,8 +5,10 @@ Provides a type-safe interface to Odoo's XML-RPC API.
 """
 
 import logging
+import threading
+from collections import deque
 from functools import lru_cache
-from typing import Any, Optional
+from typing import Any, Optional, Union
 import xmlrpc.client
 
 from core.config import Settings, get_settings
@@ -25,6 +27,15 @@ class OdooClient:
             domain=[("state", "=", "sale")],
             fields=["id", "name", "partner_id"]
         )
+
+    Thread safety:
+        Each RPC borrows a models endpoint proxy from a pool of idle ones.
+        A proxy holds a persistent (keep-alive) HTTP connection and is used
+        by one call at a time, so one client can be shared by worker threads
+        issuing independent RPCs concurrently, and short-lived worker threads
+        reuse already-open connections instead of opening new ones.
+        Authentication (and the common endpoint proxy it uses) is serialized
+        by a lock, so threads hitting an idle connection re-authenticate once.
     """
 
     def __init__(
@@ -40,7 +51,15 @@ class OdooClient:
         self.password = password
         self._uid: Optional[int] = None
         self._common: Optional[xmlrpc.client.ServerProxy] = None
-        self._models: Optional[xmlrpc.client.ServerProxy] = None
+        # Guards _uid, _common and _auth_generation while (re-)authenticating
+        self._auth_lock = threading.Lock()
+        # Bumped on every successful authentication
+        self._auth_generation = 0
+        # mail.mt_note subtype ID, looked up on first message post
+        self._note_subtype_id: Any = None
+        # Idle models proxies (ServerProxy is not thread-safe, so each is
+        # used by one call at a time; deque append/pop are atomic)
+        self._idle_models: deque[xmlrpc.client.ServerProxy] = deque()
 
     def _get_common(self) -> xmlrpc.client.ServerProxy:
         """Get or create common endpoint proxy."""
@@ -51,14 +70,19 @@ class OdooClient:
             )
         return self._common
 
-    def _get_models(self) -> xmlrpc.client.ServerProxy:
-        """Get or create models endpoint proxy."""
-        if self._models is None:
-            self._models = xmlrpc.client.ServerProxy(
-                f"{self.url}/xmlrpc/2/object",
-                allow_none=True,
-            )
-        return self._models
+    def _new_models(self) -> xmlrpc.client.ServerProxy:
+        """Create a models endpoint proxy (opens its connection on first call)."""
+        return xmlrpc.client.ServerProxy(
+            f"{self.url}/xmlrpc/2/object",
+            allow_none=True,
+        )
+
+    def _checkout_models(self) -> xmlrpc.client.ServerProxy:
+        """Take an idle models proxy, keeping its open connection, or create one."""
+        try:
+            return self._idle_models.pop()
+        except IndexError:
+            return self._new_models()
 
     def authenticate(self) -> int:
         """
@@ -73,27 +97,52 @@ class OdooClient:
         if self._uid is not None:
             return self._uid
 
-        try:
-            common = self._get_common()
-            uid = common.authenticate(
-                self.db,
-                self.username,
-                self.password,
-                {},
-            )
+        with self._auth_lock:
+            # Another thread may have authenticated while this one waited
+            if self._uid is not None:
+                return self._uid
 
-            if not uid:
-                raise ConnectionError(
-                    f"Authentication failed for user {self.username} on {self.url}"
+            try:
+                common = self._get_common()
+                uid = common.authenticate(
+                    self.db,
+                    self.username,
+                    self.password,
+                    {},
                 )
 
-            self._uid = uid
-            logger.info(f"Authenticated with Odoo as uid={uid}")
-            return uid
+                if not uid:
+                    raise ConnectionError(
+                        f"Authentication failed for user {self.username} on {self.url}"
+                    )
+
+                self._uid = uid
+                self._auth_generation += 1
+                logger.info(f"Authenticated with Odoo as uid={uid}")
+                return uid
 
-        except xmlrpc.client.Fault as e:
-            logger.error(f"Odoo XML-RPC fault: {e.faultString}")
-            raise ConnectionError(f"Odoo XML-RPC error: {e.faultString}")
+            except xmlrpc.client.Fault as e:
+                logger.error(f"Odoo XML-RPC fault: {e.faultString}")
+                raise ConnectionError(f"Odoo XML-RPC error: {e.faultString}")
+
+    def _reauthenticate(self, generation: int) -> int:
+        """
+        Re-authenticate after an idle connection error.
+
+        Only the first thread to report a given authentication generation
+        drops the uid; threads that hit the same idle error reuse the uid
+        it obtains.
+
+        Args:
+            generation: _auth_generation seen when the failed call started
+
+        Returns:
+            User ID (uid)
+        """
+        with self._auth_lock:
+            if self._auth_generation == generation:
+                self._uid = None
+        return self.authenticate()
 
     @property
     def uid(self) -> int:
@@ -121,11 +170,13 @@ class OdooClient:
         Returns:
             Method result
         """
+        uid = self.uid
+        generation = self._auth_generation
+        models = self._checkout_models()
         try:
-            models = self._get_models()
             return models.execute_kw(
                 self.db,
-                self.uid,
+                uid,
                 self.password,
                 model,
                 method,
@@ -135,12 +186,12 @@ class OdooClient:
         except Exception as e:
             if "Idle" in str(e):
                 logger.warning("Odoo connection idle, re-authenticating...")
-                self._uid = None
-                self._models = None
-                models = self._get_models()
+                uid = self._reauthenticate(generation)
+                # Replace the stale connection
+                models = self._new_models()
                 return models.execute_kw(
                     self.db,
-                    self.uid,
+                    uid,
                     self.password,
                     model,
                     method,
@@ -148,6 +199,8 @@ class OdooClient:
                     kwargs or {},
                 )
             raise
+        finally:
+            self._idle_models.append(models)
 
     def search(
         self,
@@ -183,6 +236,7 @@ class OdooClient:
         model: str,
         ids: list[int],
         fields: Optional[list[str]] = None,
+        load: Optional[str] = None,
     ) -> list[dict]:
         """
         Read records by IDs.
@@ -191,6 +245,8 @@ class OdooClient:
             model: Odoo model name
             ids: List of record IDs
             fields: Fields to read (None for all)
+            load: "_classic_write" returns many2one fields as bare IDs,
+                skipping the server-side name_get (default: id + name pairs)
 
         Returns:
             List of record dictionaries
@@ -198,6 +254,8 @@ class OdooClient:
         kwargs = {}
         if fields is not None:
             kwargs["fields"] = fields
+        if load is not None:
+            kwargs["load"] = load
 
         return self.execute(model, "read", ids, **kwargs)
 
@@ -209,6 +267,7 @@ class OdooClient:
         offset: int = 0,
         limit: Optional[int] = None,
         order: Optional[str] = None,
+        load: Optional[str] = None,
     ) -> list[dict]:
         """
         Search and read records in one call.
@@ -220,6 +279,8 @@ class OdooClient:
             offset: Number of records to skip
             limit: Maximum records to return
             order: Sort order
+            load: "_classic_write" returns many2one fields as bare IDs,
+                skipping the server-side name_get (default: id + name pairs)
 
         Returns:
             List of record dictionaries
@@ -231,6 +292,8 @@ class OdooClient:
             kwargs["limit"] = limit
         if order is not None:
             kwargs["order"] = order
+        if load is not None:
+            kwargs["load"] = load
 
         return self.execute(model, "search_read", domain, **kwargs)
 
@@ -247,16 +310,42 @@ class OdooClient:
         """
         return self.execute(model, "search_count", domain)
 
-    def create(self, model: str, values: dict) -> int:
+    def read_group(
+        self,
+        model: str,
+        domain: list,
+        fields: list[str],
+        groupby: list[str],
+        lazy: bool = True,
+    ) -> list[dict]:
+        """
+        Aggregate records server-side, grouped by one or more fields.
+
+        Args:
+            model: Odoo model name
+            domain: Search domain
+            fields: Fields to aggregate, e.g. ["product_uom_qty:sum"]
+            groupby: Fields to group by
+            lazy: If True, only group by the first groupby field
+
+        Returns:
+            List of group dicts with the aggregated values
+        """
+        return self.execute(model, "read_group", domain, fields, groupby, lazy=lazy)
+
+    def create(
+        self, model: str, values: Union[dict, list[dict]]
+    ) -> Union[int, list[int]]:
         """
-        Create a new record.
+        Create a new record, or several records in one call.
 
         Args:
             model: Odoo model name
-            values: Field values for the new record
+            values: Field values for the new record, or a list of them to
+                create multiple records in a single batched create
 
         Returns:
-            ID of created record
+            ID of created record (list of IDs when values is a list)
         """
         return self.execute(model, "create", values)
 
@@ -355,19 +444,7 @@ class OdooClient:
                 attachments=[{"name": "report.pdf", "datas": data}]
             )
         """
-        # Get the subtype for notes (mt_note) to render HTML properly
-        subtype_id = False
-        try:
-            subtype = self.search_read(
-                "ir.model.data",
-                [["module", "=", "mail"], ["name", "=", "mt_note"]],
-                fields=["res_id"],
-                limit=1,
-            )
-            if subtype:
-                subtype_id = subtype[0]["res_id"]
-        except Exception:
-            pass  # Fall back to no subtype
+        subtype_id = self._get_note_subtype_id()
 
         # Create attachments first if provided
         attachment_ids = []
@@ -401,6 +478,63 @@ class OdooClient:
 
         return self.create("mail.message", message_vals)
 
+    def message_post_batch(
+        self,
+        messages: list[dict],
+        message_type: str = "comment",
+    ) -> list[int]:
+        """
+        Post messages on many records with a single mail.message create.
+
+        Same rendering as message_post (note subtype, HTML body), but all
+        messages are created in one multi-record create call.
+
+        Args:
+            messages: Dicts with model, record_id and body
+            message_type: Type of message ("comment", "notification", etc.)
+
+        Returns:
+            Message IDs, in the order of messages
+        """
+        if not messages:
+            return []
+
+        subtype_id = self._get_note_subtype_id()
+        vals_list = [
+            {
+                "model": msg["model"],
+                "res_id": msg["record_id"],
+                "body": msg["body"],
+                "message_type": message_type,
+                "subtype_id": subtype_id,
+            }
+            for msg in messages
+        ]
+        return self.execute("mail.message", "create", vals_list)
+
+    def _get_note_subtype_id(self) -> Any:
+        """
+        Get the mail.mt_note subtype ID (False if unavailable).
+
+        Looked up once per client, so posting a message costs one RPC.
+        A failed lookup is not cached and is retried on the next post.
+        """
+        if self._note_subtype_id is not None:
+            return self._note_subtype_id
+
+        # Get the subtype for notes (mt_note) to render HTML properly
+        try:
+            subtype = self.search_read(
+                "ir.model.data",
+                [["module", "=", "mail"], ["name", "=", "mt_note"]],
+                fields=["res_id"],
+                limit=1,
+            )
+        except Exception:
+            return False  # Fall back to no subtype
+        self._note_subtype_id = subtype[0]["res_id"] if subtype else False
+        return self._note_subtype_id
+
     def add_tag(
         self,
         model: str,
@@ -179,9 +179,10 @@ class AdjustClosedOrderQuantitiesJob(BaseJob):
             order_lines_skipped = 0
             order_has_error = False
             adjusted_lines_for_message = []
+            lines_to_adjust = []
 
             try:
-                # Evaluate and adjust each line
+                # Evaluate each line
                 for line in mismatched_lines:
                     line_id = line["id"]
                     ordered_qty = line["product_uom_qty"]
@@ -212,11 +213,13 @@ class AdjustClosedOrderQuantitiesJob(BaseJob):
                     # Store values for chatter message
                     line["_target_qty"] = target_qty
                     line["_open_move_qty"] = total_open_move_qty
+                    lines_to_adjust.append(line)
 
-                    # Perform adjustment
-                    op_result = order_ops.adjust_line_qty_to_delivered_qty(
-                        line, order_name=order_name, target_qty=target_qty
-                    )
+                # Perform adjustments (one write per distinct target qty)
+                op_results = order_ops.adjust_lines_qty_to_delivered_bulk(
+                    lines_to_adjust, order_name=order_name
+                )
+                for line, op_result in zip(lines_to_adjust, op_results):
                     result.add_operation(op_result)
 
                     if op_result.success:
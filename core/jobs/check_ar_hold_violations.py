@@ -7,6 +7,7 @@ violations with AR-HOLD:N tags.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Optional
 
@@ -80,6 +81,7 @@ class CheckArHoldViolationsJob(BaseJob):
         limit: Optional[int] = None,
         extension_days: int = 15,
         skip_partner_check: bool = False,
+        max_workers: int = 8,
         **_params
     ) -> JobResult:
         """
@@ -90,6 +92,8 @@ class CheckArHoldViolationsJob(BaseJob):
             limit: Maximum number of orders to process
             extension_days: Days to extend commitment_date (default: 15)
             skip_partner_check: Skip partner block tag check (for testing)
+            max_workers: Concurrent picking syncs, from one pool for the
+                whole run (1 = sequential)
 
         Returns:
             JobResult with execution details and processed_order_ids
@@ -100,6 +104,7 @@ class CheckArHoldViolationsJob(BaseJob):
             "limit": limit,
             "extension_days": extension_days,
             "skip_partner_check": skip_partner_check,
+            "max_workers": max_workers,
         })
 
         # Initialize data for passing to next job
@@ -136,6 +141,21 @@ class CheckArHoldViolationsJob(BaseJob):
         # Initialize operations
         date_ops = DateComplianceOperations(self.odoo, self.ctx, self.log)
 
+        # Load order fields, AR-HOLD tags and partner categories for all
+        # orders in one pass (on failure, orders fall back to single reads)
+        order_context: Optional[dict[int, dict]] = None
+        try:
+            order_context = date_ops.load_order_context(order_ids)
+        except Exception as e:
+            self.log.warning(f"Order context prefetch failed: {e}")
+
+        # Single reference time for the whole run
+        job_now = datetime.now()
+
+        # One pool for the whole run; each order's pickings are submitted to it.
+        # Shut down after the order loop, which handles errors per order
+        sync_pool = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+
         # Track KPIs
         orders_processed = 0
         pickings_updated = 0
@@ -147,26 +167,33 @@ class CheckArHoldViolationsJob(BaseJob):
             result.records_checked += 1
 
             try:
-                # Read order data
-                orders = self.odoo.search_read(
-                    "sale.order",
-                    [("id", "=", order_id)],
-                    fields=["id", "name", "partner_id", "commitment_date", "ah_cancel_date"],
-                )
+                # Order data (prefetched, or read individually as fallback)
+                if order_context is not None:
+                    order = order_context.get(order_id)
+                else:
+                    orders = self.odoo.search_read(
+                        "sale.order",
+                        [("id", "=", order_id)],
+                        fields=["id", "name", "partner_id", "commitment_date", "ah_cancel_date"],
+                        load="_classic_write",  # partner_id as bare ID, no name_get
+                    )
+                    order = orders[0] if orders else None
 
-                if not orders:
+                if not order:
                     self.log.warning(f"Order {order_id} not found")
                     result.records_skipped += 1
                     skip_reasons["not_found"] = skip_reasons.get("not_found", 0) + 1
                     continue
 
-                order = orders[0]
                 order_name = order["name"]
-                partner_id = order["partner_id"][0] if order["partner_id"] else None
+                partner_id = order["partner_id"] or None
 
                 # Check partner has block tag (unless skipped)
                 if not skip_partner_check and partner_id:
-                    has_block = date_ops.check_partner_has_block_tag(partner_id)
+                    has_block = date_ops.check_partner_has_block_tag(
+                        partner_id,
+                        category_ids=order.get("partner_category_ids"),
+                    )
                     if not has_block:
                         self.log.skip(
                             order_id,
@@ -211,6 +238,7 @@ class CheckArHoldViolationsJob(BaseJob):
                 new_commitment, hold_n = date_ops.calculate_next_commitment_date(
                     cancel_date=cancel_date,
                     interval_days=extension_days,
+                    now=job_now,
                 )
 
                 # Odoo safeguard: if commitment_date is already at or past
@@ -229,11 +257,15 @@ class CheckArHoldViolationsJob(BaseJob):
                 existing_tag = date_ops.find_ar_hold_tag_on_order(order_id)
                 old_hold_count = existing_tag[1] if existing_tag else 0
 
+                # Format once, reused for the order, its pickings and moves
+                new_commitment_str = date_ops.format_datetime(new_commitment)
+
                 # Step 1: Set commitment_date = cancel_date + (15 * N)
                 extend_result, new_commitment = date_ops.set_commitment_date(
                     order_id=order_id,
                     order_name=order_name,
                     new_date=new_commitment,
+                    date_str=new_commitment_str,
                 )
                 result.add_operation(extend_result)
 
@@ -258,70 +290,90 @@ class CheckArHoldViolationsJob(BaseJob):
                 order_pickings_updated = 0
                 order_moves_updated = 0
 
-                for picking in open_pickings:
-                    picking_id = picking["id"]
-                    picking_name = picking.get("name", f"picking-{picking_id}")
-
-                    # Sync picking dates
-                    pick_result = date_ops.sync_picking_dates(
-                        picking_id=picking_id,
-                        new_date=new_commitment,
-                        picking_name=picking_name,
-                    )
-                    result.add_operation(pick_result)
+                # Step 4: Sync picking dates, then move dates (pickings are
+                # independent, so they run concurrently)
+                sync_results = date_ops.apply_picking_syncs_parallel(
+                    [
+                        {
+                            "picking_id": picking["id"],
+                            "picking_name": picking.get("name", f"picking-{picking['id']}"),
+                            "new_date": new_commitment,
+                            "date_str": new_commitment_str,
+                            "existing": picking,  # No write if dates already match
+                        }
+                        for picking in open_pickings
+                    ],
+                    executor=sync_pool,
+                )
 
-                    if pick_result.success:
-                        order_pickings_updated += 1
-                        pickings_updated += 1
+                # Chatter for the pickings and the order is buffered and
+                # posted in one RPC when the block exits
+                with date_ops.chatter_batch() as chatter:
+                    for picking, (pick_result, move_results) in zip(open_pickings, sync_results):
+                        picking_id = picking["id"]
+                        picking_name = picking.get("name", f"picking-{picking_id}")
+
+                        result.add_operation(pick_result)
+                        picking_changed = (
+                            pick_result.success
+                            and pick_result.action != "picking_dates_unchanged"
+                        )
 
-                    # Step 4: Sync move dates
-                    picking_moves_updated = 0
-                    move_results = date_ops.sync_move_dates(
-                        picking_id=picking_id,
-                        new_date=new_commitment,
+                        if picking_changed:
+                            order_pickings_updated += 1
+                            pickings_updated += 1
+
+                        # Moves are synced even if the picking was unchanged -
+                        # a previous run may have stopped before the moves
+                        picking_moves_updated = 0
+                        for mr in move_results:
+                            result.add_operation(mr)
+                            if mr.success:
+                                picking_moves_updated += 1
+                                order_moves_updated += 1
+                                moves_updated += 1
+
+                        # Step 4b: Chatter message on picking
+                        if picking_changed:
+                            old_sched = picking.get("scheduled_date")
+                            old_dead = picking.get("date_deadline")
+                            if isinstance(old_sched, str):
+                                old_sched = datetime.strptime(old_sched, "%Y-%m-%d %H:%M:%S")
+                            if isinstance(old_dead, str):
+                                old_dead = datetime.strptime(old_dead, "%Y-%m-%d %H:%M:%S")
+
+                            chatter.add(
+                                "stock.picking",
+                                picking_id,
+                                date_ops.render_date_sync_message(
+                                    old_scheduled=old_sched,
+                                    old_deadline=old_dead,
+                                    new_date=new_commitment,
+                                    reference_field="commitment_date (AR-HOLD extension)",
+                                    reference_value=new_commitment,
+                                    moves_updated=picking_moves_updated,
+                                    job_name="check_ar_hold_violations",
+                                ),
+                                record_name=picking_name,
+                            )
+
+                    # Step 5: Chatter message on order
+                    chatter.add(
+                        "sale.order",
+                        order_id,
+                        date_ops.render_ar_hold_message(
+                            old_commitment=current_commitment,
+                            new_commitment=new_commitment,
+                            old_hold_count=old_hold_count,
+                            new_hold_count=new_hold_count,
+                            pickings_updated=order_pickings_updated,
+                            moves_updated=order_moves_updated,
+                        ),
+                        record_name=order_name,
                     )
-                    for mr in move_results:
-                        result.add_operation(mr)
-                        if mr.success:
-                            picking_moves_updated += 1
-                            order_moves_updated += 1
-                            moves_updated += 1
-
-                    # Step 4b: Post chatter message on picking
-                    if pick_result.success:
-                        old_sched = picking.get("scheduled_date")
-                        old_dead = picking.get("date_deadline")
-                        if isinstance(old_sched, str):
-                            old_sched = datetime.strptime(old_sched, "%Y-%m-%d %H:%M:%S")
-                        if isinstance(old_dead, str):
-                            old_dead = datetime.strptime(old_dead, "%Y-%m-%d %H:%M:%S")
-
-                        picking_msg = date_ops.post_date_sync_message(
-                            model="stock.picking",
-                            record_id=picking_id,
-                            record_name=picking_name,
-                            old_scheduled=old_sched,
-                            old_deadline=old_dead,
-                            new_date=new_commitment,
-                            reference_field="commitment_date (AR-HOLD extension)",
-                            reference_value=new_commitment,
-                            moves_updated=picking_moves_updated,
-                            job_name="check_ar_hold_violations",
-                        )
-                        result.add_operation(picking_msg)
 
-                # Step 5: Post chatter message
-                msg_result = date_ops.post_ar_hold_message(
-                    order_id=order_id,
-                    order_name=order_name,
-                    old_commitment=current_commitment,
-                    new_commitment=new_commitment,
-                    old_hold_count=old_hold_count,
-                    new_hold_count=new_hold_count,
-                    pickings_updated=order_pickings_updated,
-                    moves_updated=order_moves_updated,
-                )
-                result.add_operation(msg_result)
+                for msg_result in chatter.results:
+                    result.add_operation(msg_result)
 
                 # Track success
                 orders_processed += 1
@@ -342,6 +394,9 @@ class CheckArHoldViolationsJob(BaseJob):
                 )
                 result.errors.append(f"Order {order_id}: {e}")
 
+        if sync_pool is not None:
+            sync_pool.shutdown()
+
         # Set KPIs
         result.kpis = self._build_kpis(
             result, orders_processed, pickings_updated, moves_updated, skip_reasons, bq_total
@@ -155,7 +155,19 @@ class CompleteShippingOnlyOrdersJob(BaseJob):
         orders_completed = 0
         lines_completed = 0
 
-        # Step 2 & 3: Process each order
+        # Step 2: Complete the pending shipping lines of every order at once
+        # (one write per distinct quantity, usually a single write)
+        all_lines = [line for order_data in orders for line in order_data["pending_shipping_lines"]]
+        try:
+            line_results = iter(order_ops.complete_shipping_lines_bulk(all_lines))
+        except Exception as e:
+            self.log.error("Failed to complete shipping lines", error=str(e))
+            result.errors.append(f"Completion failed: {e}")
+            result.kpis = self._build_kpis(result, 0, 0)
+            result.complete()
+            return result
+
+        # Step 3: Record results and post chatter per order
         for order_data in orders:
             order_id = order_data["order_id"]
             order_name = order_data["order_name"]
@@ -165,9 +177,9 @@ class CompleteShippingOnlyOrdersJob(BaseJob):
             order_lines_completed = 0
 
             try:
-                # Complete each pending shipping line
+                # Results come back in the same order as the lines
                 for line in pending_lines:
-                    op_result = order_ops.complete_shipping_line(line, order_name=order_name)
+                    op_result = next(line_results)
                     result.add_operation(op_result)
 
                     if op_result.success:
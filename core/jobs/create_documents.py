@@ -12,6 +12,7 @@ import csv
 import io
 import json
 import logging
+from collections import defaultdict
 from pathlib import Path
 from typing import Optional
 
@@ -114,6 +115,9 @@ class CreateDocumentsJob(BaseJob):
         confirm: bool = False,
         use_dev: Optional[bool] = None,
         default_picking_type_id: Optional[int] = None,
+        max_workers: int = 1,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
         **params,
     ) -> JobResult:
         """
@@ -138,6 +142,13 @@ class CreateDocumentsJob(BaseJob):
             default_picking_type_id: Default picking type ID for stock.picking documents
                                      when not specified in the input (required for TSV imports
                                      with stock.picking documents)
+            max_workers: Maximum documents created concurrently. The default
+                         of 1 creates documents one after another, so Odoo
+                         sequence numbers follow the input order; above 1,
+                         creation is faster but names are assigned in
+                         completion order
+            fail_fast: Report only the first validation error per document
+            max_errors: Stop validation after this many errors (at least 1)
 
         Returns:
             JobResult with created document IDs, names, and URLs or validation errors
@@ -238,7 +249,9 @@ class CreateDocumentsJob(BaseJob):
             data={"metadata": metadata},
         )
 
-        all_valid, validation_errors, validation_stats = ops.validate_all(documents)
+        all_valid, validation_errors, validation_stats = ops.validate_all(
+            documents, fail_fast=fail_fast, max_errors=max_errors
+        )
 
         if not all_valid:
             # Validation failed - return errors with row numbers
@@ -311,6 +324,21 @@ class CreateDocumentsJob(BaseJob):
 
         created_documents: list[dict] = []
         creation_errors: list[str] = []
+        to_confirm: dict[str, list[dict]] = defaultdict(list)
+
+        # Create all known document types (concurrently when max_workers > 1);
+        # results come back in input order
+        creatable_types = ("sale.order", "stock.picking", "purchase.order")
+        op_results = iter(
+            ops.create_documents(
+                [
+                    doc for doc in documents
+                    if doc.get("document_type", "sale.order") in creatable_types
+                ],
+                metadata,
+                max_workers=max_workers,
+            )
+        )
 
         for doc in documents:
             doc_type = doc.get("document_type", "sale.order")
@@ -318,18 +346,13 @@ class CreateDocumentsJob(BaseJob):
             lines = doc.get("lines", [])
             row_number = doc.get("row_number")
 
-            if doc_type == "sale.order":
-                op_result = ops.create_sale_order(header, lines, metadata)
-            elif doc_type == "stock.picking":
-                op_result = ops.create_stock_picking(header, lines, metadata)
-            elif doc_type == "purchase.order":
-                op_result = ops.create_purchase_order(header, lines, metadata)
-            else:
+            if doc_type not in creatable_types:
                 creation_errors.append(
                     f"Row {row_number}: Unknown document_type: {doc_type}"
                 )
                 continue
 
+            op_result = next(op_results)
             result.add_operation(op_result)
 
             if op_result.success:
@@ -353,17 +376,9 @@ class CreateDocumentsJob(BaseJob):
                     "environment": "development" if use_dev else "production",
                 }
 
-                # Confirm document if requested
+                # Queue for confirmation (one call per document type)
                 if confirm:
-                    confirm_result = ops.confirm_document(
-                        doc_type, op_result.record_id
-                    )
-                    if confirm_result.success:
-                        doc_record["state"] = "confirmed"
-                        doc_record["confirmed"] = True
-                    else:
-                        doc_record["confirmed"] = False
-                        doc_record["confirm_error"] = confirm_result.error
+                    to_confirm[doc_type].append(doc_record)
 
                 created_documents.append(doc_record)
             else:
@@ -371,6 +386,19 @@ class CreateDocumentsJob(BaseJob):
                     f"Row {row_number}: {op_result.error}"
                 )
 
+        # Confirm documents if requested
+        for doc_type, doc_records in to_confirm.items():
+            confirm_results = ops.confirm_documents(
+                doc_type, [d["record_id"] for d in doc_records]
+            )
+            for doc_record, confirm_result in zip(doc_records, confirm_results):
+                if confirm_result.success:
+                    doc_record["state"] = "confirmed"
+                    doc_record["confirmed"] = True
+                else:
+                    doc_record["confirmed"] = False
+                    doc_record["confirm_error"] = confirm_result.error
+
         # Update result
         result.result_data = {
             "status": "success" if not creation_errors else "partial",
@@ -330,6 +330,10 @@ class SyncSOPickingDatesJob(BaseJob):
 
         self.log.info(f"Processing {len(pickings_to_process)} pickings")
 
+        # Returns are rescheduled to today + 15 (computed once per run)
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        return_scheduled = today + timedelta(days=15)
+
         # Apply limit
         if limit and len(pickings_to_process) > limit:
             pickings_to_process = pickings_to_process[:limit]
@@ -371,8 +375,6 @@ class SyncSOPickingDatesJob(BaseJob):
                         continue
 
                     # Return: date_deadline = ah_cancel_date, scheduled_date = today + 15
-                    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-                    return_scheduled = today + timedelta(days=15)
                     pick_data["reference_field"] = "return_default"
                     self.log.info(
                         f"Return picking {picking_name}: deadline={cancel_date_date}, scheduled={return_scheduled.strftime('%Y-%m-%d')}",
@@ -5,11 +5,14 @@ Provides structured logging that writes to both console and BigQuery.
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Callable, Optional, Union
 
 from core.context import RequestContext
 from core.clients.bigquery import BigQueryClient, get_bigquery_client
 
+# Structured log payload, or a callable building it only when it is audited
+LogData = Union[dict, Callable[[], dict]]
+
 
 class SentinelLogger:
     """
@@ -20,6 +23,13 @@ class SentinelLogger:
         logger.info("Processing started", data={"count": 100})
         logger.success(record_id=123, message="Updated order line")
         logger.error(record_id=456, message="Failed to update", error=str(e))
+
+    Thread safety:
+        One logger may be shared by worker threads. It keeps no mutable
+        state of its own and only reads ctx; console output goes through
+        the logging module, whose handlers lock around each record, and
+        audit rows go through BigQueryClient.log_audit, which serializes
+        inserts.
     """
 
     def __init__(
@@ -49,10 +59,19 @@ class SentinelLogger:
         message: str,
         event_type: str = "log",
         record_id: Optional[int] = None,
-        data: Optional[dict] = None,
+        data: Optional[LogData] = None,
         audit: bool = False,
     ) -> None:
-        """Internal log method with optional BQ audit."""
+        """
+        Internal log method with optional BQ audit.
+
+        data may be a zero-argument callable returning the dict; it is only
+        called when the entry is actually written to the audit trail.
+        """
+        audited = audit and self.bq_client
+        if not audited and not self._logger.isEnabledFor(level):
+            return
+
         # Build log message
         prefix = f"[{self.ctx.request_id[:8]}]"
         if record_id:
@@ -64,10 +83,12 @@ class SentinelLogger:
         self._logger.log(level, full_message)
 
         # Write to BigQuery if auditing
-        if audit and self.bq_client:
+        if audited:
             audit_data = {"message": message}
             if record_id:
                 audit_data["record_id"] = record_id
+            if callable(data):
+                data = data()
             if data:
                 audit_data.update(data)
             self.bq_client.log_audit(self.ctx, event_type, audit_data)
@@ -96,6 +117,8 @@ class SentinelLogger:
         if error:
             message = f"{message}: {error}"
         data = kwargs.get("data", {})
+        if callable(data):
+            data = data()
         if error:
             data["error"] = error
         self._log(
@@ -5,6 +5,8 @@ Foundation for all Odoo operations with dry-run support and logging.
 """
 
 import logging
+from datetime import datetime
+from functools import cached_property
 from typing import Optional
 
 from core.clients.odoo import OdooClient
@@ -56,6 +58,24 @@ class BaseOperation:
         """Check if this is a dry-run (no mutations)."""
         return self.ctx.dry_run
 
+    @cached_property
+    def request_id(self) -> str:
+        """Request ID for chatter footers ("N/A" without a context)."""
+        return self.ctx.request_id if self.ctx else "N/A"
+
+    @staticmethod
+    def format_datetime(dt: datetime) -> str:
+        """
+        Format a datetime as an Odoo datetime string (YYYY-MM-DD HH:MM:SS).
+
+        Same output as strftime("%Y-%m-%d %H:%M:%S") via the faster
+        isoformat path; tzinfo is dropped (wall-clock time kept) as
+        strftime would.
+        """
+        if dt.tzinfo is not None:
+            dt = dt.replace(tzinfo=None)
+        return dt.isoformat(sep=" ", timespec="seconds")
+
     # Context to fully disable Odoo mail/tracking on writes
     NOTRACK_CONTEXT = {
         "tracking_disable": True,       # Disable field change tracking
@@ -192,6 +212,83 @@ class BaseOperation:
                 record_name=record_name,
             )
 
+    def _safe_message_post_batch(
+        self,
+        messages: list[dict],
+        message_type: str = "comment",
+    ) -> list[OperationResult]:
+        """
+        Safely post messages on many records in one RPC, with dry-run support.
+
+        Args:
+            messages: Dicts with model, record_id, body and optional record_name
+            message_type: Message type
+
+        Returns:
+            One OperationResult per message
+        """
+        if not messages:
+            return []
+
+        if self.dry_run:
+            results = []
+            for msg in messages:
+                self.log.skip(
+                    msg["record_id"],
+                    f"Would post message on {msg['model']}:{msg['record_id']}",
+                )
+                results.append(OperationResult.skipped(
+                    record_id=msg["record_id"],
+                    model=msg["model"],
+                    reason="Dry run: would post message",
+                    record_name=msg.get("record_name"),
+                ))
+            return results
+
+        try:
+            self.odoo.message_post_batch(messages, message_type)
+        except Exception as e:
+            results = []
+            for msg in messages:
+                self.log.error(
+                    f"Failed to post message on {msg['model']}:{msg['record_id']}",
+                    record_id=msg["record_id"],
+                    error=str(e),
+                )
+                results.append(OperationResult.fail(
+                    record_id=msg["record_id"],
+                    model=msg["model"],
+                    action="message_post",
+                    error=str(e),
+                    record_name=msg.get("record_name"),
+                ))
+            return results
+
+        results = []
+        for msg in messages:
+            self.log.success(msg["record_id"], f"Posted message on {msg['model']}")
+            results.append(OperationResult.ok(
+                record_id=msg["record_id"],
+                model=msg["model"],
+                action="message_post",
+                message="Posted message",
+                record_name=msg.get("record_name"),
+            ))
+        return results
+
+    def chatter_batch(self, message_type: str = "comment") -> "ChatterBatcher":
+        """
+        Buffer chatter messages and post them together on exit.
+
+        Usage:
+            with ops.chatter_batch() as chatter:
+                chatter.add("stock.picking", picking_id, body, picking_name)
+                chatter.add("sale.order", order_id, body, order_name)
+            for r in chatter.results:
+                result.add_operation(r)
+        """
+        return ChatterBatcher(self, message_type)
+
     def _safe_add_tag(
         self,
         model: str,
@@ -321,3 +418,59 @@ class BaseOperation:
                 error=str(e),
                 record_name=record_name,
             )
+
+
+class ChatterBatcher:
+    """
+    Collects chatter fragments and posts one message per record.
+
+    Fragments added for the same (model, record_id) are joined into a
+    single message; all messages are then created with one RPC via
+    BaseOperation._safe_message_post_batch. Results are available in
+    `results` after flush (or leaving the with-block).
+    """
+
+    def __init__(self, operation: BaseOperation, message_type: str = "comment"):
+        self._operation = operation
+        self._message_type = message_type
+        self._fragments: dict[tuple[str, int], list[str]] = {}
+        self._record_names: dict[tuple[str, int], Optional[str]] = {}
+        self.results: list[OperationResult] = []
+
+    def __enter__(self) -> "ChatterBatcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        # Flush even on error: the writes already made should be documented
+        self.flush()
+
+    def add(
+        self,
+        model: str,
+        record_id: int,
+        body: str,
+        record_name: Optional[str] = None,
+    ) -> None:
+        """Buffer a message fragment for a record."""
+        key = (model, record_id)
+        self._fragments.setdefault(key, []).append(body)
+        if record_name:
+            self._record_names[key] = record_name
+
+    def flush(self) -> list[OperationResult]:
+        """Post buffered messages (one per record) and return their results."""
+        messages = [
+            {
+                "model": model,
+                "record_id": record_id,
+                "body": "\n".join(fragments),
+                "record_name": self._record_names.get((model, record_id)),
+            }
+            for (model, record_id), fragments in self._fragments.items()
+        ]
+        self._fragments.clear()
+        self._record_names.clear()
+
+        results = self._operation._safe_message_post_batch(messages, self._message_type)
+        self.results.extend(results)
+        return results
@@ -4,13 +4,41 @@ Date Compliance Operations
 Operations for date synchronization and AR-HOLD tag management.
 """
 
-import re
+import string
+from concurrent.futures import Executor
 from datetime import datetime, timedelta
 from typing import Optional
 
+from core.clients.odoo import OdooClient
+from core.context import RequestContext
+from core.logging.sentinel_logger import SentinelLogger
 from core.operations.base import BaseOperation
 from core.result import OperationResult
 
+# Chatter bodies, filled in with string.Template.substitute
+AR_HOLD_MESSAGE_TEMPLATE = string.Template(
+    """<p><strong>Date Compliance: AR-HOLD Violation</strong></p>
+<p>Partner is blocked - commitment date extended.</p>
+<ul>
+    <li><strong>Commitment Date:</strong> $old_commitment → $new_commitment</li>
+    <li><strong>AR-HOLD Tag:</strong> $old_tag → $new_tag</li>
+    <li><strong>Pickings Updated:</strong> $pickings_updated</li>
+    <li><strong>Moves Updated:</strong> $moves_updated</li>
+</ul>
+<p><em>Updated by Sentinel-Ops: check_ar_hold_violations</em></p>"""
+)
+
+DATE_SYNC_MESSAGE_TEMPLATE = string.Template(
+    """<p><strong>Date Compliance: Dates Synchronized</strong></p>
+<p>Dates updated to match $reference_field ($reference_value).</p>
+<ul>
+    <li><strong>Scheduled Date:</strong> $old_scheduled → $new_date</li>
+    <li><strong>Date Deadline:</strong> $old_deadline → $new_deadline</li>
+    <li><strong>Moves Updated:</strong> $moves_updated</li>
+</ul>
+<p><em>Updated by Sentinel-Ops: $job_name</em></p>"""
+)
+
 
 class DateComplianceOperations(BaseOperation):
     """
@@ -37,7 +65,19 @@ class DateComplianceOperations(BaseOperation):
     DEFAULT_HOLD_EXTENSION_DAYS = 15
 
     # Open picking states (not done or cancelled)
-    OPEN_PICKING_STATES = ["draft", "waiting", "confirmed", "assigned"]
+    OPEN_PICKING_STATES = frozenset({"draft", "waiting", "confirmed", "assigned"})
+
+    def __init__(
+        self,
+        odoo: OdooClient,
+        ctx: RequestContext,
+        log: Optional[SentinelLogger] = None,
+    ):
+        super().__init__(odoo, ctx, log)
+        # AR-HOLD tag per order for this run: order_id -> (tag_id, N, name) or None
+        self._tag_cache: dict[int, Optional[tuple[int, int, str]]] = {}
+        # Partner category_id -> whether its name contains "block"
+        self._block_category_cache: dict[int, bool] = {}
 
     def find_ar_hold_tag_on_order(
         self,
@@ -46,12 +86,27 @@ class DateComplianceOperations(BaseOperation):
         """
         Find existing AR-HOLD:N tag on an order.
 
+        Memoized per operations instance; set_ar_hold_tag invalidates
+        the entry when it changes the tag.
+
         Args:
             order_id: Sale order ID
 
         Returns:
             Tuple of (tag_id, current_N, tag_name) if found, None otherwise
         """
+        if order_id in self._tag_cache:
+            return self._tag_cache[order_id]
+
+        found = self._find_ar_hold_tag_uncached(order_id)
+        self._tag_cache[order_id] = found
+        return found
+
+    def _find_ar_hold_tag_uncached(
+        self,
+        order_id: int,
+    ) -> Optional[tuple[int, int, str]]:
+        """Fetch and parse the AR-HOLD:N tag on an order (one RPC round)."""
         tags = self.odoo.find_tags_by_prefix(
             tag_model=self.AR_HOLD_TAG_MODEL,
             prefix=self.AR_HOLD_TAG_PREFIX,
@@ -59,19 +114,106 @@ class DateComplianceOperations(BaseOperation):
             record_id=order_id,
             tag_field=self.AR_HOLD_TAG_FIELD,
         )
+        return self._parse_ar_hold_tag(tags)
 
-        if not tags:
-            return None
-
+    def _parse_ar_hold_tag(
+        self,
+        tags: list[dict],
+    ) -> Optional[tuple[int, int, str]]:
+        """Return (tag_id, N, name) for the first AR-HOLD:N tag in tags."""
         # Parse the number from the tag name (e.g., "AR-HOLD:2" -> 2)
+        prefix_len = len(self.AR_HOLD_TAG_PREFIX)
         for tag in tags:
             name = tag.get("name", "")
-            match = re.match(rf"{re.escape(self.AR_HOLD_TAG_PREFIX)}(\d+)$", name)
-            if match:
-                return (tag["id"], int(match.group(1)), name)
+            if name.startswith(self.AR_HOLD_TAG_PREFIX):
+                suffix = name[prefix_len:]
+                if suffix.isdecimal():
+                    return (tag["id"], int(suffix), name)
 
         return None
 
+    def _resolve_ar_hold_tags(
+        self,
+        tag_ids_by_order: dict[int, list[int]],
+    ) -> dict[int, Optional[tuple[int, int, str]]]:
+        """
+        Read AR-HOLD tags among the given tag IDs (one RPC) and cache per order.
+
+        The cache is what find_ar_hold_tag_on_order / set_ar_hold_tag use,
+        so later per-order lookups need no RPC.
+        """
+        all_tag_ids = {tid for tids in tag_ids_by_order.values() for tid in tids}
+        tags_by_id: dict[int, dict] = {}
+        if all_tag_ids:
+            tags = self.odoo.search_read(
+                self.AR_HOLD_TAG_MODEL,
+                [
+                    ("id", "in", list(all_tag_ids)),
+                    ("name", "=like", f"{self.AR_HOLD_TAG_PREFIX}%"),
+                ],
+                fields=["id", "name"],
+            )
+            tags_by_id = {t["id"]: t for t in tags}
+
+        found: dict[int, Optional[tuple[int, int, str]]] = {}
+        for order_id, tag_ids in tag_ids_by_order.items():
+            found[order_id] = self._parse_ar_hold_tag(
+                [tags_by_id[tid] for tid in tag_ids if tid in tags_by_id]
+            )
+
+        self._tag_cache.update(found)
+        return found
+
+    def load_order_context(
+        self,
+        order_ids: list[int],
+    ) -> dict[int, dict]:
+        """
+        Load everything the AR-HOLD check needs for many orders in 3 RPCs.
+
+        One search_read on sale.order, one read of the AR-HOLD tags across
+        all orders, and one read of category_id for all unique partners
+        (instead of ~4 RPCs per order).
+
+        Args:
+            order_ids: Sale order IDs
+
+        Returns:
+            Dict of order_id -> order dict with id, name, partner_id (bare ID
+            or False), commitment_date, ah_cancel_date, plus
+            partner_category_ids (the partner's category_id list). AR-HOLD
+            tags are cached for find_ar_hold_tag_on_order. Orders that do
+            not exist are absent.
+        """
+        if not order_ids:
+            return {}
+
+        orders = self.odoo.search_read(
+            self.SO_MODEL,
+            [("id", "in", list(order_ids))],
+            fields=[
+                "id", "name", "partner_id", "commitment_date",
+                "ah_cancel_date", self.AR_HOLD_TAG_FIELD,
+            ],
+            load="_classic_write",  # partner_id as bare ID, no name_get
+        )
+
+        self._resolve_ar_hold_tags(
+            {o["id"]: o.get(self.AR_HOLD_TAG_FIELD) or [] for o in orders}
+        )
+
+        partner_ids = list({o["partner_id"] for o in orders if o.get("partner_id")})
+        categories_by_partner: dict[int, list[int]] = {}
+        if partner_ids:
+            partners = self.odoo.read(self.PARTNER_MODEL, partner_ids, ["category_id"])
+            categories_by_partner = {p["id"]: p.get("category_id") or [] for p in partners}
+
+        context: dict[int, dict] = {}
+        for order in orders:
+            order["partner_category_ids"] = categories_by_partner.get(order.get("partner_id"), [])
+            context[order["id"]] = order
+        return context
+
     def set_ar_hold_tag(
         self,
         order_id: int,
@@ -114,6 +256,8 @@ class DateComplianceOperations(BaseOperation):
                 tag_field=self.AR_HOLD_TAG_FIELD,
                 record_name=order_name,
             )
+            # Tag set is changing (or may have partially changed)
+            self._tag_cache.pop(order_id, None)
             if not remove_result.success:
                 return (remove_result, current_n)
 
@@ -127,6 +271,7 @@ class DateComplianceOperations(BaseOperation):
             tag_field=self.AR_HOLD_TAG_FIELD,
             record_name=order_name,
         )
+        self._tag_cache.pop(order_id, None)
 
         return (add_result, target_n)
 
@@ -134,6 +279,7 @@ class DateComplianceOperations(BaseOperation):
         self,
         cancel_date: datetime,
         interval_days: int = DEFAULT_HOLD_EXTENSION_DAYS,
+        now: Optional[datetime] = None,
     ) -> tuple[datetime, int]:
         """
         Calculate the next commitment_date as cancel_date + (interval * N),
@@ -142,16 +288,19 @@ class DateComplianceOperations(BaseOperation):
         Args:
             cancel_date: The order's ah_cancel_date
             interval_days: Extension interval in days (default: 15)
+            now: Reference "now" (default: current time); pass the job's
+                start time so every order in a run uses the same instant
 
         Returns:
             Tuple of (new_commitment_date, N)
         """
-        import math
-        now = datetime.now()
-        days_past = (now - cancel_date).total_seconds() / 86400
-        n = max(1, math.ceil(days_past / interval_days))
+        now = now or datetime.now()
+        # Whole days elapsed (floored); ceiling-divide by the interval
+        days_past = max((now - cancel_date).days, 0)
+        n = max(1, -(-days_past // interval_days))
         new_date = cancel_date + timedelta(days=interval_days * n)
-        # Edge case: if exactly on the boundary, push to next interval
+        # Partial day past the floored count, or exactly on the boundary:
+        # push to next interval
         if new_date <= now:
             n += 1
             new_date = cancel_date + timedelta(days=interval_days * n)
@@ -162,6 +311,7 @@ class DateComplianceOperations(BaseOperation):
         order_id: int,
         order_name: str,
         new_date: datetime,
+        date_str: Optional[str] = None,
     ) -> tuple[OperationResult, Optional[datetime]]:
         """
         Set sale.order.commitment_date to a specific date.
@@ -170,6 +320,7 @@ class DateComplianceOperations(BaseOperation):
             order_id: Sale order ID
             order_name: Sale order name for logging
             new_date: New commitment date to set
+            date_str: Pre-formatted new_date (formatted here if omitted)
 
         Returns:
             Tuple of (OperationResult, new_commitment_date)
@@ -177,7 +328,7 @@ class DateComplianceOperations(BaseOperation):
         result = self._safe_write(
             model=self.SO_MODEL,
             ids=[order_id],
-            values={"commitment_date": new_date.strftime("%Y-%m-%d %H:%M:%S")},
+            values={"commitment_date": date_str or self.format_datetime(new_date)},
             action="extend_commitment_date",
             record_name=order_name,
         )
@@ -191,6 +342,9 @@ class DateComplianceOperations(BaseOperation):
         picking_id: int,
         new_date: datetime,
         picking_name: str,
+        date_str: Optional[str] = None,
+        existing: Optional[dict] = None,
+        skip_if_equal: bool = True,
     ) -> OperationResult:
         """
         Sync picking scheduled_date and date_deadline to a new date.
@@ -199,11 +353,32 @@ class DateComplianceOperations(BaseOperation):
             picking_id: Stock picking ID
             new_date: New date to set
             picking_name: Picking name for logging
+            date_str: Pre-formatted new_date (formatted here if omitted)
+            existing: Picking dict already read (e.g. from
+                get_open_pickings_for_order) with current scheduled_date
+                and date_deadline
+            skip_if_equal: If True and both dates in existing already match,
+                return an "unchanged" result without writing
 
         Returns:
             OperationResult
         """
-        date_str = new_date.strftime("%Y-%m-%d %H:%M:%S")
+        date_str = date_str or self.format_datetime(new_date)
+
+        if (
+            skip_if_equal
+            and existing
+            and existing.get("scheduled_date") == date_str
+            and existing.get("date_deadline") == date_str
+        ):
+            # Already correct
+            return OperationResult.ok(
+                record_id=picking_id,
+                model=self.PICKING_MODEL,
+                action="picking_dates_unchanged",
+                message=f"Picking dates already {date_str}",
+                record_name=picking_name,
+            )
 
         return self._safe_write(
             model=self.PICKING_MODEL,
@@ -242,8 +417,8 @@ class DateComplianceOperations(BaseOperation):
             model=self.PICKING_MODEL,
             ids=[picking_id],
             values={
-                "scheduled_date": scheduled_date.strftime("%Y-%m-%d %H:%M:%S"),
-                "date_deadline": deadline_date.strftime("%Y-%m-%d %H:%M:%S"),
+                "scheduled_date": self.format_datetime(scheduled_date),
+                "date_deadline": self.format_datetime(deadline_date),
             },
             action="sync_picking_dates_return",
             record_name=picking_name,
@@ -253,6 +428,7 @@ class DateComplianceOperations(BaseOperation):
         self,
         picking_id: int,
         new_date: datetime,
+        date_str: Optional[str] = None,
     ) -> list[OperationResult]:
         """
         Sync stock.move.date for all moves in a picking.
@@ -260,18 +436,19 @@ class DateComplianceOperations(BaseOperation):
         Args:
             picking_id: Stock picking ID
             new_date: New date to set
+            date_str: Pre-formatted new_date (formatted here if omitted)
 
         Returns:
             List of OperationResults
         """
         results = []
-        date_str = new_date.strftime("%Y-%m-%d %H:%M:%S")
+        date_str = date_str or self.format_datetime(new_date)
 
-        # Find all moves in this picking
+        # Find all moves in this picking (writes are silent, so ids suffice)
         moves = self.odoo.search_read(
             self.MOVE_MODEL,
             [("picking_id", "=", picking_id)],
-            fields=["id", "name"],
+            fields=["id"],
         )
 
         for move in moves:
@@ -280,13 +457,57 @@ class DateComplianceOperations(BaseOperation):
                 ids=[move["id"]],
                 values={"date": date_str},
                 action="sync_move_date",
-                record_name=move.get("name"),
                 silent=True,  # Don't log each move individually
             )
             results.append(result)
 
         return results
 
+    def apply_picking_syncs_parallel(
+        self,
+        items: list[dict],
+        executor: Optional[Executor] = None,
+    ) -> list[tuple[OperationResult, list[OperationResult]]]:
+        """
+        Sync picking and move dates for independent pickings concurrently.
+
+        Each picking's sync is a chain of network-bound RPCs with no
+        dependency on other pickings, so they run on the caller's executor,
+        shared across calls so a job run keeps one pool of workers (and of
+        connections). Without an executor, or for a single picking, the
+        syncs run in the calling thread. Requires an Odoo client that is safe to share across threads
+        (OdooClient lends each RPC its own pooled XML-RPC proxy). Workers
+        log through the shared SentinelLogger, which is thread-safe, and
+        only return their results; the caller records them on the job.
+
+        Args:
+            items: Dicts with picking_id, picking_name, new_date and optional
+                date_str / existing (see sync_picking_dates)
+            executor: Pool the pickings are submitted to (None = sequential)
+
+        Returns:
+            List of (picking_result, move_results), in the order of items
+        """
+        def sync_one(item: dict) -> tuple[OperationResult, list[OperationResult]]:
+            pick_result = self.sync_picking_dates(
+                picking_id=item["picking_id"],
+                new_date=item["new_date"],
+                picking_name=item["picking_name"],
+                date_str=item.get("date_str"),
+                existing=item.get("existing"),
+            )
+            move_results = self.sync_move_dates(
+                picking_id=item["picking_id"],
+                new_date=item["new_date"],
+                date_str=item.get("date_str"),
+            )
+            return pick_result, move_results
+
+        if executor is None or len(items) <= 1:
+            return [sync_one(item) for item in items]
+
+        return list(executor.map(sync_one, items))
+
     def get_open_pickings_for_order(
         self,
         order_id: int,
@@ -304,7 +525,7 @@ class DateComplianceOperations(BaseOperation):
             self.PICKING_MODEL,
             [
                 ("sale_id", "=", order_id),
-                ("state", "in", self.OPEN_PICKING_STATES),
+                ("state", "in", sorted(self.OPEN_PICKING_STATES)),
             ],
             fields=["id", "name", "scheduled_date", "date_deadline", "origin"],
         )
@@ -312,42 +533,78 @@ class DateComplianceOperations(BaseOperation):
     def check_partner_has_block_tag(
         self,
         partner_id: int,
+        *,
+        category_ids: Optional[list[int]] = None,
     ) -> bool:
         """
         Check if partner has a tag containing "block" (case-insensitive).
 
         Args:
             partner_id: Partner ID
+            category_ids: Partner's category_id values if already loaded
+                upstream (skips the partner read)
 
         Returns:
             True if partner has a blocking tag
         """
-        # Read partner's category IDs
-        partners = self.odoo.read(
-            self.PARTNER_MODEL,
-            [partner_id],
-            ["category_id"],
-        )
-        if not partners:
-            return False
+        if category_ids is None:
+            # Read partner's category IDs
+            partners = self.odoo.read(
+                self.PARTNER_MODEL,
+                [partner_id],
+                ["category_id"],
+            )
+            if not partners:
+                return False
+            category_ids = partners[0].get("category_id", [])
 
-        category_ids = partners[0].get("category_id", [])
         if not category_ids:
             return False
 
-        # Read categories and check for "block" in name
-        categories = self.odoo.read(
-            self.PARTNER_CATEGORY_MODEL,
-            category_ids,
-            ["name"],
-        )
+        # Read categories not seen yet in this run and check for "block" in name
+        unknown_ids = [cid for cid in category_ids if cid not in self._block_category_cache]
+        if unknown_ids:
+            categories = self.odoo.read(
+                self.PARTNER_CATEGORY_MODEL,
+                unknown_ids,
+                ["name"],
+            )
+            for cat in categories:
+                self._block_category_cache[cat["id"]] = "block" in cat.get("name", "").lower()
+
+        return any(self._block_category_cache.get(cid, False) for cid in category_ids)
 
-        for cat in categories:
-            name = cat.get("name", "").lower()
-            if "block" in name:
-                return True
+    def render_ar_hold_message(
+        self,
+        old_commitment: datetime,
+        new_commitment: datetime,
+        old_hold_count: int,
+        new_hold_count: int,
+        pickings_updated: int,
+        moves_updated: int,
+    ) -> str:
+        """
+        Render the AR-HOLD violation chatter body.
+
+        Args:
+            old_commitment: Original commitment date
+            new_commitment: New commitment date
+            old_hold_count: Previous AR-HOLD count (0 if first)
+            new_hold_count: New AR-HOLD count
+            pickings_updated: Number of pickings updated
+            moves_updated: Number of moves updated
 
-        return False
+        Returns:
+            HTML message body
+        """
+        return AR_HOLD_MESSAGE_TEMPLATE.substitute(
+            old_commitment=old_commitment.strftime('%Y-%m-%d'),
+            new_commitment=new_commitment.strftime('%Y-%m-%d'),
+            old_tag=f"AR-HOLD:{old_hold_count}" if old_hold_count > 0 else "None",
+            new_tag=f"AR-HOLD:{new_hold_count}",
+            pickings_updated=pickings_updated,
+            moves_updated=moves_updated,
+        )
 
     def post_ar_hold_message(
         self,
@@ -376,29 +633,63 @@ class DateComplianceOperations(BaseOperation):
         Returns:
             OperationResult
         """
-        old_tag = f"AR-HOLD:{old_hold_count}" if old_hold_count > 0 else "None"
-        new_tag = f"AR-HOLD:{new_hold_count}"
-
-        body = f"""
-<p><strong>Date Compliance: AR-HOLD Violation</strong></p>
-<p>Partner is blocked - commitment date extended.</p>
-<ul>
-    <li><strong>Commitment Date:</strong> {old_commitment.strftime('%Y-%m-%d')} → {new_commitment.strftime('%Y-%m-%d')}</li>
-    <li><strong>AR-HOLD Tag:</strong> {old_tag} → {new_tag}</li>
-    <li><strong>Pickings Updated:</strong> {pickings_updated}</li>
-    <li><strong>Moves Updated:</strong> {moves_updated}</li>
-</ul>
-<p><em>Updated by Sentinel-Ops: check_ar_hold_violations</em></p>
-"""
+        body = self.render_ar_hold_message(
+            old_commitment=old_commitment,
+            new_commitment=new_commitment,
+            old_hold_count=old_hold_count,
+            new_hold_count=new_hold_count,
+            pickings_updated=pickings_updated,
+            moves_updated=moves_updated,
+        )
 
         return self._safe_message_post(
             model=self.SO_MODEL,
             record_id=order_id,
-            body=body.strip(),
+            body=body,
             message_type="comment",
             record_name=order_name,
         )
 
+    def render_date_sync_message(
+        self,
+        old_scheduled: Optional[datetime],
+        old_deadline: Optional[datetime],
+        new_date: datetime,
+        reference_field: str,
+        reference_value: datetime,
+        moves_updated: int = 0,
+        job_name: str = "sync_picking_dates",
+        new_deadline: Optional[datetime] = None,
+    ) -> str:
+        """
+        Render the date synchronization chatter body.
+
+        Args:
+            old_scheduled: Original scheduled_date (None if unknown)
+            old_deadline: Original date_deadline (None if unknown)
+            new_date: New scheduled_date set
+            reference_field: Name of reference field (e.g., "commitment_date")
+            reference_value: Value of reference field
+            moves_updated: Number of moves updated
+            job_name: Name of the job for attribution
+            new_deadline: New date_deadline if different from new_date (for split sync)
+
+        Returns:
+            HTML message body
+        """
+        new_date_str = new_date.strftime('%Y-%m-%d')
+
+        return DATE_SYNC_MESSAGE_TEMPLATE.substitute(
+            reference_field=reference_field,
+            reference_value=reference_value.strftime('%Y-%m-%d'),
+            old_scheduled=old_scheduled.strftime('%Y-%m-%d') if old_scheduled else "N/A",
+            new_date=new_date_str,
+            old_deadline=old_deadline.strftime('%Y-%m-%d') if old_deadline else "N/A",
+            new_deadline=new_deadline.strftime('%Y-%m-%d') if new_deadline else new_date_str,
+            moves_updated=moves_updated,
+            job_name=job_name,
+        )
+
     def post_date_sync_message(
         self,
         model: str,
@@ -432,27 +723,21 @@ class DateComplianceOperations(BaseOperation):
         Returns:
             OperationResult
         """
-        old_scheduled_str = old_scheduled.strftime('%Y-%m-%d') if old_scheduled else "N/A"
-        old_deadline_str = old_deadline.strftime('%Y-%m-%d') if old_deadline else "N/A"
-        new_date_str = new_date.strftime('%Y-%m-%d')
-        new_deadline_str = (new_deadline or new_date).strftime('%Y-%m-%d')
-        ref_date_str = reference_value.strftime('%Y-%m-%d')
-
-        body = f"""
-<p><strong>Date Compliance: Dates Synchronized</strong></p>
-<p>Dates updated to match {reference_field} ({ref_date_str}).</p>
-<ul>
-    <li><strong>Scheduled Date:</strong> {old_scheduled_str} → {new_date_str}</li>
-    <li><strong>Date Deadline:</strong> {old_deadline_str} → {new_deadline_str}</li>
-    <li><strong>Moves Updated:</strong> {moves_updated}</li>
-</ul>
-<p><em>Updated by Sentinel-Ops: {job_name}</em></p>
-"""
+        body = self.render_date_sync_message(
+            old_scheduled=old_scheduled,
+            old_deadline=old_deadline,
+            new_date=new_date,
+            reference_field=reference_field,
+            reference_value=reference_value,
+            moves_updated=moves_updated,
+            job_name=job_name,
+            new_deadline=new_deadline,
+        )
 
         return self._safe_message_post(
             model=model,
             record_id=record_id,
-            body=body.strip(),
+            body=body,
             message_type="comment",
             record_name=record_name,
         )
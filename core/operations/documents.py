@@ -5,16 +5,37 @@ Operations for creating Odoo documents (sale.order, stock.picking) with validati
 """
 
 import logging
+import string
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Any, Callable, Iterator, Optional
 
-from core.operations.base import BaseOperation
+from core.clients.odoo import OdooClient
+from core.context import RequestContext
+from core.logging.sentinel_logger import SentinelLogger
+from core.operations.base import BaseOperation, ChatterBatcher
 from core.result import OperationResult
 
 logger = logging.getLogger(__name__)
 
+# Creation chatter message body, filled in with string.Template.substitute
+CREATION_MESSAGE_TEMPLATE = string.Template(
+    """<div style="font-family: Arial, sans-serif; line-height: 1.6;">
+    <p><strong>Sentinel-Ops: Document Created</strong></p>
+    <ul style="margin: 10px 0; padding-left: 20px;">
+        <li><strong>Lines:</strong> $line_count</li>
+        $meta_html
+    </ul>
+    <p style="color: #666; font-size: 0.9em;">
+        Request ID: $request_id
+    </p>
+</div>"""
+)
 
-@dataclass
+
+@dataclass(slots=True)
 class ValidationError:
     """A single validation error with row context."""
 
@@ -32,7 +53,7 @@ class ValidationError:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ResolveResult:
     """Result of resolving a record (partner, product, etc.)."""
 
@@ -97,6 +118,137 @@ class DocumentCreationOperations(BaseOperation):
     MEDIUM_MODEL = "utm.medium"
     SOURCE_MODEL = "utm.source"
 
+    # Header fields that reference other models and must exist
+    _FIXED_FK_FIELDS: tuple[tuple[str, str], ...] = (
+        # Sale order fields
+        ("pricelist_id", PRICELIST_MODEL),
+        ("warehouse_id", WAREHOUSE_MODEL),
+        ("payment_term_id", PAYMENT_TERM_MODEL),
+        ("user_id", USER_MODEL),  # Salesperson
+        ("team_id", TEAM_MODEL),  # Sales team
+        ("company_id", COMPANY_MODEL),
+        ("fiscal_position_id", FISCAL_POSITION_MODEL),
+        ("analytic_account_id", ANALYTIC_ACCOUNT_MODEL),
+        ("incoterm", INCOTERM_MODEL),  # Incoterms
+        ("carrier_id", CARRIER_MODEL),  # Delivery carrier
+        ("currency_id", CURRENCY_MODEL),
+        # Marketing/UTM fields
+        ("campaign_id", CAMPAIGN_MODEL),
+        ("medium_id", MEDIUM_MODEL),
+        ("source_id", SOURCE_MODEL),
+        # Stock picking fields
+        ("picking_type_id", PICKING_TYPE_MODEL),
+        ("location_id", LOCATION_MODEL),
+        ("location_dest_id", LOCATION_MODEL),
+        ("owner_id", PARTNER_MODEL),  # Owner for consignment
+    )
+
+    # Optional header fields copied as-is into the created record when set
+    _SO_PASSTHROUGH_FIELDS = (
+        # Core
+        "pricelist_id", "warehouse_id", "payment_term_id",
+        # References
+        "client_order_ref", "reference", "note",
+        # Dates
+        "commitment_date", "date_order", "validity_date", "expected_date",
+        # Team/User
+        "user_id", "team_id",
+        # Company/Accounting
+        "company_id", "fiscal_position_id", "analytic_account_id", "currency_id",
+        # Shipping (partner_shipping_id is handled separately)
+        "incoterm", "incoterm_location", "carrier_id", "partner_invoice_id",
+        # ALOHAS-specific
+        "ah_status", "ah_prepayment_status",
+        # Marketing attribution
+        "campaign_id", "medium_id", "source_id",
+    )
+    _PICKING_PASSTHROUGH_FIELDS = (
+        # Locations
+        "location_id", "location_dest_id",
+        # Dates (some Odoo versions use planned_date vs scheduled_date)
+        "scheduled_date", "date_deadline", "planned_date",
+        # Company/User, ownership/consignment
+        "company_id", "user_id", "owner_id",
+        "priority", "note",
+        # Related documents
+        "sale_id", "purchase_id",
+        # Move type (direct/one/multi-step)
+        "move_type",
+        # Carrier/Tracking
+        "carrier_id", "carrier_tracking_ref",
+        # ALOHAS-specific
+        "ah_picking_status",
+    )
+    _PO_PASSTHROUGH_FIELDS = (
+        # Core
+        "currency_id", "company_id", "payment_term_id",
+        # Dates
+        "date_order", "date_planned",
+        # References
+        "partner_ref",
+        # Picking/Warehouse, user, accounting
+        "picking_type_id", "user_id", "fiscal_position_id",
+        "incoterm_id", "notes",
+    )
+
+    # document_type -> (confirm method, success message prefix)
+    _CONFIRM_METHODS = {
+        # Confirm quotation → sales order
+        SO_MODEL: ("action_confirm", "Confirmed sale.order"),
+        # Reserve stock; button_validate() would fully validate, but that
+        # requires stock availability and lot/serial assignment
+        PICKING_MODEL: ("action_assign", "Reserved stock for picking"),
+        # Confirm RFQ → purchase order
+        PO_MODEL: ("button_confirm", "Confirmed purchase.order"),
+    }
+
+    # Label of a created record whose name was not read (or the read failed)
+    _NAME_FALLBACKS = {
+        PICKING_MODEL: "stock.picking {}",
+        PO_MODEL: "PO #{}",
+    }
+
+    # Metadata keys listed in the creation chatter message, with their labels
+    _CREATION_META_LABELS = (
+        ("source", "Source"),
+        ("owner", "Owner"),
+        ("filename", "File"),
+        ("origin_folder", "Folder"),
+    )
+
+    # Product details needed to build stock moves and purchase lines
+    _LINE_PRODUCT_FIELDS = ["name", "uom_id", "uom_po_id"]
+
+    def __init__(
+        self,
+        odoo: OdooClient,
+        ctx: RequestContext,
+        log: Optional[SentinelLogger] = None,
+    ):
+        super().__init__(odoo, ctx, log)
+        # Resolver results for this run: ("partner"|"product", *args) -> result
+        self._resolve_cache: dict[tuple, ResolveResult] = {}
+        # (model, record_id) -> whether the record exists
+        self._exists_cache: dict[tuple[str, int], bool] = {}
+        # product_id -> _LINE_PRODUCT_FIELDS values
+        self._product_data_cache: dict[int, dict] = {}
+        # picking_type_id -> default source/destination locations
+        self._picking_type_cache: dict[int, dict] = {}
+        # Tag name -> ID, for the whole run
+        self._tag_ids: dict[str, int] = {}
+        self._tag_lock = threading.Lock()
+        # Set while create_documents runs: creation messages are buffered
+        self._creation_chatter: Optional[ChatterBatcher] = None
+        # Set while create_documents runs: (model, id) of records created
+        # without a name, read afterwards by _fill_record_names
+        self._unnamed_records: Optional[set[tuple[str, int]]] = None
+
+    def clear_resolve_cache(self) -> None:
+        """Forget memoized partner/product/record lookups (for long-lived instances)."""
+        self._resolve_cache.clear()
+        self._exists_cache.clear()
+        self._product_data_cache.clear()
+
     # --- Lookup/Resolution Methods ---
 
     def resolve_partner(
@@ -104,28 +256,68 @@ class DocumentCreationOperations(BaseOperation):
         partner_id: Optional[int] = None,
         partner_name: Optional[str] = None,
         partner_ref: Optional[str] = None,
+        cache: Optional[dict] = None,
     ) -> ResolveResult:
         """
         Resolve a partner by ID, name, or ref.
 
+        Memoized per instance, so the creation phase reuses what
+        validation resolved.
+
         Args:
             partner_id: Explicit partner ID
             partner_name: Partner display name to search
             partner_ref: Partner reference (customer code) to search
+            cache: Optional lookup from _prefetch_partners; when given, the
+                partner is resolved from it without any RPC
 
         Returns:
             ResolveResult with partner ID or error
         """
+        key = self._partner_key(partner_id, partner_name, partner_ref)
+        if key not in self._resolve_cache:
+            self._resolve_cache[key] = self._resolve_partner_uncached(
+                partner_id, partner_name, partner_ref, cache
+            )
+        return self._resolve_cache[key]
+
+    @staticmethod
+    def _partner_key(
+        partner_id: Optional[int],
+        partner_name: Optional[str],
+        partner_ref: Optional[str],
+    ) -> tuple:
+        """Memo key of a resolve_partner lookup."""
+        return ("partner", partner_id, partner_name, partner_ref)
+
+    def _resolve_partner_uncached(
+        self,
+        partner_id: Optional[int] = None,
+        partner_name: Optional[str] = None,
+        partner_ref: Optional[str] = None,
+        cache: Optional[dict] = None,
+    ) -> ResolveResult:
+        """Resolve a partner without consulting the memo (see resolve_partner)."""
         if partner_id:
             # Verify the ID exists
-            result = self.odoo.search(self.PARTNER_MODEL, [("id", "=", partner_id)])
+            if cache is not None:
+                result = partner_id in cache["by_id"]
+            else:
+                result = self.odoo.search(
+                    self.PARTNER_MODEL, [("id", "=", partner_id)], limit=1
+                )
             if result:
                 return ResolveResult.ok(partner_id)
             return ResolveResult.fail(f"Partner ID {partner_id} not found")
 
         if partner_ref:
             # Search by reference first (more specific)
-            partners = self.odoo.search(self.PARTNER_MODEL, [("ref", "=", partner_ref)])
+            if cache is not None:
+                partners = cache["by_ref"].get(partner_ref, [])
+            else:
+                partners = self.odoo.search(
+                    self.PARTNER_MODEL, [("ref", "=", partner_ref)]
+                )
             if len(partners) == 1:
                 return ResolveResult.ok(partners[0])
             if len(partners) > 1:
@@ -134,9 +326,12 @@ class DocumentCreationOperations(BaseOperation):
 
         if partner_name:
             # Search by exact name match
-            partners = self.odoo.search(
-                self.PARTNER_MODEL, [("name", "=", partner_name)]
-            )
+            if cache is not None:
+                partners = cache["by_name"].get(partner_name, [])
+            else:
+                partners = self.odoo.search(
+                    self.PARTNER_MODEL, [("name", "=", partner_name)]
+                )
             if len(partners) == 1:
                 return ResolveResult.ok(partners[0])
             if len(partners) > 1:
@@ -145,6 +340,121 @@ class DocumentCreationOperations(BaseOperation):
 
         return ResolveResult.fail("No partner identifier provided")
 
+    def _prefetch_partners(
+        self,
+        documents: list[dict],
+        extra_ids: Optional[set[int]] = None,
+    ) -> dict:
+        """
+        Look up every partner referenced by a batch of documents at once.
+
+        Collects the distinct partner IDs, refs and names across all headers
+        and resolves them with one search_read per identifier kind, instead
+        of one search per document.
+
+        Args:
+            documents: List of document dicts
+            extra_ids: Other partner IDs to check in the same search
+                (e.g. shipping/invoice partners)
+
+        Returns:
+            Dict with "by_id" (set of existing IDs), "by_ref" and "by_name"
+            (value -> list of matching partner IDs), for resolve_partner(cache=...)
+        """
+        ids: set[int] = set(extra_ids or ())
+        refs: set[str] = set()
+        names: set[str] = set()
+        for doc in documents:
+            header = doc.get("header", {})
+            if header.get("partner_id"):
+                ids.add(header["partner_id"])
+            if header.get("partner_ref"):
+                refs.add(header["partner_ref"])
+            if header.get("partner_name"):
+                names.add(header["partner_name"])
+
+        return self._prefetch_lookup(self.PARTNER_MODEL, ids, "ref", refs, names)
+
+    def _prefetch_products(self, documents: list[dict]) -> dict:
+        """
+        Look up every product referenced by the lines of a batch at once.
+
+        Only the identifier resolve_product would use for each line is
+        collected (ID, else default_code, else name).
+
+        Args:
+            documents: List of document dicts
+
+        Returns:
+            Dict with "by_id", "by_ref" and "by_name" lookups, for
+            resolve_product(cache=...)
+        """
+        ids: set[int] = set()
+        refs: set[str] = set()
+        names: set[str] = set()
+        for doc in documents:
+            for line in doc.get("lines", []):
+                product_id, product_ref, product_name = self._line_product_args(line)
+                if product_id:
+                    ids.add(product_id)
+                elif product_ref:
+                    refs.add(product_ref)
+                elif product_name:
+                    names.add(product_name)
+
+        return self._prefetch_lookup(
+            self.PRODUCT_MODEL, ids, "default_code", refs, names
+        )
+
+    def _prefetch_lookup(
+        self,
+        model: str,
+        ids: set[int],
+        ref_field: str,
+        refs: set[str],
+        names: set[str],
+    ) -> dict:
+        """
+        Build an in-memory lookup with one search_read per identifier kind.
+
+        Args:
+            model: Odoo model name
+            ids: Record IDs to check
+            ref_field: Field holding the reference (e.g. "ref", "default_code")
+            refs: Reference values to look up
+            names: Exact names to look up
+
+        Returns:
+            Dict with "by_id" (set of existing IDs), "by_ref" and "by_name"
+            (value -> list of matching IDs, in search order)
+        """
+        cache: dict = {
+            "by_id": set(),
+            "by_ref": defaultdict(list),
+            "by_name": defaultdict(list),
+        }
+        if ids:
+            records = self.odoo.search_read(
+                model, [("id", "in", list(ids))], fields=["id"]
+            )
+            cache["by_id"].update(r["id"] for r in records)
+            # Also answers verify_record_exists for these IDs
+            for record_id in ids:
+                self._exists_cache[(model, record_id)] = record_id in cache["by_id"]
+        if refs:
+            records = self.odoo.search_read(
+                model, [(ref_field, "in", list(refs))], fields=["id", ref_field]
+            )
+            for r in records:
+                cache["by_ref"][r[ref_field]].append(r["id"])
+        if names:
+            records = self.odoo.search_read(
+                model, [("name", "in", list(names))], fields=["id", "name"]
+            )
+            for r in records:
+                cache["by_name"][r["name"]].append(r["id"])
+        return cache
+
     def resolve_delivery_address(
         self,
         address_name: str,
@@ -234,34 +544,81 @@ class DocumentCreationOperations(BaseOperation):
 
         return ResolveResult.fail(f"Delivery address not found: {address_name}")
 
+    @staticmethod
+    def _line_product_args(
+        line: dict,
+    ) -> tuple[Optional[int], Optional[str], Optional[str]]:
+        """
+        Extract a line's product identifiers, in resolve_product order.
+
+        Args:
+            line: Line dict (product_id, product_ref or product_sku, product_name)
+
+        Returns:
+            (product_id, product_ref, product_name)
+        """
+        return (
+            line.get("product_id"),
+            line.get("product_ref") or line.get("product_sku"),  # Accept both
+            line.get("product_name"),
+        )
+
     def resolve_product(
         self,
         product_id: Optional[int] = None,
         product_ref: Optional[str] = None,
         product_name: Optional[str] = None,
+        cache: Optional[dict] = None,
     ) -> ResolveResult:
         """
         Resolve a product by ID, default_code (ref), or name.
 
+        Memoized per instance; lines sharing a SKU resolve once.
+
         Args:
             product_id: Explicit product ID
             product_ref: Product default_code (SKU/internal reference)
             product_name: Product name to search
+            cache: Optional lookup from _prefetch_products; when given, the
+                product is resolved from it without any RPC
 
         Returns:
             ResolveResult with product ID or error
         """
+        key = ("product", product_id, product_ref, product_name)
+        if key not in self._resolve_cache:
+            self._resolve_cache[key] = self._resolve_product_uncached(
+                product_id, product_ref, product_name, cache
+            )
+        return self._resolve_cache[key]
+
+    def _resolve_product_uncached(
+        self,
+        product_id: Optional[int] = None,
+        product_ref: Optional[str] = None,
+        product_name: Optional[str] = None,
+        cache: Optional[dict] = None,
+    ) -> ResolveResult:
+        """Resolve a product without consulting the memo (see resolve_product)."""
         if product_id:
-            result = self.odoo.search(self.PRODUCT_MODEL, [("id", "=", product_id)])
+            if cache is not None:
+                result = product_id in cache["by_id"]
+            else:
+                result = self.odoo.search(
+                    self.PRODUCT_MODEL, [("id", "=", product_id)], limit=1
+                )
             if result:
                 return ResolveResult.ok(product_id)
             return ResolveResult.fail(f"Product ID {product_id} not found")
 
         if product_ref:
             # Search by default_code (exact match)
-            products = self.odoo.search(
-                self.PRODUCT_MODEL, [("default_code", "=", product_ref)]
-            )
+            if cache is not None:
+                products = cache["by_ref"].get(product_ref, [])
+            else:
+                products = self.odoo.search(
+                    self.PRODUCT_MODEL, [("default_code", "=", product_ref)]
+                )
             if len(products) == 1:
                 return ResolveResult.ok(products[0])
             if len(products) > 1:
@@ -269,9 +626,12 @@ class DocumentCreationOperations(BaseOperation):
             return ResolveResult.fail(f"Product not found: {product_ref}")
 
         if product_name:
-            products = self.odoo.search(
-                self.PRODUCT_MODEL, [("name", "=", product_name)]
-            )
+            if cache is not None:
+                products = cache["by_name"].get(product_name, [])
+            else:
+                products = self.odoo.search(
+                    self.PRODUCT_MODEL, [("name", "=", product_name)]
+                )
             if len(products) == 1:
                 return ResolveResult.ok(products[0])
             if len(products) > 1:
@@ -280,12 +640,53 @@ class DocumentCreationOperations(BaseOperation):
 
         return ResolveResult.fail("No product identifier provided")
 
+    def _resolve_line_products(
+        self,
+        lines: list[dict],
+    ) -> tuple[list[ResolveResult], dict[int, dict]]:
+        """
+        Resolve the products of a document's lines and read their details.
+
+        Products not already resolved are looked up with one batch prefetch,
+        and the details of products not read earlier in this run are read
+        in one call.
+
+        Args:
+            lines: List of line dicts (product_id/product_ref/product_name)
+
+        Returns:
+            (one ResolveResult per line, product ID -> product details)
+        """
+        product_args = [self._line_product_args(line) for line in lines]
+        unresolved = [
+            line for line, args in zip(lines, product_args)
+            if ("product", *args) not in self._resolve_cache
+        ]
+        cache = self._prefetch_products([{"lines": unresolved}]) if unresolved else None
+        results = [self.resolve_product(*args, cache=cache) for args in product_args]
+
+        product_ids = {r.record_id for r in results if r.success}
+        missing = sorted(product_ids - self._product_data_cache.keys())
+        if missing:
+            for product in self.odoo.read(
+                self.PRODUCT_MODEL, missing, self._LINE_PRODUCT_FIELDS
+            ):
+                self._product_data_cache[product["id"]] = product
+        products = {
+            pid: self._product_data_cache[pid]
+            for pid in product_ids
+            if pid in self._product_data_cache
+        }
+        return results, products
+
     def verify_record_exists(
         self, model: str, record_id: int, field_name: str
     ) -> ResolveResult:
         """
         Verify a record exists in a model.
 
+        Memoized per (model, record_id) for the lifetime of this instance.
+
         Args:
             model: Odoo model name
             record_id: Record ID to verify
@@ -294,15 +695,133 @@ class DocumentCreationOperations(BaseOperation):
         Returns:
             ResolveResult
         """
-        result = self.odoo.search(model, [("id", "=", record_id)])
-        if result:
+        key = (model, record_id)
+        if key not in self._exists_cache:
+            self._exists_cache[key] = bool(
+                self.odoo.search(model, [("id", "=", record_id)], limit=1)
+            )
+        if self._exists_cache[key]:
             return ResolveResult.ok(record_id)
         return ResolveResult.fail(f"{field_name} ID {record_id} not found in {model}")
 
+    def _fixed_field_refs(self, header: dict) -> list[tuple[str, str, int]]:
+        """
+        List the header's fixed record references that must exist.
+
+        Args:
+            header: Document header
+
+        Returns:
+            List of (field_name, model, record_id) for fields that are set
+        """
+        refs: list[tuple[str, str, int]] = []
+        for field_name, model in self._FIXED_FK_FIELDS:
+            value = header.get(field_name)
+            if value is not None:
+                refs.append((field_name, model, value))
+        return refs
+
+    def _header_record_refs(
+        self,
+        header: dict,
+        fixed_refs: Optional[list[tuple[str, str, int]]] = None,
+    ) -> list[tuple[str, str, int]]:
+        """
+        List every record ID a header references by ID (fixed fields plus
+        shipping/invoice partners).
+
+        Args:
+            header: Document header
+            fixed_refs: Precomputed _fixed_field_refs(header), if available
+
+        Returns:
+            List of (field_name, model, record_id)
+        """
+        if fixed_refs is None:
+            fixed_refs = self._fixed_field_refs(header)
+        refs = list(fixed_refs)
+        for field_name in ("partner_shipping_id", "partner_invoice_id"):
+            value = header.get(field_name)
+            if value is not None:
+                refs.append((field_name, self.PARTNER_MODEL, value))
+        return refs
+
+    def _check_records_exist(self, refs: list[tuple[str, str, int]]) -> None:
+        """
+        Check existence of many records with one search per model.
+
+        Fills the verify_record_exists cache; IDs already known are skipped.
+
+        Args:
+            refs: List of (field_name, model, record_id)
+        """
+        for model, ids in self._unchecked_ids_by_model(refs).items():
+            self._search_existing(model, ids)
+
+    def _unchecked_ids_by_model(
+        self, refs: list[tuple[str, str, int]]
+    ) -> dict[str, set[int]]:
+        """Group the referenced IDs not yet in the existence cache by model."""
+        by_model: dict[str, set[int]] = defaultdict(set)
+        for _, model, record_id in refs:
+            if (model, record_id) not in self._exists_cache:
+                by_model[model].add(record_id)
+        return by_model
+
+    def _search_existing(self, model: str, ids: set[int]) -> None:
+        """Record which of ids exist in model, with one search."""
+        existing = set(self.odoo.search(model, [("id", "in", list(ids))]))
+        for record_id in ids:
+            self._exists_cache[(model, record_id)] = record_id in existing
+
+    def _prefetch_all(
+        self, documents: list[dict], max_workers: int = 8
+    ) -> tuple[dict, dict]:
+        """
+        Run all batch lookups for validation concurrently.
+
+        Partner prefetch, product prefetch and the per-model existence
+        searches are independent network-bound RPCs, so they run on a
+        thread pool and the wait is the slowest lookup rather than the
+        sum. Requires an Odoo client that is safe to share across threads
+        (OdooClient lends each RPC its own pooled XML-RPC proxy). Each
+        lookup fills its own cache entries; any logging goes through the
+        thread-safe SentinelLogger.
+
+        Args:
+            documents: List of document dicts
+            max_workers: Maximum concurrent RPCs
+
+        Returns:
+            Tuple of (partner_cache, product_cache)
+        """
+        by_model = self._unchecked_ids_by_model([
+            ref
+            for doc in documents
+            for ref in self._header_record_refs(doc.get("header", {}))
+        ])
+        # Partner IDs are checked by the partner prefetch's ID search
+        partner_ids = by_model.pop(self.PARTNER_MODEL, set())
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            partners = pool.submit(self._prefetch_partners, documents, partner_ids)
+            products = pool.submit(self._prefetch_products, documents)
+            existence = [
+                pool.submit(self._search_existing, model, ids)
+                for model, ids in by_model.items()
+            ]
+            for future in existence:
+                future.result()
+            return partners.result(), products.result()
+
     # --- Validation Methods (Phase 1) ---
 
     def validate_document(
-        self, doc: dict, row_offset: int = 0
+        self,
+        doc: dict,
+        row_offset: int = 0,
+        partner_cache: Optional[dict] = None,
+        product_cache: Optional[dict] = None,
+        fail_fast: bool = False,
     ) -> list[ValidationError]:
         """
         Validate a single document (header + lines).
@@ -310,6 +829,10 @@ class DocumentCreationOperations(BaseOperation):
         Args:
             doc: Document dict with header and lines
             row_offset: Row number offset for error reporting
+            partner_cache: Optional partner lookup from _prefetch_partners
+            product_cache: Optional product lookup from _prefetch_products
+            fail_fast: Stop at the first error, skipping the remaining
+                checks (and their RPCs) for a document already known bad
 
         Returns:
             List of validation errors (empty if valid)
@@ -326,7 +849,9 @@ class DocumentCreationOperations(BaseOperation):
         partner_ref = header.get("partner_ref")
 
         if partner_id or partner_name or partner_ref:
-            result = self.resolve_partner(partner_id, partner_name, partner_ref)
+            result = self.resolve_partner(
+                partner_id, partner_name, partner_ref, cache=partner_cache
+            )
             if not result.success:
                 errors.append(
                     ValidationError(
@@ -345,46 +870,29 @@ class DocumentCreationOperations(BaseOperation):
                     error="No partner identifier provided",
                 )
             )
+        if fail_fast and errors:
+            return errors
 
         # Validate fixed record references in header
-        # These are all the fields that reference other models and must exist
-        fixed_fields = [
-            # Sale order fields
-            ("pricelist_id", self.PRICELIST_MODEL),
-            ("warehouse_id", self.WAREHOUSE_MODEL),
-            ("payment_term_id", self.PAYMENT_TERM_MODEL),
-            ("user_id", self.USER_MODEL),  # Salesperson
-            ("team_id", self.TEAM_MODEL),  # Sales team
-            ("company_id", self.COMPANY_MODEL),
-            ("fiscal_position_id", self.FISCAL_POSITION_MODEL),
-            ("analytic_account_id", self.ANALYTIC_ACCOUNT_MODEL),
-            ("incoterm", self.INCOTERM_MODEL),  # Incoterms
-            ("carrier_id", self.CARRIER_MODEL),  # Delivery carrier
-            ("currency_id", self.CURRENCY_MODEL),
-            # Marketing/UTM fields
-            ("campaign_id", self.CAMPAIGN_MODEL),
-            ("medium_id", self.MEDIUM_MODEL),
-            ("source_id", self.SOURCE_MODEL),
-            # Stock picking fields
-            ("picking_type_id", self.PICKING_TYPE_MODEL),
-            ("location_id", self.LOCATION_MODEL),
-            ("location_dest_id", self.LOCATION_MODEL),
-            ("owner_id", self.PARTNER_MODEL),  # Owner for consignment
-        ]
+        fixed_refs = self._fixed_field_refs(header)
 
-        for field_name, model in fixed_fields:
-            value = header.get(field_name)
-            if value is not None:
-                result = self.verify_record_exists(model, value, field_name)
-                if not result.success:
-                    errors.append(
-                        ValidationError(
-                            row_number=doc_row,
-                            field=field_name,
-                            value=str(value),
-                            error=result.error or f"{field_name} not found",
-                        )
+        # One existence search per model for every ID this document references
+        # (no-op for IDs already checked, e.g. by validate_all's batch pass)
+        self._check_records_exist(self._header_record_refs(header, fixed_refs))
+
+        for field_name, model, value in fixed_refs:
+            result = self.verify_record_exists(model, value, field_name)
+            if not result.success:
+                errors.append(
+                    ValidationError(
+                        row_number=doc_row,
+                        field=field_name,
+                        value=str(value),
+                        error=result.error,
                     )
+                )
+                if fail_fast:
+                    return errors
 
         # Validate partner_shipping_id and partner_invoice_id if provided
         shipping_partner = header.get("partner_shipping_id")
@@ -413,6 +921,8 @@ class DocumentCreationOperations(BaseOperation):
                         error=result.error or "Delivery address not found",
                     )
                 )
+        if fail_fast and errors:
+            return errors
 
         invoice_partner = header.get("partner_invoice_id")
         if invoice_partner is not None:
@@ -428,16 +938,18 @@ class DocumentCreationOperations(BaseOperation):
                         error=result.error or "Invoice partner not found",
                     )
                 )
+        if fail_fast and errors:
+            return errors
 
         # Validate lines
         for line in lines:
             line_row = line.get("row_number", doc_row)
-            product_id = line.get("product_id")
-            product_ref = line.get("product_ref") or line.get("product_sku")  # Accept both
-            product_name = line.get("product_name")
+            product_id, product_ref, product_name = self._line_product_args(line)
 
             if product_id or product_ref or product_name:
-                result = self.resolve_product(product_id, product_ref, product_name)
+                result = self.resolve_product(
+                    product_id, product_ref, product_name, cache=product_cache
+                )
                 if not result.success:
                     errors.append(
                         ValidationError(
@@ -468,40 +980,102 @@ class DocumentCreationOperations(BaseOperation):
                         error="Quantity must be positive",
                     )
                 )
+            if fail_fast and errors:
+                return errors
 
         return errors
 
-    def validate_all(
-        self, documents: list[dict]
-    ) -> tuple[bool, list[ValidationError], dict]:
+    def iter_validate(
+        self,
+        documents: list[dict],
+        stats: Optional[dict] = None,
+        max_workers: int = 8,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+    ) -> Iterator[ValidationError]:
         """
-        Validate all documents in a batch.
+        Validate a batch of documents, yielding errors as they are found.
+
+        Lets callers stream errors (to a log or report) without holding
+        them all in memory.
 
         Args:
             documents: List of document dicts
-
-        Returns:
-            Tuple of (all_valid, errors, stats)
+            stats: Optional dict updated in place with valid_count,
+                invalid_count and total_count as documents are validated
+                (when stopped by max_errors, the counts cover only the
+                documents validated so far)
+            max_workers: Maximum concurrent lookups while prefetching
+            fail_fast: Report at most the first error per document
+            max_errors: Stop the whole batch after this many errors (at least 1)
+
+        Yields:
+            ValidationError for each problem, in document order
+
+        Raises:
+            ValueError: If max_errors is less than 1
         """
-        all_errors: list[ValidationError] = []
-        valid_count = 0
-        invalid_count = 0
+        if max_errors is not None and max_errors < 1:
+            raise ValueError(f"max_errors must be at least 1, got {max_errors}")
+        if stats is None:
+            stats = {}
+        stats.update(valid_count=0, invalid_count=0, total_count=len(documents))
+
+        # Each batch is checked against current Odoo data
+        self.clear_resolve_cache()
+
+        # Resolve all partners and products and check all referenced records
+        # up front (a handful of concurrent RPCs instead of one per
+        # document/line/field)
+        partner_cache, product_cache = self._prefetch_all(documents, max_workers)
 
+        error_budget = max_errors
         for doc in documents:
-            doc_errors = self.validate_document(doc)
+            doc_errors = self.validate_document(
+                doc,
+                partner_cache=partner_cache,
+                product_cache=product_cache,
+                fail_fast=fail_fast,
+            )
             if doc_errors:
-                all_errors.extend(doc_errors)
-                invalid_count += 1
+                stats["invalid_count"] += 1
+                if error_budget is not None:
+                    doc_errors = doc_errors[:error_budget]
+                    error_budget -= len(doc_errors)
+                yield from doc_errors
+                if error_budget is not None and error_budget <= 0:
+                    return
             else:
-                valid_count += 1
+                stats["valid_count"] += 1
 
-        stats = {
-            "valid_count": valid_count,
-            "invalid_count": invalid_count,
-            "total_count": len(documents),
-        }
+    def validate_all(
+        self,
+        documents: list[dict],
+        max_workers: int = 8,
+        fail_fast: bool = False,
+        max_errors: Optional[int] = None,
+    ) -> tuple[bool, list[ValidationError], dict]:
+        """
+        Validate all documents in a batch.
+
+        Args:
+            documents: List of document dicts
+            max_workers: Maximum concurrent lookups while prefetching
+            fail_fast: Report at most the first error per document
+            max_errors: Stop the whole batch after this many errors (at least 1)
+
+        Returns:
+            Tuple of (all_valid, errors, stats). all_valid comes from the
+            invalid document count, not the (possibly capped) error list
 
-        return len(all_errors) == 0, all_errors, stats
+        Raises:
+            ValueError: If max_errors is less than 1
+        """
+        stats: dict = {}
+        all_errors = list(
+            self.iter_validate(documents, stats, max_workers, fail_fast, max_errors)
+        )
+        return stats["invalid_count"] == 0, all_errors, stats
 
     # --- Tag Management ---
 
@@ -517,24 +1091,85 @@ class DocumentCreationOperations(BaseOperation):
         Returns:
             Tag ID
         """
-        tags = self.odoo.search_read(
-            self.TAG_MODEL, [("name", "=", tag_name)], fields=["id"], limit=1
-        )
-        if tags:
-            return tags[0]["id"]
+        return self._ensure_tags([tag_name])[0]
 
-        # Create the tag
-        tag_id = self.odoo.create(self.TAG_MODEL, {"name": tag_name})
-        self.log.info(f"Created tag '{tag_name}' with id={tag_id}")
-        return tag_id
+    def _ensure_tags(self, tag_names: list[str]) -> list[int]:
+        """
+        Find or create several tags by name in at most two RPCs.
+
+        Names already seen by this instance are served from a cache (tags
+        are few and rarely change during an import); the rest are looked up
+        with one search_read and the missing ones created with one batched
+        create. Serialized with a lock so concurrent document creation
+        cannot create the same tag twice.
+
+        Args:
+            tag_names: Tag names
+
+        Returns:
+            Tag IDs, in the order of tag_names
+        """
+        if not tag_names:
+            return []
+
+        with self._tag_lock:
+            unknown = list(
+                dict.fromkeys(n for n in tag_names if n not in self._tag_ids)
+            )
+            if unknown:
+                found: dict[str, int] = {}
+                for tag in self.odoo.search_read(
+                    self.TAG_MODEL,
+                    [("name", "in", unknown)],
+                    fields=["id", "name"],
+                ):
+                    # Keep the first match per name
+                    found.setdefault(tag["name"], tag["id"])
+                self._tag_ids.update(found)
+
+                missing = [n for n in unknown if n not in found]
+                if missing:
+                    new_ids = self.odoo.create(
+                        self.TAG_MODEL, [{"name": name} for name in missing]
+                    )
+                    for name, tag_id in zip(missing, new_ids):
+                        self._tag_ids[name] = tag_id
+                        self.log.info(f"Created tag '{name}' with id={tag_id}")
+
+            return [self._tag_ids[name] for name in tag_names]
+
+    def clear_tag_cache(self) -> None:
+        """Forget cached tag IDs (e.g. after tags were renamed or deleted)."""
+        with self._tag_lock:
+            self._tag_ids.clear()
 
     # --- Creation Methods (Phase 2) ---
 
+    @staticmethod
+    def _origin_from_metadata(metadata: dict) -> str:
+        """
+        Build a document origin ("[source] filename") from creation metadata.
+
+        Args:
+            metadata: Creation metadata
+
+        Returns:
+            Origin string, empty if neither source nor filename is set
+        """
+        source = metadata.get("source")
+        filename = metadata.get("filename")
+        if source and filename:
+            return f"[{source}] {filename}"
+        if source:
+            return f"[{source}]"
+        return filename or ""
+
     def create_sale_order(
         self,
         header: dict,
         lines: list[dict],
         metadata: dict,
+        meta_html: Optional[str] = None,
     ) -> OperationResult:
         """
         Create a sale order with lines.
@@ -543,6 +1178,7 @@ class DocumentCreationOperations(BaseOperation):
             header: Order header fields (partner_id/name, pricelist_id, etc.)
             lines: List of line dicts (product_ref, quantity)
             metadata: Creation metadata for audit trail
+            meta_html: Prebuilt metadata fragment of the creation message
 
         Returns:
             OperationResult with created order ID
@@ -572,198 +1208,24 @@ class DocumentCreationOperations(BaseOperation):
                     error=f"Partner resolution failed: {partner_result.error}",
                 )
 
-            # Build order values
-            order_vals = {
-                "partner_id": partner_result.record_id,
-            }
-
-            # --- Core optional fields ---
-            if header.get("pricelist_id"):
-                order_vals["pricelist_id"] = header["pricelist_id"]
-            if header.get("warehouse_id"):
-                order_vals["warehouse_id"] = header["warehouse_id"]
-            if header.get("payment_term_id"):
-                order_vals["payment_term_id"] = header["payment_term_id"]
-
-            # --- Reference fields ---
-            if header.get("client_order_ref"):
-                order_vals["client_order_ref"] = header["client_order_ref"]
-
-            # --- Date fields ---
-            if header.get("commitment_date"):
-                order_vals["commitment_date"] = header["commitment_date"]
-            if header.get("date_order"):
-                order_vals["date_order"] = header["date_order"]
-            if header.get("validity_date"):
-                order_vals["validity_date"] = header["validity_date"]
-
-            # --- Team/User fields ---
-            if header.get("user_id"):
-                order_vals["user_id"] = header["user_id"]
-            if header.get("team_id"):
-                order_vals["team_id"] = header["team_id"]
-
-            # --- Company/Accounting fields ---
-            if header.get("company_id"):
-                order_vals["company_id"] = header["company_id"]
-            if header.get("fiscal_position_id"):
-                order_vals["fiscal_position_id"] = header["fiscal_position_id"]
-            if header.get("analytic_account_id"):
-                order_vals["analytic_account_id"] = header["analytic_account_id"]
-
-            # --- Shipping fields ---
-            if header.get("incoterm"):
-                order_vals["incoterm"] = header["incoterm"]
-            if header.get("incoterm_location"):
-                order_vals["incoterm_location"] = header["incoterm_location"]
-            if header.get("carrier_id"):
-                order_vals["carrier_id"] = header["carrier_id"]
-
-            # --- Delivery/Invoice addresses (if different from partner) ---
-            # If partner_shipping_id is provided directly, use it
-            if header.get("partner_shipping_id"):
-                order_vals["partner_shipping_id"] = header["partner_shipping_id"]
-            # Otherwise, if delivery_address is provided, resolve it to partner_shipping_id
-            elif header.get("delivery_address"):
-                delivery_result = self.resolve_delivery_address(header["delivery_address"])
-                if delivery_result.success:
-                    order_vals["partner_shipping_id"] = delivery_result.record_id
-                    self.log.info(
-                        f"Resolved delivery address '{header['delivery_address']}' → partner_shipping_id={delivery_result.record_id}"
-                    )
-                else:
-                    # Log warning but don't fail - use partner_id as fallback
-                    self.log.warning(
-                        f"Could not resolve delivery address '{header['delivery_address']}': {delivery_result.error}. Using partner as shipping address."
-                    )
-            if header.get("partner_invoice_id"):
-                order_vals["partner_invoice_id"] = header["partner_invoice_id"]
-
-            # --- Notes/References ---
-            if header.get("note"):
-                order_vals["note"] = header["note"]
-            if header.get("reference"):
-                order_vals["reference"] = header["reference"]
-
-            # --- Currency ---
-            if header.get("currency_id"):
-                order_vals["currency_id"] = header["currency_id"]
-
-            # --- Expected/Scheduled dates ---
-            if header.get("expected_date"):
-                order_vals["expected_date"] = header["expected_date"]
-
-            # --- ALOHAS-specific fields ---
-            if header.get("ah_status"):
-                order_vals["ah_status"] = header["ah_status"]
-            if header.get("ah_prepayment_status"):
-                order_vals["ah_prepayment_status"] = header["ah_prepayment_status"]
-
-            # --- Marketing attribution ---
-            if header.get("campaign_id"):
-                order_vals["campaign_id"] = header["campaign_id"]
-            if header.get("medium_id"):
-                order_vals["medium_id"] = header["medium_id"]
-            if header.get("source_id"):
-                order_vals["source_id"] = header["source_id"]
-
-            # --- Custom fields (any additional fields passed through as-is) ---
-            custom_fields = header.get("custom_fields", {})
-            for key, value in custom_fields.items():
-                order_vals[key] = value
+            order_vals = self._build_so_vals(
+                header, lines, metadata, partner_result.record_id
+            )
 
-            # Add origin from metadata
-            origin_parts = []
-            if metadata.get("source"):
-                origin_parts.append(f"[{metadata['source']}]")
-            if metadata.get("filename"):
-                origin_parts.append(metadata["filename"])
-            if origin_parts:
-                order_vals["origin"] = " ".join(origin_parts)
-
-            # Create order
+            # Create order with its lines and tags in a single call
             order_id = self.odoo.create(self.SO_MODEL, order_vals)
             self.log.success(order_id, f"Created sale.order {order_id}")
 
-            # Create order lines
-            for line in lines:
-                # Resolve product
-                product_result = self.resolve_product(
-                    line.get("product_id"),
-                    line.get("product_ref") or line.get("product_sku"),  # Accept both
-                    line.get("product_name"),
-                )
-                if not product_result.success:
-                    self.log.error(
-                        f"Product resolution failed for line: {product_result.error}",
-                        record_id=order_id,
-                    )
-                    continue
-
-                line_vals = {
-                    "order_id": order_id,
-                    "product_id": product_result.record_id,
-                    "product_uom_qty": line["quantity"],
-                }
-
-                # --- Price fields ---
-                if line.get("price_unit") is not None:
-                    line_vals["price_unit"] = line["price_unit"]
-                if line.get("discount") is not None:
-                    line_vals["discount"] = line["discount"]
-
-                # --- Description override ---
-                if line.get("name"):
-                    line_vals["name"] = line["name"]
-
-                # --- UoM override (if not using product default) ---
-                if line.get("product_uom"):
-                    line_vals["product_uom"] = line["product_uom"]
-
-                # --- Customer lead time ---
-                if line.get("customer_lead") is not None:
-                    line_vals["customer_lead"] = line["customer_lead"]
-
-                # --- Analytic distribution (if line-level analytics) ---
-                if line.get("analytic_distribution"):
-                    line_vals["analytic_distribution"] = line["analytic_distribution"]
-
-                # --- Line ordering ---
-                if line.get("sequence") is not None:
-                    line_vals["sequence"] = line["sequence"]
-
-                # --- Custom fields for line ---
-                line_custom = line.get("custom_fields", {})
-                for key, value in line_custom.items():
-                    line_vals[key] = value
-
-                self.odoo.create(self.SO_LINE_MODEL, line_vals)
-
-            # Add tags if specified (using ALOHAS ah_ops_status_ids field)
-            tags = header.get("tags", [])
-            for tag_name in tags:
-                tag_id = self._ensure_tag(tag_name)
-                self.odoo.write(
-                    self.SO_MODEL, [order_id], {"ah_ops_status_ids": [(4, tag_id)]}
-                )
-
             # Post creation message
             self._post_creation_message(
-                self.SO_MODEL, order_id, metadata, len(lines)
+                self.SO_MODEL, order_id, metadata, len(lines), meta_html
             )
 
             # Read back order name for result
             order_data = self.odoo.read(self.SO_MODEL, [order_id], ["name"])
-            order_name = order_data[0]["name"] if order_data else f"Order #{order_id}"
+            order_name = order_data[0]["name"] if order_data else None
 
-            return OperationResult.ok(
-                record_id=order_id,
-                model=self.SO_MODEL,
-                action="create",
-                message=f"Created {order_name} with {len(lines)} lines",
-                data={"order_name": order_name, "line_count": len(lines)},
-                record_name=order_name,
-            )
+            return self._so_created_result(order_id, order_name, len(lines))
 
         except Exception as e:
             self.log.error(f"Failed to create sale.order: {e}")
@@ -773,206 +1235,466 @@ class DocumentCreationOperations(BaseOperation):
                 error=str(e),
             )
 
-    def create_stock_picking(
+    def _build_so_vals(
         self,
         header: dict,
         lines: list[dict],
         metadata: dict,
-    ) -> OperationResult:
+        partner_id: int,
+        product_cache: Optional[dict] = None,
+    ) -> dict:
         """
-        Create a stock picking (transfer) with moves.
+        Build sale.order create values, with lines and tags inline.
+
+        Lines whose product cannot be resolved are logged and skipped.
 
         Args:
-            header: Picking header fields (partner_id, picking_type_id, locations)
-            lines: List of move dicts (product_ref, quantity)
+            header: Order header fields
+            lines: List of line dicts (product_ref, quantity)
             metadata: Creation metadata for audit trail
+            partner_id: Resolved customer partner ID
+            product_cache: Optional lookup from _prefetch_products
 
         Returns:
-            OperationResult with created picking ID
+            Values for a single sale.order create
         """
-        if self.dry_run:
-            self.log.skip(
-                0,
-                f"Would create stock.picking with {len(lines)} moves",
-            )
-            return OperationResult.skipped(
-                record_id=0,
-                model=self.PICKING_MODEL,
-                reason=f"Dry run: would create stock.picking with {len(lines)} moves",
-            )
+        # Build order values
+        order_vals: dict[str, Any] = {
+            "partner_id": partner_id,
+        }
 
-        try:
-            # Resolve partner (optional for pickings)
-            partner_id = None
-            if header.get("partner_id") or header.get("partner_name"):
-                partner_result = self.resolve_partner(
-                    header.get("partner_id"),
-                    header.get("partner_name"),
-                    header.get("partner_ref"),
+        # --- Optional header fields copied as-is when set ---
+        order_vals.update({
+            key: header[key]
+            for key in self._SO_PASSTHROUGH_FIELDS
+            if header.get(key)
+        })
+
+        # --- Delivery/Invoice addresses (if different from partner) ---
+        shipping_partner = header.get("partner_shipping_id")
+        delivery_address = header.get("delivery_address")
+        # If partner_shipping_id is provided directly, use it
+        if shipping_partner:
+            order_vals["partner_shipping_id"] = shipping_partner
+        # Otherwise, if delivery_address is provided, resolve it to partner_shipping_id
+        elif delivery_address:
+            delivery_result = self.resolve_delivery_address(delivery_address)
+            if delivery_result.success:
+                order_vals["partner_shipping_id"] = delivery_result.record_id
+                self.log.info(
+                    f"Resolved delivery address '{delivery_address}' → partner_shipping_id={delivery_result.record_id}"
+                )
+            else:
+                # Log warning but don't fail - use partner_id as fallback
+                self.log.warning(
+                    f"Could not resolve delivery address '{delivery_address}': {delivery_result.error}. Using partner as shipping address."
                 )
-                if partner_result.success:
-                    partner_id = partner_result.record_id
 
-            # Build picking values
-            picking_vals = {
-                "picking_type_id": header["picking_type_id"],
-            }
+        # --- Custom fields (any additional fields passed through as-is) ---
+        order_vals.update(header.get("custom_fields", {}))
 
-            # --- Partner ---
-            if partner_id:
-                picking_vals["partner_id"] = partner_id
+        # Add origin from metadata
+        origin = self._origin_from_metadata(metadata)
+        if origin:
+            order_vals["origin"] = origin
 
-            # --- Location fields ---
-            if header.get("location_id"):
-                picking_vals["location_id"] = header["location_id"]
-            if header.get("location_dest_id"):
-                picking_vals["location_dest_id"] = header["location_dest_id"]
-
-            # --- Date fields ---
-            if header.get("scheduled_date"):
-                picking_vals["scheduled_date"] = header["scheduled_date"]
-            if header.get("date_deadline"):
-                picking_vals["date_deadline"] = header["date_deadline"]
-            if header.get("planned_date"):
-                # Some Odoo versions use planned_date vs scheduled_date
-                picking_vals["planned_date"] = header["planned_date"]
-
-            # --- Company/User ---
-            if header.get("company_id"):
-                picking_vals["company_id"] = header["company_id"]
-            if header.get("user_id"):
-                picking_vals["user_id"] = header["user_id"]
-
-            # --- Ownership/Consignment ---
-            if header.get("owner_id"):
-                picking_vals["owner_id"] = header["owner_id"]
-
-            # --- Priority ---
-            if header.get("priority"):
-                picking_vals["priority"] = header["priority"]
-
-            # --- Notes ---
-            if header.get("note"):
-                picking_vals["note"] = header["note"]
-
-            # --- Related documents ---
-            if header.get("sale_id"):
-                picking_vals["sale_id"] = header["sale_id"]
-            if header.get("purchase_id"):
-                picking_vals["purchase_id"] = header["purchase_id"]
-
-            # --- Move type (direct/one/multi-step) ---
-            if header.get("move_type"):
-                picking_vals["move_type"] = header["move_type"]
-
-            # --- Carrier/Tracking ---
-            if header.get("carrier_id"):
-                picking_vals["carrier_id"] = header["carrier_id"]
-            if header.get("carrier_tracking_ref"):
-                picking_vals["carrier_tracking_ref"] = header["carrier_tracking_ref"]
-
-            # --- ALOHAS-specific fields ---
-            if header.get("ah_picking_status"):
-                picking_vals["ah_picking_status"] = header["ah_picking_status"]
+        # Build order lines; they are created inline with the order
+        line_vals_list: list[dict[str, Any]] = []
+        for line in lines:
+            # Resolve product
+            product_result = self.resolve_product(
+                *self._line_product_args(line), cache=product_cache
+            )
+            if not product_result.success:
+                self.log.error(
+                    f"Product resolution failed for line: {product_result.error}"
+                )
+                continue
 
-            # --- Custom fields (any additional fields passed through as-is) ---
-            custom_fields = header.get("custom_fields", {})
-            for key, value in custom_fields.items():
-                picking_vals[key] = value
+            line_vals: dict[str, Any] = {
+                "product_id": product_result.record_id,
+                "product_uom_qty": line["quantity"],
+            }
 
-            # Add origin from metadata
-            origin_parts = []
-            if metadata.get("source"):
-                origin_parts.append(f"[{metadata['source']}]")
-            if metadata.get("filename"):
-                origin_parts.append(metadata["filename"])
-            if origin_parts:
-                picking_vals["origin"] = " ".join(origin_parts)
+            # --- Price fields ---
+            value = line.get("price_unit")
+            if value is not None:
+                line_vals["price_unit"] = value
+            value = line.get("discount")
+            if value is not None:
+                line_vals["discount"] = value
 
-            # Create picking
-            picking_id = self.odoo.create(self.PICKING_MODEL, picking_vals)
-            self.log.success(picking_id, f"Created stock.picking {picking_id}")
+            # --- Description override ---
+            value = line.get("name")
+            if value:
+                line_vals["name"] = value
+
+            # --- UoM override (if not using product default) ---
+            value = line.get("product_uom")
+            if value:
+                line_vals["product_uom"] = value
+
+            # --- Customer lead time ---
+            value = line.get("customer_lead")
+            if value is not None:
+                line_vals["customer_lead"] = value
+
+            # --- Analytic distribution (if line-level analytics) ---
+            value = line.get("analytic_distribution")
+            if value:
+                line_vals["analytic_distribution"] = value
+
+            # --- Line ordering ---
+            value = line.get("sequence")
+            if value is not None:
+                line_vals["sequence"] = value
+
+            # --- Custom fields for line ---
+            line_vals.update(line.get("custom_fields", {}))
+
+            line_vals_list.append(line_vals)
+
+        if line_vals_list:
+            order_vals["order_line"] = [
+                (0, 0, line_vals) for line_vals in line_vals_list
+            ]
+
+        # Add tags if specified (using ALOHAS ah_ops_status_ids field)
+        tags = header.get("tags", [])
+        if tags:
+            order_vals["ah_ops_status_ids"] = [
+                (4, tag_id) for tag_id in self._ensure_tags(tags)
+            ]
+
+        return order_vals
+
+    def _so_created_result(
+        self,
+        order_id: int,
+        order_name: Optional[str],
+        line_count: int,
+    ) -> OperationResult:
+        """Build the create_sale_order success result."""
+        order_name = order_name or f"Order #{order_id}"
+        return OperationResult.ok(
+            record_id=order_id,
+            model=self.SO_MODEL,
+            action="create",
+            message=f"Created {order_name} with {line_count} lines",
+            data={"order_name": order_name, "line_count": line_count},
+            record_name=order_name,
+        )
+
+    def create_sale_orders_bulk(
+        self,
+        documents: list[dict],
+        metadata: dict,
+        meta_html: Optional[str] = None,
+    ) -> list[OperationResult]:
+        """
+        Create many sale orders with a single multi-record create.
+
+        Partners and products are resolved from one batch prefetch, all
+        order values (lines and tags inline) are built locally, and the
+        orders are created in one call and their names read in one call.
+        If the batch create is rejected, orders are created one by one so
+        a single bad order only fails itself.
+
+        Args:
+            documents: Sale order document dicts (header, lines)
+            metadata: Creation metadata for audit trail
+            meta_html: Prebuilt metadata fragment of the creation messages
+
+        Returns:
+            List of OperationResult, in the order of documents
+        """
+        def prepare() -> Callable[[dict, list[dict], dict, int], dict]:
+            product_cache = self._prefetch_products(documents)
+            return lambda header, lines, metadata, partner_id: self._build_so_vals(
+                header, lines, metadata, partner_id, product_cache=product_cache
+            )
 
-            # Get picking details for moves (need locations)
-            picking_data = self.odoo.read(
-                self.PICKING_MODEL,
-                [picking_id],
-                ["name", "location_id", "location_dest_id"],
-            )[0]
-            picking_name = picking_data["name"]
-
-            # Create stock moves
-            for line in lines:
-                # Resolve product
-                product_result = self.resolve_product(
-                    line.get("product_id"),
-                    line.get("product_ref") or line.get("product_sku"),  # Accept both
-                    line.get("product_name"),
+        return self._create_orders_bulk(
+            self.SO_MODEL, documents, metadata, prepare, meta_html
+        )
+
+    def create_purchase_orders_bulk(
+        self,
+        documents: list[dict],
+        metadata: dict,
+        meta_html: Optional[str] = None,
+    ) -> list[OperationResult]:
+        """
+        Create many purchase orders with a single multi-record create.
+
+        Same flow as create_sale_orders_bulk; the products of every line
+        are resolved and read once for the whole batch.
+
+        Args:
+            documents: Purchase order document dicts (header, lines)
+            metadata: Creation metadata for audit trail
+            meta_html: Prebuilt metadata fragment of the creation messages
+
+        Returns:
+            List of OperationResult, in the order of documents
+        """
+        def prepare() -> Callable[[dict, list[dict], dict, int], dict]:
+            # Fill the product caches for the batch; each order then reuses them
+            self._resolve_line_products(
+                [line for doc in documents for line in doc.get("lines", [])]
+            )
+            return self._build_po_vals
+
+        return self._create_orders_bulk(
+            self.PO_MODEL, documents, metadata, prepare, meta_html
+        )
+
+    def _create_orders_bulk(
+        self,
+        model: str,
+        documents: list[dict],
+        metadata: dict,
+        prepare: Callable[[], Callable[[dict, list[dict], dict, int], dict]],
+        meta_html: Optional[str] = None,
+    ) -> list[OperationResult]:
+        """
+        Create many sale or purchase orders with one create and one name read.
+
+        Args:
+            model: SO_MODEL or PO_MODEL
+            documents: Order document dicts (header, lines)
+            metadata: Creation metadata for audit trail
+            prepare: Batch setup (prefetches); returns the vals builder
+                (header, lines, metadata, partner_id) -> create values
+            meta_html: Prebuilt metadata fragment of the creation messages;
+                built here once for the batch when not given
+
+        Returns:
+            List of OperationResult, in the order of documents
+        """
+        create_one, created_result = {
+            self.SO_MODEL: (self.create_sale_order, self._so_created_result),
+            self.PO_MODEL: (self.create_purchase_order, self._po_created_result),
+        }[model]
+
+        if self.dry_run:
+            return [
+                create_one(doc.get("header", {}), doc.get("lines", []), metadata)
+                for doc in documents
+            ]
+
+        if meta_html is None:
+            meta_html = self._creation_meta_html(metadata)
+
+        results: list[Optional[OperationResult]] = [None] * len(documents)
+        pending: list[tuple[int, dict]] = []  # (index, order_vals)
+        try:
+            # Partners resolved during validation are memoized; fetch the rest
+            unresolved = []
+            for doc in documents:
+                header = doc.get("header", {})
+                key = self._partner_key(
+                    header.get("partner_id"),
+                    header.get("partner_name"),
+                    header.get("partner_ref"),
+                )
+                if key not in self._resolve_cache:
+                    unresolved.append(doc)
+            partner_cache = self._prefetch_partners(unresolved)
+            build_vals = prepare()
+            for i, doc in enumerate(documents):
+                header = doc.get("header", {})
+                partner_result = self.resolve_partner(
+                    header.get("partner_id"),
+                    header.get("partner_name"),
+                    header.get("partner_ref"),
+                    cache=partner_cache,
                 )
-                if not product_result.success:
-                    self.log.error(
-                        f"Product resolution failed for line: {product_result.error}",
-                        record_id=picking_id,
+                if not partner_result.success:
+                    results[i] = OperationResult.fail(
+                        model=model,
+                        action="create",
+                        error=f"Partner resolution failed: {partner_result.error}",
                     )
                     continue
+                pending.append((i, build_vals(
+                    header, doc.get("lines", []), metadata, partner_result.record_id
+                )))
+        except Exception as e:
+            self.log.error(f"Failed to prepare {model} batch: {e}")
+            return [
+                OperationResult.fail(model=model, action="create", error=str(e))
+                for _ in documents
+            ]
 
-                # Get product details for move
-                product_data = self.odoo.read(
-                    self.PRODUCT_MODEL,
-                    [product_result.record_id],
-                    ["name", "uom_id"],
-                )[0]
+        if not pending:
+            return results
 
-                move_vals = {
-                    "picking_id": picking_id,
-                    "product_id": product_result.record_id,
-                    "product_uom_qty": line["quantity"],
-                    "product_uom": product_data["uom_id"][0],
-                    "name": line.get("name") or product_data["name"],
-                    "location_id": picking_data["location_id"][0],
-                    "location_dest_id": picking_data["location_dest_id"][0],
-                }
+        try:
+            order_ids = self.odoo.create(
+                model, [order_vals for _, order_vals in pending]
+            )
+        except Exception as e:
+            # The batch is one transaction; retry per order to isolate failures
+            self.log.warning(f"Batch {model} create failed, retrying one by one: {e}")
+            for i, _ in pending:
+                doc = documents[i]
+                results[i] = create_one(
+                    doc.get("header", {}), doc.get("lines", []), metadata,
+                    meta_html=meta_html,
+                )
+            return results
+
+        for (i, _), order_id in zip(pending, order_ids):
+            self.log.success(order_id, f"Created {model} {order_id}")
+            self._post_creation_message(
+                model, order_id, metadata, len(documents[i].get("lines", [])),
+                meta_html,
+            )
+
+        names: dict[int, str]
+        try:
+            names = {
+                o["id"]: o["name"]
+                for o in self.odoo.read(model, order_ids, ["name"])
+            }
+        except Exception as e:
+            # Orders exist already; keep the ID-based fallback names
+            self.log.warning(f"Could not read {model} names: {e}")
+            names = {}
+
+        for (i, _), order_id in zip(pending, order_ids):
+            results[i] = created_result(
+                order_id, names.get(order_id), len(documents[i].get("lines", []))
+            )
+        return results
+
+    def create_stock_picking(
+        self,
+        header: dict,
+        lines: list[dict],
+        metadata: dict,
+        read_name: bool = True,
+        meta_html: Optional[str] = None,
+    ) -> OperationResult:
+        """
+        Create a stock picking (transfer) with moves.
+
+        Args:
+            header: Picking header fields (partner_id, picking_type_id, locations)
+            lines: List of move dicts (product_ref, quantity)
+            metadata: Creation metadata for audit trail
+            read_name: Read back the sequence-generated picking name. When
+                False and no read is otherwise needed, record_name is the
+                "stock.picking <id>" fallback for the caller to fill
+                (see _fill_record_names)
+            meta_html: Prebuilt metadata fragment of the creation message
+
+        Returns:
+            OperationResult with created picking ID
+        """
+        if self.dry_run:
+            self.log.skip(
+                0,
+                f"Would create stock.picking with {len(lines)} moves",
+            )
+            return OperationResult.skipped(
+                record_id=0,
+                model=self.PICKING_MODEL,
+                reason=f"Dry run: would create stock.picking with {len(lines)} moves",
+            )
+
+        try:
+            # Resolve partner (optional for pickings)
+            partner_id = header.get("partner_id")
+            partner_name = header.get("partner_name")
+            if partner_id or partner_name:
+                partner_result = self.resolve_partner(
+                    partner_id, partner_name, header.get("partner_ref")
+                )
+                partner_id = partner_result.record_id if partner_result.success else None
+            else:
+                partner_id = None
 
-                # --- Date override ---
-                if line.get("date"):
-                    move_vals["date"] = line["date"]
+            # Build picking values
+            picking_vals: dict[str, Any] = {
+                "picking_type_id": header["picking_type_id"],
+            }
 
-                # --- Lot/Serial (for tracked products) ---
-                if line.get("lot_id"):
-                    move_vals["lot_id"] = line["lot_id"]
+            # --- Partner ---
+            if partner_id:
+                picking_vals["partner_id"] = partner_id
 
-                # --- Move ordering ---
-                if line.get("sequence") is not None:
-                    move_vals["sequence"] = line["sequence"]
+            # --- Optional header fields copied as-is when set ---
+            picking_vals.update({
+                key: header[key]
+                for key in self._PICKING_PASSTHROUGH_FIELDS
+                if header.get(key)
+            })
 
-                # --- Custom fields for move ---
-                line_custom = line.get("custom_fields", {})
-                for key, value in line_custom.items():
-                    move_vals[key] = value
+            # --- Custom fields (any additional fields passed through as-is) ---
+            picking_vals.update(header.get("custom_fields", {}))
 
-                self.odoo.create(self.MOVE_MODEL, move_vals)
+            # Add origin from metadata
+            origin = self._origin_from_metadata(metadata)
+            if origin:
+                picking_vals["origin"] = origin
 
             # Add tags if specified (using ALOHAS ah_operation_tags_ids field)
             tags = header.get("tags", [])
-            for tag_name in tags:
-                tag_id = self._ensure_tag(tag_name)
-                self.odoo.write(
-                    self.PICKING_MODEL, [picking_id], {"ah_operation_tags_ids": [(4, tag_id)]}
-                )
+            if tags:
+                picking_vals["ah_operation_tags_ids"] = [
+                    (4, tag_id) for tag_id in self._ensure_tags(tags)
+                ]
+
+            # Moves need the picking's locations; when they are known up
+            # front, create the moves inline with the picking
+            locations = self._picking_locations(picking_vals)
+            if locations:
+                # Pin the picking to the locations its moves are built with
+                picking_vals["location_id"], picking_vals["location_dest_id"] = locations
+                picking_vals["move_ids_without_package"] = [
+                    (0, 0, move_vals)
+                    for move_vals in self._build_move_vals(lines, *locations)
+                ]
+
+            # Create picking
+            picking_id = self.odoo.create(self.PICKING_MODEL, picking_vals)
+            self.log.success(picking_id, f"Created stock.picking {picking_id}")
+
+            picking_name = None
+            if not locations:
+                # Locations only known after create (the name comes for free)
+                picking_data = self.odoo.read(
+                    self.PICKING_MODEL,
+                    [picking_id],
+                    ["name", "location_id", "location_dest_id"],
+                )[0]
+                picking_name = picking_data["name"]
+
+                # Add moves in one batched call
+                move_vals_list = [
+                    dict(move_vals, picking_id=picking_id)
+                    for move_vals in self._build_move_vals(
+                        lines,
+                        picking_data["location_id"][0],
+                        picking_data["location_dest_id"][0],
+                    )
+                ]
+                if move_vals_list:
+                    self.odoo.create(self.MOVE_MODEL, move_vals_list)
+
+            elif read_name:
+                picking_name = self.odoo.read(
+                    self.PICKING_MODEL, [picking_id], ["name"]
+                )[0]["name"]
 
             # Post creation message
             self._post_creation_message(
-                self.PICKING_MODEL, picking_id, metadata, len(lines)
+                self.PICKING_MODEL, picking_id, metadata, len(lines), meta_html
             )
 
-            return OperationResult.ok(
-                record_id=picking_id,
-                model=self.PICKING_MODEL,
-                action="create",
-                message=f"Created {picking_name} with {len(lines)} moves",
-                data={"picking_name": picking_name, "move_count": len(lines)},
-                record_name=picking_name,
-            )
+            return self._picking_created_result(picking_id, picking_name, len(lines))
 
         except Exception as e:
             self.log.error(f"Failed to create stock.picking: {e}")
@@ -982,11 +1704,177 @@ class DocumentCreationOperations(BaseOperation):
                 error=str(e),
             )
 
+    def _picking_created_result(
+        self,
+        picking_id: int,
+        picking_name: Optional[str],
+        move_count: int,
+    ) -> OperationResult:
+        """Build the create_stock_picking success result."""
+        if not picking_name and self._unnamed_records is not None:
+            self._unnamed_records.add((self.PICKING_MODEL, picking_id))
+        picking_name = picking_name or self._NAME_FALLBACKS[self.PICKING_MODEL].format(
+            picking_id
+        )
+        return OperationResult.ok(
+            record_id=picking_id,
+            model=self.PICKING_MODEL,
+            action="create",
+            message=f"Created {picking_name} with {move_count} moves",
+            data={"picking_name": picking_name, "move_count": move_count},
+            record_name=picking_name,
+        )
+
+    def _fill_record_names(
+        self,
+        results: list[OperationResult],
+        unnamed: set[tuple[str, int]],
+    ) -> None:
+        """
+        Read the names of records created with read_name=False.
+
+        One read per model (pickings, purchase orders) for all of them.
+
+        Args:
+            results: Creation results; unnamed picking and purchase order
+                results are replaced in place by named ones
+            unnamed: (model, record_id) of the records created without a name
+        """
+        builders = {
+            self.PICKING_MODEL: lambda r, name: self._picking_created_result(
+                r.record_id, name, r.data["move_count"]
+            ),
+            self.PO_MODEL: lambda r, name: self._po_created_result(
+                r.record_id, name, r.data["line_count"]
+            ),
+        }
+        pending: dict[str, list[int]] = defaultdict(list)
+        for i, r in enumerate(results):
+            if r.success and (r.model, r.record_id) in unnamed:
+                pending[r.model].append(i)
+
+        for model, indexes in pending.items():
+            try:
+                names = {
+                    rec["id"]: rec["name"]
+                    for rec in self.odoo.read(
+                        model, [results[i].record_id for i in indexes], ["name"]
+                    )
+                }
+            except Exception as e:
+                # Records exist already; keep the ID-based fallback names
+                self.log.warning(f"Could not read {model} names: {e}")
+                continue
+            for i in indexes:
+                result = results[i]
+                results[i] = builders[model](result, names.get(result.record_id))
+
+    def _picking_locations(self, picking_vals: dict) -> Optional[tuple[int, int]]:
+        """
+        Determine a new picking's source and destination locations.
+
+        Uses the explicit header locations, falling back to the picking
+        type's default locations (what Odoo itself would use). Picking
+        types are read once per instance.
+
+        Args:
+            picking_vals: Picking values being created
+
+        Returns:
+            (location_id, location_dest_id), or None if not determinable
+        """
+        location_id = picking_vals.get("location_id")
+        location_dest_id = picking_vals.get("location_dest_id")
+        if not (location_id and location_dest_id):
+            picking_type_id = picking_vals["picking_type_id"]
+            if picking_type_id not in self._picking_type_cache:
+                types = self.odoo.read(
+                    self.PICKING_TYPE_MODEL,
+                    [picking_type_id],
+                    ["default_location_src_id", "default_location_dest_id"],
+                )
+                self._picking_type_cache[picking_type_id] = types[0] if types else {}
+            picking_type = self._picking_type_cache[picking_type_id]
+            default_src = picking_type.get("default_location_src_id")
+            default_dest = picking_type.get("default_location_dest_id")
+            location_id = location_id or (default_src[0] if default_src else None)
+            location_dest_id = location_dest_id or (
+                default_dest[0] if default_dest else None
+            )
+        if location_id and location_dest_id:
+            return location_id, location_dest_id
+        return None
+
+    def _build_move_vals(
+        self,
+        lines: list[dict],
+        location_id: int,
+        location_dest_id: int,
+    ) -> list[dict]:
+        """
+        Build stock.move values for picking lines (without picking_id).
+
+        Lines whose product cannot be resolved are logged and skipped.
+
+        Args:
+            lines: List of move dicts (product_ref, quantity)
+            location_id: Source location for the moves
+            location_dest_id: Destination location for the moves
+
+        Returns:
+            List of move values
+        """
+        product_results, products = self._resolve_line_products(lines)
+        # Per-product values, computed once rather than once per line
+        uom_by_product = {pid: p["uom_id"][0] for pid, p in products.items()}
+        name_by_product = {pid: p["name"] for pid, p in products.items()}
+
+        move_vals_list: list[dict[str, Any]] = []
+        for line, product_result in zip(lines, product_results):
+            if not product_result.success:
+                self.log.error(
+                    f"Product resolution failed for line: {product_result.error}"
+                )
+                continue
+
+            product_id = product_result.record_id
+            move_vals: dict[str, Any] = {
+                "product_id": product_id,
+                "product_uom_qty": line["quantity"],
+                "product_uom": uom_by_product[product_id],
+                "name": line.get("name") or name_by_product[product_id],
+                "location_id": location_id,
+                "location_dest_id": location_dest_id,
+            }
+
+            # --- Date override ---
+            value = line.get("date")
+            if value:
+                move_vals["date"] = value
+
+            # --- Lot/Serial (for tracked products) ---
+            value = line.get("lot_id")
+            if value:
+                move_vals["lot_id"] = value
+
+            # --- Move ordering ---
+            value = line.get("sequence")
+            if value is not None:
+                move_vals["sequence"] = value
+
+            # --- Custom fields for move ---
+            move_vals.update(line.get("custom_fields", {}))
+
+            move_vals_list.append(move_vals)
+        return move_vals_list
+
     def create_purchase_order(
         self,
         header: dict,
         lines: list[dict],
         metadata: dict,
+        read_name: bool = True,
+        meta_html: Optional[str] = None,
     ) -> OperationResult:
         """
         Create a purchase order with lines.
@@ -995,6 +1883,10 @@ class DocumentCreationOperations(BaseOperation):
             header: Order header fields (partner_id/name, etc.)
             lines: List of line dicts (product_ref, quantity, price_unit)
             metadata: Creation metadata for audit trail
+            read_name: Read back the sequence-generated order name. When
+                False, record_name is the "PO #<id>" fallback for the caller
+                to fill (see _fill_record_names)
+            meta_html: Prebuilt metadata fragment of the creation message
 
         Returns:
             OperationResult with created order ID
@@ -1024,156 +1916,292 @@ class DocumentCreationOperations(BaseOperation):
                     error=f"Partner resolution failed: {partner_result.error}",
                 )
 
-            # Build order values
-            order_vals = {
-                "partner_id": partner_result.record_id,
-            }
+            order_vals = self._build_po_vals(
+                header, lines, metadata, partner_result.record_id
+            )
 
-            # --- Core optional fields ---
-            if header.get("currency_id"):
-                order_vals["currency_id"] = header["currency_id"]
-            if header.get("company_id"):
-                order_vals["company_id"] = header["company_id"]
-            if header.get("payment_term_id"):
-                order_vals["payment_term_id"] = header["payment_term_id"]
-
-            # --- Date fields ---
-            if header.get("date_order"):
-                order_vals["date_order"] = header["date_order"]
-            if header.get("date_planned"):
-                order_vals["date_planned"] = header["date_planned"]
-
-            # --- Reference fields ---
-            if header.get("partner_ref"):
-                order_vals["partner_ref"] = header["partner_ref"]
+            # Create order with its lines in a single call
+            order_id = self.odoo.create(self.PO_MODEL, order_vals)
+            self.log.success(order_id, f"Created purchase.order {order_id}")
 
-            # --- Picking/Warehouse ---
-            if header.get("picking_type_id"):
-                order_vals["picking_type_id"] = header["picking_type_id"]
+            # Post creation message
+            self._post_creation_message(
+                self.PO_MODEL, order_id, metadata, len(lines), meta_html
+            )
+
+            order_name = None
+            if read_name:
+                # Read back order name for result
+                order_data = self.odoo.read(self.PO_MODEL, [order_id], ["name"])
+                order_name = order_data[0]["name"] if order_data else None
 
-            # --- User ---
-            if header.get("user_id"):
-                order_vals["user_id"] = header["user_id"]
+            return self._po_created_result(order_id, order_name, len(lines))
+
+        except Exception as e:
+            self.log.error(f"Failed to create purchase.order: {e}")
+            return OperationResult.fail(
+                model=self.PO_MODEL,
+                action="create",
+                error=str(e),
+            )
 
-            # --- Fiscal position ---
-            if header.get("fiscal_position_id"):
-                order_vals["fiscal_position_id"] = header["fiscal_position_id"]
+    def _build_po_vals(
+        self,
+        header: dict,
+        lines: list[dict],
+        metadata: dict,
+        partner_id: int,
+    ) -> dict:
+        """
+        Build purchase.order create values, with lines inline.
 
-            # --- Incoterms ---
-            if header.get("incoterm_id"):
-                order_vals["incoterm_id"] = header["incoterm_id"]
+        Lines whose product cannot be resolved are logged and skipped.
 
-            # --- Notes ---
-            if header.get("notes"):
-                order_vals["notes"] = header["notes"]
+        Args:
+            header: Order header fields
+            lines: List of line dicts (product_ref, quantity, price_unit)
+            metadata: Creation metadata for audit trail
+            partner_id: Resolved supplier partner ID
 
-            # --- Custom fields ---
-            custom_fields = header.get("custom_fields", {})
-            for key, value in custom_fields.items():
-                order_vals[key] = value
+        Returns:
+            Values for a single purchase.order create
+        """
+        # Build order values
+        order_vals: dict[str, Any] = {
+            "partner_id": partner_id,
+        }
 
-            # Add origin from metadata
-            origin_parts = []
-            if metadata.get("source"):
-                origin_parts.append(f"[{metadata['source']}]")
-            if metadata.get("filename"):
-                origin_parts.append(metadata["filename"])
-            if origin_parts:
-                order_vals["origin"] = " ".join(origin_parts)
-
-            # Create order
-            order_id = self.odoo.create(self.PO_MODEL, order_vals)
-            self.log.success(order_id, f"Created purchase.order {order_id}")
+        # --- Optional header fields copied as-is when set ---
+        order_vals.update({
+            key: header[key]
+            for key in self._PO_PASSTHROUGH_FIELDS
+            if header.get(key)
+        })
+
+        # --- Custom fields ---
+        order_vals.update(header.get("custom_fields", {}))
+
+        # Add origin from metadata
+        origin = self._origin_from_metadata(metadata)
+        if origin:
+            order_vals["origin"] = origin
+
+        # Build order lines; they are created inline with the order
+        product_results, products = self._resolve_line_products(lines)
+        # Purchase UoM if available, otherwise default UoM; per product
+        po_uom_by_product = {
+            pid: (p.get("uom_po_id") or p["uom_id"])[0]
+            for pid, p in products.items()
+        }
+        name_by_product = {pid: p["name"] for pid, p in products.items()}
 
-            # Create order lines
-            for line in lines:
-                # Resolve product
-                product_result = self.resolve_product(
-                    line.get("product_id"),
-                    line.get("product_ref") or line.get("product_sku"),  # Accept both
-                    line.get("product_name"),
+        line_vals_list: list[dict[str, Any]] = []
+        for line, product_result in zip(lines, product_results):
+            if not product_result.success:
+                self.log.error(
+                    f"Product resolution failed for line: {product_result.error}"
                 )
-                if not product_result.success:
-                    self.log.error(
-                        f"Product resolution failed for line: {product_result.error}",
-                        record_id=order_id,
-                    )
-                    continue
+                continue
+
+            product_id = product_result.record_id
+            line_vals: dict[str, Any] = {
+                "product_id": product_id,
+                "product_qty": line["quantity"],
+                "product_uom": po_uom_by_product[product_id],
+                "name": line.get("name") or name_by_product[product_id],
+            }
 
-                # Get product details
-                product_data = self.odoo.read(
-                    self.PRODUCT_MODEL,
-                    [product_result.record_id],
-                    ["name", "uom_po_id", "uom_id"],
-                )[0]
+            # --- Price ---
+            value = line.get("price_unit")
+            if value is not None:
+                line_vals["price_unit"] = value
 
-                # Use purchase UoM if available, otherwise default UoM
-                uom_id = product_data.get("uom_po_id")
-                if uom_id:
-                    uom_id = uom_id[0]
-                else:
-                    uom_id = product_data["uom_id"][0]
-
-                line_vals = {
-                    "order_id": order_id,
-                    "product_id": product_result.record_id,
-                    "product_qty": line["quantity"],
-                    "product_uom": uom_id,
-                    "name": line.get("name") or product_data["name"],
-                }
+            # --- Date planned ---
+            value = line.get("date_planned")
+            if value:
+                line_vals["date_planned"] = value
 
-                # --- Price ---
-                if line.get("price_unit") is not None:
-                    line_vals["price_unit"] = line["price_unit"]
+            # --- Taxes (optional override) ---
+            value = line.get("taxes_id")
+            if value:
+                line_vals["taxes_id"] = value
 
-                # --- Date planned ---
-                if line.get("date_planned"):
-                    line_vals["date_planned"] = line["date_planned"]
+            # --- Analytic ---
+            value = line.get("analytic_distribution")
+            if value:
+                line_vals["analytic_distribution"] = value
 
-                # --- Taxes (optional override) ---
-                if line.get("taxes_id"):
-                    line_vals["taxes_id"] = line["taxes_id"]
+            # --- Line ordering ---
+            value = line.get("sequence")
+            if value is not None:
+                line_vals["sequence"] = value
 
-                # --- Analytic ---
-                if line.get("analytic_distribution"):
-                    line_vals["analytic_distribution"] = line["analytic_distribution"]
+            # --- Custom fields for line ---
+            line_vals.update(line.get("custom_fields", {}))
 
-                # --- Line ordering ---
-                if line.get("sequence") is not None:
-                    line_vals["sequence"] = line["sequence"]
+            line_vals_list.append(line_vals)
 
-                # --- Custom fields for line ---
-                line_custom = line.get("custom_fields", {})
-                for key, value in line_custom.items():
-                    line_vals[key] = value
+        if line_vals_list:
+            order_vals["order_line"] = [
+                (0, 0, line_vals) for line_vals in line_vals_list
+            ]
 
-                self.odoo.create(self.PO_LINE_MODEL, line_vals)
+        return order_vals
 
-            # Post creation message
-            self._post_creation_message(
-                self.PO_MODEL, order_id, metadata, len(lines)
-            )
+    def _po_created_result(
+        self,
+        order_id: int,
+        order_name: Optional[str],
+        line_count: int,
+    ) -> OperationResult:
+        """Build the create_purchase_order success result."""
+        if not order_name and self._unnamed_records is not None:
+            self._unnamed_records.add((self.PO_MODEL, order_id))
+        order_name = order_name or self._NAME_FALLBACKS[self.PO_MODEL].format(order_id)
+        return OperationResult.ok(
+            record_id=order_id,
+            model=self.PO_MODEL,
+            action="create",
+            message=f"Created {order_name} with {line_count} lines",
+            data={"order_name": order_name, "line_count": line_count},
+            record_name=order_name,
+        )
 
-            # Read back order name for result
-            order_data = self.odoo.read(self.PO_MODEL, [order_id], ["name"])
-            order_name = order_data[0]["name"] if order_data else f"PO #{order_id}"
+    def create_document(
+        self,
+        doc: dict,
+        metadata: dict,
+        read_name: bool = True,
+        meta_html: Optional[str] = None,
+    ) -> OperationResult:
+        """
+        Create one document, dispatching on its document_type.
 
-            return OperationResult.ok(
-                record_id=order_id,
-                model=self.PO_MODEL,
-                action="create",
-                message=f"Created {order_name} with {len(lines)} lines",
-                data={"order_name": order_name, "line_count": len(lines)},
-                record_name=order_name,
-            )
+        Args:
+            doc: Document dict with document_type, header and lines
+            metadata: Creation metadata for audit trail
+            read_name: Passed to create_stock_picking and create_purchase_order
+            meta_html: Prebuilt metadata fragment of the creation message
 
-        except Exception as e:
-            self.log.error(f"Failed to create purchase.order: {e}")
+        Returns:
+            OperationResult from the matching create_* method
+        """
+        doc_type = doc.get("document_type", "sale.order")
+        create = {
+            self.SO_MODEL: self.create_sale_order,
+            self.PICKING_MODEL: self.create_stock_picking,
+            self.PO_MODEL: self.create_purchase_order,
+        }.get(doc_type)
+        if create is None:
             return OperationResult.fail(
-                model=self.PO_MODEL,
+                model=doc_type,
                 action="create",
-                error=str(e),
+                error=f"Unknown document_type: {doc_type}",
             )
+        header = doc.get("header", {})
+        lines = doc.get("lines", [])
+        if doc_type == self.SO_MODEL:
+            return create(header, lines, metadata, meta_html=meta_html)
+        return create(
+            header, lines, metadata, read_name=read_name, meta_html=meta_html
+        )
+
+    def create_documents(
+        self,
+        documents: list[dict],
+        metadata: dict,
+        max_workers: int = 1,
+    ) -> list[OperationResult]:
+        """
+        Create many documents, optionally concurrently.
+
+        Each document's creation is a chain of network-bound RPCs with no
+        dependency on the others, so with max_workers > 1 documents are
+        created on a thread pool. Odoo then assigns sequence numbers (and
+        names) in completion order rather than input order, which is why
+        concurrency is opt-in. Requires an Odoo client that is safe to
+        share across threads (OdooClient pools its XML-RPC connections).
+        Workers log through the thread-safe SentinelLogger and hand back
+        their results, which are merged here in input order.
+        Sale and purchase orders are created together per type
+        (create_sale_orders_bulk, create_purchase_orders_bulk); creation
+        messages are posted and remaining names read in one call each at
+        the end.
+
+        Args:
+            documents: Document dicts (see create_document)
+            metadata: Creation metadata for audit trail
+            max_workers: Maximum documents created at once (1 = sequential,
+                in input order)
+
+        Returns:
+            List of OperationResult, in the order of documents
+        """
+        if self.dry_run:
+            # Nothing is sent to Odoo: no pool, no bulk create, no name read
+            return [
+                self.create_document(doc, metadata, read_name=False)
+                for doc in documents
+            ]
+
+        # Every document shares the metadata: build its message fragment once
+        meta_html = self._creation_meta_html(metadata)
+
+        def create(doc: dict) -> OperationResult:
+            return self.create_document(
+                doc, metadata, read_name=False, meta_html=meta_html
+            )
+
+        # Creation messages are buffered and posted with one RPC at the end
+        self._creation_chatter = self.chatter_batch("notification")
+        self._unnamed_records = unnamed = set()
+        try:
+            # Sale and purchase orders of one type go through one
+            # multi-record create each
+            bulk_creators = {
+                self.SO_MODEL: self.create_sale_orders_bulk,
+                self.PO_MODEL: self.create_purchase_orders_bulk,
+            }
+            groups: dict[str, list[int]] = defaultdict(list)
+            for i, doc in enumerate(documents):
+                doc_type = doc.get("document_type", "sale.order")
+                if doc_type in bulk_creators:
+                    groups[doc_type].append(i)
+            bulk_groups = {t: idx for t, idx in groups.items() if len(idx) > 1}
+            bulk_indexes = {i for idx in bulk_groups.values() for i in idx}
+            others = [doc for i, doc in enumerate(documents) if i not in bulk_indexes]
+
+            def create_bulk(doc_type: str) -> list[OperationResult]:
+                return bulk_creators[doc_type](
+                    [documents[i] for i in bulk_groups[doc_type]], metadata, meta_html
+                )
+
+            if len(documents) <= 1 or max_workers <= 1:
+                bulk_results = {t: create_bulk(t) for t in bulk_groups}
+                other_results = [create(doc) for doc in others]
+            else:
+                # Order batches run alongside the other documents
+                with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                    futures = {t: pool.submit(create_bulk, t) for t in bulk_groups}
+                    other_results = list(pool.map(create, others))
+                    bulk_results = {t: f.result() for t, f in futures.items()}
+
+            by_index: dict[int, OperationResult] = {}
+            for doc_type, indexes in bulk_groups.items():
+                by_index.update(zip(indexes, bulk_results[doc_type]))
+            by_index.update(zip(
+                (i for i in range(len(documents)) if i not in bulk_indexes),
+                other_results,
+            ))
+            results = [by_index[i] for i in range(len(documents))]
+        finally:
+            # Flush even on error: the documents already created are documented
+            chatter, self._creation_chatter = self._creation_chatter, None
+            self._unnamed_records = None
+            chatter.flush()
+
+        self._fill_record_names(results, unnamed)
+        return results
 
     # --- Confirmation Methods ---
 
@@ -1192,65 +2220,101 @@ class DocumentCreationOperations(BaseOperation):
         Returns:
             OperationResult
         """
-        if self.dry_run:
-            return OperationResult.skipped(
-                record_id=record_id,
-                model=document_type,
-                reason=f"Dry run: would confirm {document_type} {record_id}",
-            )
+        return self.confirm_documents(document_type, [record_id])[0]
 
-        try:
-            if document_type == "sale.order":
-                # Confirm quotation → sales order
-                self.odoo.execute(self.SO_MODEL, "action_confirm", [[record_id]])
-                self.log.success(record_id, f"Confirmed sale.order {record_id}")
-                return OperationResult.ok(
-                    record_id=record_id,
-                    model=self.SO_MODEL,
-                    action="confirm",
-                    message=f"Confirmed sale.order {record_id}",
-                )
+    def confirm_documents(
+        self,
+        document_type: str,
+        record_ids: list[int],
+    ) -> list[OperationResult]:
+        """
+        Confirm many documents of one type with a single call.
 
-            elif document_type == "stock.picking":
-                # Reserve stock (action_assign)
-                # Note: button_validate() would fully validate, but that requires
-                # stock availability and lot/serial assignment
-                self.odoo.execute(self.PICKING_MODEL, "action_assign", [[record_id]])
-                self.log.success(record_id, f"Reserved stock for picking {record_id}")
-                return OperationResult.ok(
-                    record_id=record_id,
-                    model=self.PICKING_MODEL,
-                    action="confirm",
-                    message=f"Reserved stock for picking {record_id}",
-                )
+        The confirm methods act on recordsets, so all records are confirmed
+        in one RPC. Odoo runs it as one transaction; if it fails, records
+        are confirmed one by one so a single bad record only fails itself.
 
-            elif document_type == "purchase.order":
-                # Confirm RFQ → purchase order
-                self.odoo.execute(self.PO_MODEL, "button_confirm", [[record_id]])
-                self.log.success(record_id, f"Confirmed purchase.order {record_id}")
-                return OperationResult.ok(
+        Args:
+            document_type: Type of document (sale.order, stock.picking, purchase.order)
+            record_ids: Record IDs to confirm
+
+        Returns:
+            One OperationResult per record ID, in order
+        """
+        if self.dry_run:
+            return [
+                OperationResult.skipped(
                     record_id=record_id,
-                    model=self.PO_MODEL,
-                    action="confirm",
-                    message=f"Confirmed purchase.order {record_id}",
+                    model=document_type,
+                    reason=f"Dry run: would confirm {document_type} {record_id}",
                 )
+                for record_id in record_ids
+            ]
 
-            else:
-                return OperationResult.fail(
+        confirm = self._CONFIRM_METHODS.get(document_type)
+        if confirm is None:
+            return [
+                OperationResult.fail(
                     record_id=record_id,
                     model=document_type,
                     action="confirm",
                     error=f"Unknown document type for confirmation: {document_type}",
                 )
+                for record_id in record_ids
+            ]
+        if not record_ids:
+            return []
 
+        method, done = confirm
+        try:
+            self.odoo.execute(document_type, method, [record_ids])
         except Exception as e:
+            if len(record_ids) > 1:
+                self.log.warning(
+                    f"Batch {method} on {document_type} failed, retrying one by one: {e}"
+                )
+                return [
+                    self.confirm_documents(document_type, [record_id])[0]
+                    for record_id in record_ids
+                ]
+            record_id = record_ids[0]
             self.log.error(f"Failed to confirm {document_type} {record_id}: {e}")
-            return OperationResult.fail(
+            return [
+                OperationResult.fail(
+                    record_id=record_id,
+                    model=document_type,
+                    action="confirm",
+                    error=str(e),
+                )
+            ]
+
+        results: list[OperationResult] = []
+        for record_id in record_ids:
+            message = f"{done} {record_id}"
+            self.log.success(record_id, message)
+            results.append(OperationResult.ok(
                 record_id=record_id,
                 model=document_type,
                 action="confirm",
-                error=str(e),
-            )
+                message=message,
+            ))
+        return results
+
+    def _creation_meta_html(self, metadata: dict) -> str:
+        """
+        Build the metadata list items of the creation message.
+
+        Args:
+            metadata: Creation metadata
+
+        Returns:
+            HTML list items
+        """
+        return "\n".join(
+            f"<li><strong>{label}:</strong> {metadata[key]}</li>"
+            for key, label in self._CREATION_META_LABELS
+            if metadata.get(key)
+        ) or "<li>N/A</li>"
 
     def _post_creation_message(
         self,
@@ -1258,48 +2322,37 @@ class DocumentCreationOperations(BaseOperation):
         record_id: int,
         metadata: dict,
         line_count: int,
-    ) -> OperationResult:
+        meta_html: Optional[str] = None,
+    ) -> Optional[OperationResult]:
         """
         Post a chatter message documenting the creation.
 
+        During create_documents the message is buffered and posted with
+        the rest of the batch instead.
+
         Args:
             model: Odoo model name
             record_id: Record ID
             metadata: Creation metadata
             line_count: Number of lines created
+            meta_html: Metadata fragment built once by a batch driver;
+                built from metadata when not given
 
         Returns:
-            OperationResult
+            OperationResult, or None when the message was buffered
         """
-        request_id = self.ctx.request_id if self.ctx else "N/A"
-
-        # Build metadata details
-        meta_items = []
-        if metadata.get("source"):
-            meta_items.append(f"<li><strong>Source:</strong> {metadata['source']}</li>")
-        if metadata.get("owner"):
-            meta_items.append(f"<li><strong>Owner:</strong> {metadata['owner']}</li>")
-        if metadata.get("filename"):
-            meta_items.append(
-                f"<li><strong>File:</strong> {metadata['filename']}</li>"
-            )
-        if metadata.get("origin_folder"):
-            meta_items.append(
-                f"<li><strong>Folder:</strong> {metadata['origin_folder']}</li>"
-            )
-
-        meta_html = "\n".join(meta_items) if meta_items else "<li>N/A</li>"
+        if meta_html is None:
+            meta_html = self._creation_meta_html(metadata)
+        body = CREATION_MESSAGE_TEMPLATE.substitute(
+            line_count=line_count,
+            meta_html=meta_html,
+            request_id=self.request_id,
+        )
 
-        body = f"""<div style="font-family: Arial, sans-serif; line-height: 1.6;">
-    <p><strong>Sentinel-Ops: Document Created</strong></p>
-    <ul style="margin: 10px 0; padding-left: 20px;">
-        <li><strong>Lines:</strong> {line_count}</li>
-        {meta_html}
-    </ul>
-    <p style="color: #666; font-size: 0.9em;">
-        Request ID: {request_id}
-    </p>
-</div>"""
+        chatter = self._creation_chatter
+        if chatter is not None:
+            chatter.add(model, record_id, body)
+            return None
 
         return self._safe_message_post(
             model=model,
@@ -4,15 +4,61 @@ Order Operations
 Operations related to sale orders and order lines.
 """
 
+import itertools
 import logging
+import random
+import string
+from collections import defaultdict
+from dataclasses import replace
 from datetime import datetime, timedelta
-from typing import Optional
+from operator import itemgetter, lt, ne
+from typing import Callable, Iterable, Optional
 
 from core.operations.base import BaseOperation
 from core.result import OperationResult
 
 logger = logging.getLogger(__name__)
 
+# (qty_delivered, product_uom_qty) of a line dict in one C-level call, for the
+# per-row quantity filters that run over every candidate line. These stay in
+# plain Python on purpose: decoding the XML-RPC rows costs far more than the
+# comparisons, and converting the rows to arrays would add a full extra pass.
+_delivered_and_ordered = itemgetter("qty_delivered", "product_uom_qty")
+
+# Chatter bodies, filled in with string.Template.substitute
+QTY_ADJUSTMENT_MESSAGE_TEMPLATE = string.Template(
+    """<div style="font-family: Arial, sans-serif; line-height: 1.6;">
+    <p><strong>Sentinel-Ops: Order Quantity Adjustment</strong></p>
+    <p><strong>Action:</strong> Adjusted $line_count line(s) to match actual fulfillment</p>
+    <p><strong>Formula:</strong> new_qty = delivered + pending_moves</p>
+    <p><strong>Lines adjusted:</strong></p>
+    <ul style="margin: 10px 0; padding-left: 20px;">
+        $line_items
+    </ul>
+    <p style="color: #666; font-size: 0.9em;">
+        Request ID: $request_id
+    </p>
+</div>"""
+)
+QTY_LINE_TEMPLATE = string.Template("<li>$name: $old → $target</li>")
+QTY_LINE_WITH_MOVES_TEMPLATE = string.Template(
+    "<li>$name: $old → $target (delivered: $delivered + pending: $open_moves)</li>"
+)
+
+SHIPPING_COMPLETION_MESSAGE_TEMPLATE = string.Template(
+    """<div style="font-family: Arial, sans-serif; line-height: 1.6;">
+    <p><strong>Sentinel-Ops: Shipping Line Completion</strong></p>
+    <ul style="margin: 10px 0; padding-left: 20px;">
+        <li><strong>Order:</strong> $order_name</li>
+        <li><strong>Action:</strong> Auto-completed $lines_completed shipping line(s)</li>
+        <li><strong>Reason:</strong> Only pending items were shipping fees</li>
+    </ul>
+    <p style="color: #666; font-size: 0.9em;">
+        Request ID: $request_id
+    </p>
+</div>"""
+)
+
 
 class OrderOperations(BaseOperation):
     """
@@ -29,6 +75,15 @@ class OrderOperations(BaseOperation):
     SO_LINE_MODEL = "sale.order.line"
     SO_MODEL = "sale.order"
 
+    # Default get_order_details projection (pass fields for anything else)
+    ORDER_DETAIL_FIELDS = ["id", "name", "state", "partner_id", "date_order"]
+
+    # Lines per search_read page when scanning partial deliveries without a limit
+    PARTIAL_SCAN_PAGE_SIZE = 2000
+
+    # Slack when comparing server-side quantity sums, which accumulate float error
+    QTY_SUM_EPSILON = 1e-6
+
     def find_partial_orders_older_than(
         self,
         days: int = 30,
@@ -50,8 +105,7 @@ class OrderOperations(BaseOperation):
         Returns:
             List of order line dicts with id, order_id, product_uom_qty, qty_delivered
         """
-        cutoff_date = datetime.utcnow() - timedelta(days=days)
-        cutoff_str = cutoff_date.strftime("%Y-%m-%d")
+        cutoff_str = (datetime.utcnow().date() - timedelta(days=days)).isoformat()
 
         # Note: Odoo domains can't compare two fields directly (qty_delivered < product_uom_qty)
         # So we fetch lines with qty_delivered > 0 and filter in Python
@@ -65,49 +119,61 @@ class OrderOperations(BaseOperation):
             "name",
         ]
 
-        kwargs = {}
-        if limit:
-            kwargs["limit"] = limit
-
         self.log.info(
             f"Searching for partial order lines older than {days} days",
             data={"cutoff": cutoff_str},
         )
 
         try:
-            # First, get orders older than cutoff in sale state
-            orders = self.odoo.search(
-                self.SO_MODEL,
-                [
-                    ("state", "=", "sale"),
-                    ("date_order", "<", cutoff_str),
-                ],
-            )
+            # Find lines with partial delivery on old confirmed orders. The order
+            # criteria use dot notation so the server joins sale_order itself,
+            # instead of us sending back a (potentially huge) list of order ids.
+            # Candidates are read in id-ordered pages and filtered page by page,
+            # so only the partial lines are kept in memory. With a limit, pages
+            # are small and reading stops once enough partial lines are found:
+            # most lines on old orders are fully delivered.
+            line_domain = [
+                ("order_id.state", "=", "sale"),
+                ("order_id.date_order", "<", cutoff_str),
+                ("qty_delivered", ">", 0),
+            ]
+            page_size = max(limit * 2, 200) if limit else self.PARTIAL_SCAN_PAGE_SIZE
+            offset = 0
+            total_checked = 0
+            partial_lines: list[dict] = []
 
-            if not orders:
-                self.log.info("No orders found in date range")
-                return []
+            while True:
+                lines = self.odoo.search_read(
+                    self.SO_LINE_MODEL,
+                    line_domain,
+                    fields=fields,
+                    offset=offset,
+                    limit=page_size,
+                    order="id",
+                )
+                total_checked += len(lines)
 
-            # Then find lines with partial delivery
-            lines = self.odoo.search_read(
-                self.SO_LINE_MODEL,
-                [
-                    ("order_id", "in", orders),
-                    ("qty_delivered", ">", 0),
-                ],
-                fields=fields,
-                **kwargs,
-            )
+                # Filter to only partial deliveries
+                partial_lines.extend(
+                    line for line in lines
+                    if lt(*_delivered_and_ordered(line))
+                )
 
-            # Filter to only partial deliveries
-            partial_lines = [
-                line for line in lines
-                if line["qty_delivered"] < line["product_uom_qty"]
-            ]
+                if len(lines) < page_size or (limit and len(partial_lines) >= limit):
+                    break
+                offset += page_size
+
+            if limit:
+                partial_lines = partial_lines[:limit]
+
+            for line in partial_lines:
+                order = line["order_id"]
+                order_name = order[1] if isinstance(order, (list, tuple)) else None
+                line["_record_name"] = self._line_record_name(line, order_name)
 
             self.log.info(
                 f"Found {len(partial_lines)} partial order lines",
-                data={"total_checked": len(lines)},
+                data={"total_checked": total_checked},
             )
 
             return partial_lines
@@ -119,6 +185,27 @@ class OrderOperations(BaseOperation):
             )
             raise
 
+    @staticmethod
+    def _line_record_name(line: dict, order_name: Optional[str] = None) -> str:
+        """
+        Display name of an order line for results ("S00455346/Line name").
+
+        The find_* methods store it on each line they return as
+        "_record_name"; lines from elsewhere get it computed here.
+
+        Args:
+            line: Order line dict with id and optionally name/_record_name
+            order_name: Display name of the parent order
+
+        Returns:
+            Record name string
+        """
+        record_name = line.get("_record_name")
+        if record_name:
+            return record_name
+        line_name = line.get("name", "") or f"Line #{line['id']}"
+        return f"{order_name}/{line_name}" if order_name else line_name
+
     def adjust_line_qty_to_delivered(
         self,
         line: dict,
@@ -136,8 +223,7 @@ class OrderOperations(BaseOperation):
         """
         line_id = line["id"]
         delivered_qty = line["qty_delivered"]
-        line_name = line.get("name", "") or f"Line #{line_id}"
-        record_name = f"{order_name}/{line_name}" if order_name else line_name
+        record_name = self._line_record_name(line, order_name)
 
         return self._safe_write(
             model=self.SO_LINE_MODEL,
@@ -208,7 +294,7 @@ class OrderOperations(BaseOperation):
             Order dict or None if not found
         """
         if fields is None:
-            fields = ["id", "name", "state", "partner_id", "date_order", "amount_total"]
+            fields = self.ORDER_DETAIL_FIELDS
 
         try:
             orders = self.odoo.read(self.SO_MODEL, [order_id], fields)
@@ -254,7 +340,7 @@ class OrderOperations(BaseOperation):
         """
         self.log.info(
             "Searching for orders with only shipping pending",
-            data={
+            data=lambda: {
                 "shipping_product_ids": shipping_product_ids,
                 "limit": limit,
                 "order_ids": order_ids,
@@ -280,59 +366,85 @@ class OrderOperations(BaseOperation):
             # Filter to only pending shipping lines (qty_delivered < product_uom_qty)
             pending_shipping = [
                 line for line in shipping_lines
-                if line["qty_delivered"] < line["product_uom_qty"]
+                if lt(*_delivered_and_ordered(line))
             ]
 
             if not pending_shipping:
                 self.log.info("No pending shipping lines found")
                 return []
 
-            # Group by order_id
-            order_shipping_map: dict[int, list[dict]] = {}
+            # Group by order_id, taking the order name from the many2one (id, name) pair
+            order_shipping_map: dict[int, list[dict]] = defaultdict(list)
+            order_names: dict[int, str] = {}
             for line in pending_shipping:
-                oid = line["order_id"][0] if isinstance(line["order_id"], (list, tuple)) else line["order_id"]
-                if oid not in order_shipping_map:
-                    order_shipping_map[oid] = []
+                order = line["order_id"]
+                if type(order) is int:
+                    oid = order
+                else:
+                    oid, order_names[oid] = order
                 order_shipping_map[oid].append(line)
 
             self.log.info(
                 f"Found {len(pending_shipping)} pending shipping lines across {len(order_shipping_map)} orders",
             )
 
-            # Step 2: For each order, check if any non-shipping lines are pending
-            qualifying_orders = []
+            # Step 2a: Total non-shipping quantities per order on the server. An
+            # order delivered short of its ordered total surely has a pending line;
+            # only the others need their lines checked one by one.
+            totals = self.odoo.read_group(
+                self.SO_LINE_MODEL,
+                [
+                    ("order_id", "in", list(order_shipping_map)),
+                    ("product_id", "not in", shipping_product_ids),
+                ],
+                ["order_id", "product_uom_qty:sum", "qty_delivered:sum"],
+                ["order_id"],
+                lazy=False,
+            )
+            pending_per_order: dict[int, int] = defaultdict(int)
+            for group in totals:
+                if group["product_uom_qty"] - group["qty_delivered"] > self.QTY_SUM_EPSILON:
+                    pending_per_order[group["order_id"][0]] += 1
+
+            # Step 2b: Count pending non-shipping lines for the remaining orders
+            # (Odoo domains can't compare two fields directly, so filter in Python).
+            # Only ids are needed here, so order_id comes back as a bare int.
+            to_verify = [oid for oid in order_shipping_map if not pending_per_order[oid]]
+            non_shipping_lines = self.odoo.search_read(
+                self.SO_LINE_MODEL,
+                [
+                    ("order_id", "in", to_verify),
+                    ("product_id", "not in", shipping_product_ids),
+                ],
+                fields=["order_id", "product_uom_qty", "qty_delivered"],
+                load="_classic_write",
+            ) if to_verify else []
 
-            for order_id, shipping_lines_for_order in order_shipping_map.items():
-                # Fetch all non-shipping lines and filter in Python
-                # (Odoo domains can't compare two fields directly)
-                non_shipping_lines = self.odoo.search_read(
-                    self.SO_LINE_MODEL,
-                    [
-                        ("order_id", "=", order_id),
-                        ("product_id", "not in", shipping_product_ids),
-                    ],
-                    fields=["id", "product_uom_qty", "qty_delivered"],
-                )
+            for line in non_shipping_lines:
+                if lt(*_delivered_and_ordered(line)):
+                    pending_per_order[line["order_id"]] += 1
 
-                # Count lines where qty_delivered < product_uom_qty
-                pending_non_shipping_count = sum(
-                    1 for line in non_shipping_lines
-                    if line["qty_delivered"] < line["product_uom_qty"]
-                )
+            qualifying_ids = [oid for oid in order_shipping_map if pending_per_order[oid] == 0]
+            if limit:
+                qualifying_ids = qualifying_ids[:limit]
 
-                if pending_non_shipping_count == 0:
-                    # Get order name
-                    order = self.get_order_details(order_id, fields=["id", "name"])
-                    order_name = order["name"] if order else f"Order #{order_id}"
+            # Bare ids carry no name: read the qualifying ones missing it in one call
+            unnamed = [oid for oid in qualifying_ids if oid not in order_names]
+            if unnamed:
+                for order in self.odoo.read(self.SO_MODEL, unnamed, ["id", "name"]):
+                    order_names[order["id"]] = order["name"]
 
-                    qualifying_orders.append({
-                        "order_id": order_id,
-                        "order_name": order_name,
-                        "pending_shipping_lines": shipping_lines_for_order,
-                    })
-
-                    if limit and len(qualifying_orders) >= limit:
-                        break
+            qualifying_orders = []
+            for order_id in qualifying_ids:
+                order_name = order_names.get(order_id, f"Order #{order_id}")
+                shipping_lines_for_order = order_shipping_map[order_id]
+                for line in shipping_lines_for_order:
+                    line["_record_name"] = self._line_record_name(line, order_name)
+                qualifying_orders.append({
+                    "order_id": order_id,
+                    "order_name": order_name,
+                    "pending_shipping_lines": shipping_lines_for_order,
+                })
 
             self.log.info(
                 f"Found {len(qualifying_orders)} orders where only shipping is pending",
@@ -367,8 +479,7 @@ class OrderOperations(BaseOperation):
         line_id = line["id"]
         target_qty = line["product_uom_qty"]
         # Use line name or order name for record identification
-        line_name = line.get("name", "") or f"Line #{line_id}"
-        record_name = f"{order_name}/{line_name}" if order_name else line_name
+        record_name = self._line_record_name(line, order_name)
 
         return self._safe_write(
             model=self.SO_LINE_MODEL,
@@ -379,6 +490,37 @@ class OrderOperations(BaseOperation):
             silent=silent,
         )
 
+    def complete_shipping_lines_bulk(
+        self,
+        lines: list[dict],
+        order_name: Optional[str] = None,
+    ) -> list[OperationResult]:
+        """
+        Complete several shipping lines (qty_delivered = product_uom_qty).
+
+        Lines with the same ordered quantity are written together; shipping
+        lines are nearly always 1.0, so a whole run of orders typically
+        costs a single write. A failed group is retried line by line.
+
+        Args:
+            lines: Order line dicts with id, product_uom_qty (and _record_name
+                   from find_orders_with_only_shipping_pending)
+            order_name: Display name of the parent order, for lines without
+                        a precomputed record name
+
+        Returns:
+            List of OperationResult, one per line, in input order
+        """
+        return self._write_lines_grouped(
+            lines,
+            field="qty_delivered",
+            value_of=itemgetter("product_uom_qty"),
+            action="complete_shipping_line",
+            write_one=lambda line: self.complete_shipping_line(line, order_name=order_name),
+            data_of=lambda data, line, qty: data,
+            order_name=order_name,
+        )
+
     # --- Closed/Delivered order quantity adjustment operations ---
 
     # AH Status values for delivered/closed orders
@@ -473,19 +615,25 @@ class OrderOperations(BaseOperation):
         15191,  # Down payment
     ]
 
-    # Combined list of ALL virtual products to exclude
-    DEFAULT_EXCLUDE_PRODUCT_IDS = (
-        DEFAULT_SHIPPING_PRODUCT_IDS +
-        DEFAULT_DISCOUNT_PRODUCT_IDS +
-        DEFAULT_GIFT_CARD_PRODUCT_IDS +
-        DEFAULT_CHARGEBACK_PRODUCT_IDS +
-        DEFAULT_TIP_PRODUCT_IDS +
-        DEFAULT_DUTIES_PRODUCT_IDS +
-        DEFAULT_COMMISSION_PRODUCT_IDS +
-        DEFAULT_OTHER_FEE_PRODUCT_IDS
-    )
+    # Combined set of ALL virtual products to exclude
+    DEFAULT_EXCLUDE_PRODUCT_IDS = frozenset(itertools.chain(
+        DEFAULT_SHIPPING_PRODUCT_IDS,
+        DEFAULT_DISCOUNT_PRODUCT_IDS,
+        DEFAULT_GIFT_CARD_PRODUCT_IDS,
+        DEFAULT_CHARGEBACK_PRODUCT_IDS,
+        DEFAULT_TIP_PRODUCT_IDS,
+        DEFAULT_DUTIES_PRODUCT_IDS,
+        DEFAULT_COMMISSION_PRODUCT_IDS,
+        DEFAULT_OTHER_FEE_PRODUCT_IDS,
+    ))
     # fmt: on
 
+    # XML-RPC can't marshal sets: the domain gets this list, built once
+    _DEFAULT_EXCLUDE_PRODUCT_ID_LIST = sorted(DEFAULT_EXCLUDE_PRODUCT_IDS)
+
+    # Line fields only needed once a line is known to need adjusting
+    _LINE_DETAIL_FIELDS = ["name", "product_id"]
+
     def find_closed_orders_with_qty_mismatch(
         self,
         ah_statuses: Optional[list[str]] = None,
@@ -493,7 +641,7 @@ class OrderOperations(BaseOperation):
         order_ids: Optional[list[int]] = None,
         days: Optional[int] = None,
         order_name_pattern: Optional[str] = None,
-        exclude_product_ids: Optional[list[int]] = None,
+        exclude_product_ids: Optional[Iterable[int]] = None,
     ) -> tuple[list[dict], dict]:
         """
         Find orders where ah_status is delivered/cancelled/closed but line quantities don't match.
@@ -522,11 +670,13 @@ class OrderOperations(BaseOperation):
 
         # Default: exclude virtual products (shipping + discounts)
         if exclude_product_ids is None:
-            exclude_product_ids = self.DEFAULT_EXCLUDE_PRODUCT_IDS
+            exclude_product_ids = self._DEFAULT_EXCLUDE_PRODUCT_ID_LIST
+        else:
+            exclude_product_ids = list(exclude_product_ids)
 
         self.log.info(
             "Searching for closed orders with qty mismatch",
-            data={
+            data=lambda: {
                 "ah_statuses": ah_statuses,
                 "limit": limit,
                 "order_ids": order_ids,
@@ -542,6 +692,7 @@ class OrderOperations(BaseOperation):
             line_domain = [
                 ("order_id.ah_status", "in", ah_statuses),
                 ("order_id.state", "=", "sale"),  # Only confirmed orders (not draft/sent/cancel)
+                ("qty_delivered", ">=", 0),  # Safety: never adjust towards a negative qty
             ]
 
             # Exclude virtual products (shipping, discounts, etc.)
@@ -553,62 +704,89 @@ class OrderOperations(BaseOperation):
                 line_domain.append(("order_id", "in", order_ids))
 
             if days:
-                cutoff_date = datetime.utcnow() - timedelta(days=days)
-                cutoff_str = cutoff_date.strftime("%Y-%m-%d")
+                cutoff_str = (datetime.utcnow().date() - timedelta(days=days)).isoformat()
                 line_domain.append(("order_id.date_order", ">=", cutoff_str))
 
             if order_name_pattern:
                 line_domain.append(("order_id.name", "=ilike", order_name_pattern))
 
-            # Single query: get all candidate lines with order info
+            # Single query: get all candidate lines with order info. Only the
+            # fields the mismatch filter needs; details are read for survivors below.
+            # Ordered by order so each order's lines arrive as one contiguous run.
+            # order_id comes back as a bare id (no per-line name_get on the server);
+            # names are read once for the orders kept below
             all_lines = self.odoo.search_read(
                 self.SO_LINE_MODEL,
                 line_domain,
-                fields=["id", "name", "product_id", "product_uom_qty", "qty_delivered", "order_id"],
+                fields=["id", "product_uom_qty", "qty_delivered", "order_id"],
+                order="order_id, id",
+                load="_classic_write",
             )
 
             lines_from_query = len(all_lines)
             self.log.info(f"Fetched {lines_from_query} candidate lines")
 
-            # Filter in Python for qty mismatch (can't compare fields in Odoo domain)
-            # Also exclude negative qty_delivered (safety)
-            from collections import defaultdict
-            lines_by_order: dict[int, list[dict]] = defaultdict(list)
-            order_names: dict[int, str] = {}
-
-            for line in all_lines:
-                if (line["qty_delivered"] != line["product_uom_qty"]
-                        and line["qty_delivered"] >= 0):
-                    # Extract order_id and name from the tuple (id, name)
-                    order_id, order_name = line["order_id"]
-                    lines_by_order[order_id].append(line)
-                    order_names[order_id] = order_name
-
-            # Count mismatched lines for discovery stats
-            lines_with_mismatch = sum(len(lines) for lines in lines_by_order.values())
+            # Filter in Python for qty mismatch (can't compare fields in Odoo domain);
+            # every other predicate is already applied in the domain above
+            ah_status = ah_statuses[0] if len(ah_statuses) == 1 else "mixed"
+            orders_map: dict[int, dict] = {}
+            lines_with_mismatch = 0
+
+            # Group runs of lines per order; the map lookup is per run, not per
+            # line, and still merges correctly if an order's lines aren't contiguous
+            for order_id, group in itertools.groupby(
+                all_lines, key=itemgetter("order_id")
+            ):
+                mismatched = [
+                    line for line in group
+                    if ne(*_delivered_and_ordered(line))
+                ]
+                if not mismatched:
+                    continue
+                lines_with_mismatch += len(mismatched)
+                entry = orders_map.get(order_id)
+                if entry is None:
+                    orders_map[order_id] = {
+                        "order_id": order_id,
+                        "order_name": f"Order #{order_id}",
+                        "ah_status": ah_status,
+                        "mismatched_lines": mismatched,
+                    }
+                else:
+                    entry["mismatched_lines"].extend(mismatched)
 
-            # Build result list
-            qualifying_orders = []
-            for order_id, mismatched_lines in lines_by_order.items():
-                qualifying_orders.append({
-                    "order_id": order_id,
-                    "order_name": order_names[order_id],
-                    "ah_status": ah_statuses[0] if len(ah_statuses) == 1 else "mixed",
-                    "mismatched_lines": mismatched_lines,
-                })
+            qualifying_orders = list(orders_map.values())
 
             total_orders_before_limit = len(qualifying_orders)
 
-            # Randomize order to avoid always processing the same orders first
-            import random
-            random.shuffle(qualifying_orders)
-
-            # Apply limit after shuffle
+            # Apply limit on a random sample to avoid always processing the same
+            # orders first (picks `limit` orders without shuffling the whole list)
             limit_reached = False
             if limit and len(qualifying_orders) > limit:
-                qualifying_orders = qualifying_orders[:limit]
+                qualifying_orders = random.sample(qualifying_orders, limit)
                 limit_reached = True
 
+            # Fetch order names and line details only for what we'll actually process
+            if qualifying_orders:
+                entries = {order["order_id"]: order for order in qualifying_orders}
+                for order in self.odoo.read(self.SO_MODEL, list(entries), ["name"]):
+                    entries[order["id"]]["order_name"] = order["name"]
+
+            lines_by_id = {
+                line["id"]: line
+                for order in qualifying_orders
+                for line in order["mismatched_lines"]
+            }
+            if lines_by_id:
+                for details in self.odoo.read(
+                    self.SO_LINE_MODEL, list(lines_by_id), self._LINE_DETAIL_FIELDS
+                ):
+                    lines_by_id[details["id"]].update(details)
+
+            for order in qualifying_orders:
+                for line in order["mismatched_lines"]:
+                    line["_record_name"] = self._line_record_name(line, order["order_name"])
+
             # Build discovery stats for KPI tracking
             discovery_stats = {
                 "lines_from_query": lines_from_query,
@@ -620,7 +798,7 @@ class OrderOperations(BaseOperation):
             self.log.info(
                 f"Found {len(qualifying_orders)} orders with qty mismatches "
                 f"(total: {total_orders_before_limit}, limit: {limit}, reached: {limit_reached})",
-                data={
+                data=lambda: {
                     "discovery": discovery_stats,
                     "orders_after_limit": len(qualifying_orders),
                     "total_mismatched_lines_after_limit": sum(len(o["mismatched_lines"]) for o in qualifying_orders),
@@ -661,8 +839,7 @@ class OrderOperations(BaseOperation):
         line_id = line["id"]
         old_qty = line["product_uom_qty"]
         new_qty = target_qty if target_qty is not None else line["qty_delivered"]
-        line_name = line.get("name", "") or f"Line #{line_id}"
-        record_name = f"{order_name}/{line_name}" if order_name else line_name
+        record_name = self._line_record_name(line, order_name)
 
         # Safety: never set quantities below 0
         if new_qty < 0:
@@ -683,14 +860,127 @@ class OrderOperations(BaseOperation):
         )
 
         # Add old/new qty to result data for tracking
-        if result.data:
-            result.data["old_qty"] = old_qty
-            result.data["new_qty"] = new_qty
-        else:
-            result.data = {"old_qty": old_qty, "new_qty": new_qty}
-
+        result.data = self._qty_adjustment_data(result.data, old_qty, new_qty)
         return result
 
+    @staticmethod
+    def _qty_adjustment_data(base: Optional[dict], old_qty: float, new_qty: float) -> dict:
+        """
+        Build the result data for a quantity adjustment.
+
+        The payload stays a plain dict (OperationResult.data is serialized
+        as-is into KPIs and logs); it is built in one step on top of the
+        write's own data rather than created and then mutated.
+
+        Args:
+            base: Data from the underlying write result, if any
+            old_qty: product_uom_qty before the adjustment
+            new_qty: product_uom_qty after the adjustment
+
+        Returns:
+            Result data dict with old_qty and new_qty
+        """
+        return {**base, "old_qty": old_qty, "new_qty": new_qty} if base else {
+            "old_qty": old_qty,
+            "new_qty": new_qty,
+        }
+
+    def adjust_lines_qty_to_delivered_bulk(
+        self,
+        lines: list[dict],
+        order_name: Optional[str] = None,
+    ) -> list[OperationResult]:
+        """
+        Adjust several order lines to their delivered quantity.
+
+        Lines sharing the same delivered quantity are written together, so
+        an order costs one write per distinct quantity instead of one per
+        line. If a grouped write fails, its lines are retried one by one so
+        a single bad line doesn't fail its siblings.
+
+        Args:
+            lines: Order line dicts with id, qty_delivered, product_uom_qty
+            order_name: Display name of the parent order
+
+        Returns:
+            List of OperationResult, one per line, in input order
+        """
+        return self._write_lines_grouped(
+            lines,
+            field="product_uom_qty",
+            # Negative targets are never grouped; they come back as skipped
+            value_of=lambda line: line["qty_delivered"] if line["qty_delivered"] >= 0 else None,
+            action="adjust_qty",
+            write_one=lambda line: self.adjust_line_qty_to_delivered_qty(line, order_name=order_name),
+            data_of=lambda data, line, qty: self._qty_adjustment_data(data, line["product_uom_qty"], qty),
+            order_name=order_name,
+        )
+
+    def _write_lines_grouped(
+        self,
+        lines: list[dict],
+        field: str,
+        value_of: Callable[[dict], Optional[float]],
+        action: str,
+        write_one: Callable[[dict], OperationResult],
+        data_of: Callable[[Optional[dict], dict, float], Optional[dict]],
+        order_name: Optional[str] = None,
+    ) -> list[OperationResult]:
+        """
+        Write one field on many order lines, one write per distinct value.
+
+        Lines whose value is None, lines alone in their group, and lines of
+        a group whose write fails go through write_one individually.
+
+        Args:
+            lines: Order line dicts with id
+            field: sale.order.line field to write
+            value_of: Target value for a line, or None to write it alone
+            action: Action name for the grouped write and its results
+            write_one: Single-line operation used for ungrouped lines
+            data_of: Result data for a line, from (write data, line, value)
+            order_name: Display name of the parent order, for record names
+
+        Returns:
+            List of OperationResult, one per line, in input order
+        """
+        results: dict[int, OperationResult] = {}
+        by_value: dict[float, list[tuple[int, dict]]] = defaultdict(list)
+
+        for index, line in enumerate(lines):
+            value = value_of(line)
+            if value is None:
+                results[index] = write_one(line)
+            else:
+                by_value[value].append((index, line))
+
+        for value, group in by_value.items():
+            if len(group) == 1:
+                index, line = group[0]
+                results[index] = write_one(line)
+                continue
+
+            batch = self._safe_write(
+                model=self.SO_LINE_MODEL,
+                ids=[line["id"] for _, line in group],
+                values={field: value},
+                action=action,
+                silent=True,
+            )
+
+            for index, line in group:
+                if not batch.success:
+                    results[index] = write_one(line)
+                    continue
+                results[index] = replace(
+                    batch,
+                    record_id=line["id"],
+                    record_name=self._line_record_name(line, order_name),
+                    data=data_of(batch.data, line, value),
+                )
+
+        return [results[index] for index in range(len(lines))]
+
     def post_qty_adjustment_message(
         self,
         order_id: int,
@@ -708,35 +998,27 @@ class OrderOperations(BaseOperation):
         Returns:
             OperationResult
         """
-        request_id = self.ctx.request_id if self.ctx else "N/A"
-
-        # Build line details HTML
-        line_details = ""
+        line_items = []
         for line in adjusted_lines:
-            line_name = line.get("name", f"Line #{line['id']}")
-            old_qty = line.get("product_uom_qty", "?")
             delivered = line.get("qty_delivered", 0)
             open_moves = line.get("_open_move_qty", 0)
-            target = line.get("_target_qty", delivered)
-
-            if open_moves > 0:
-                # Show breakdown: delivered + open moves = target
-                line_details += f"<li>{line_name}: {old_qty} → {target} (delivered: {delivered} + pending: {open_moves})</li>\n"
-            else:
-                line_details += f"<li>{line_name}: {old_qty} → {target}</li>\n"
-
-        body = f"""<div style="font-family: Arial, sans-serif; line-height: 1.6;">
-    <p><strong>Sentinel-Ops: Order Quantity Adjustment</strong></p>
-    <p><strong>Action:</strong> Adjusted {len(adjusted_lines)} line(s) to match actual fulfillment</p>
-    <p><strong>Formula:</strong> new_qty = delivered + pending_moves</p>
-    <p><strong>Lines adjusted:</strong></p>
-    <ul style="margin: 10px 0; padding-left: 20px;">
-        {line_details}
-    </ul>
-    <p style="color: #666; font-size: 0.9em;">
-        Request ID: {request_id}
-    </p>
-</div>"""
+            # Show breakdown when open moves count: delivered + open moves = target
+            template = (
+                QTY_LINE_WITH_MOVES_TEMPLATE if open_moves > 0 else QTY_LINE_TEMPLATE
+            )
+            line_items.append(template.substitute(
+                name=line.get("name", f"Line #{line['id']}"),
+                old=line.get("product_uom_qty", "?"),
+                target=line.get("_target_qty", delivered),
+                delivered=delivered,
+                open_moves=open_moves,
+            ))
+
+        body = QTY_ADJUSTMENT_MESSAGE_TEMPLATE.substitute(
+            line_count=len(adjusted_lines),
+            line_items="\n".join(line_items),
+            request_id=self.request_id,
+        )
 
         return self._safe_message_post(
             model=self.SO_MODEL,
@@ -763,19 +1045,11 @@ class OrderOperations(BaseOperation):
         Returns:
             OperationResult
         """
-        request_id = self.ctx.request_id if self.ctx else "N/A"
-
-        body = f"""<div style="font-family: Arial, sans-serif; line-height: 1.6;">
-    <p><strong>Sentinel-Ops: Shipping Line Completion</strong></p>
-    <ul style="margin: 10px 0; padding-left: 20px;">
-        <li><strong>Order:</strong> {order_name}</li>
-        <li><strong>Action:</strong> Auto-completed {lines_completed} shipping line(s)</li>
-        <li><strong>Reason:</strong> Only pending items were shipping fees</li>
-    </ul>
-    <p style="color: #666; font-size: 0.9em;">
-        Request ID: {request_id}
-    </p>
-</div>"""
+        body = SHIPPING_COMPLETION_MESSAGE_TEMPLATE.substitute(
+            order_name=order_name,
+            lines_completed=lines_completed,
+            request_id=self.request_id,
+        )
 
         return self._safe_message_post(
             model=self.SO_MODEL,
@@ -27,7 +27,7 @@ class PurchaseOperations(BaseOperation):
     MOVE_MODEL = "stock.move"
 
     # Open picking states (not done or cancelled)
-    OPEN_PICKING_STATES = ["draft", "waiting", "confirmed", "assigned"]
+    OPEN_PICKING_STATES = frozenset({"draft", "waiting", "confirmed", "assigned"})
 
     def get_open_pickings_for_po(
         self,
@@ -46,7 +46,7 @@ class PurchaseOperations(BaseOperation):
             self.PICKING_MODEL,
             [
                 ("purchase_id", "=", po_id),
-                ("state", "in", self.OPEN_PICKING_STATES),
+                ("state", "in", sorted(self.OPEN_PICKING_STATES)),
             ],
             fields=["id", "name", "scheduled_date", "date_deadline"],
         )
@@ -68,7 +68,7 @@ class PurchaseOperations(BaseOperation):
         Returns:
             OperationResult
         """
-        date_str = new_date.strftime("%Y-%m-%d %H:%M:%S")
+        date_str = self.format_datetime(new_date)
 
         return self._safe_write(
             model=self.PICKING_MODEL,
@@ -97,7 +97,7 @@ class PurchaseOperations(BaseOperation):
             List of OperationResults
         """
         results = []
-        date_str = new_date.strftime("%Y-%m-%d %H:%M:%S")
+        date_str = self.format_datetime(new_date)
 
         # Find all moves in this picking
         moves = self.odoo.search_read(
@@ -136,7 +136,7 @@ class PurchaseOperations(BaseOperation):
         Returns:
             OperationResult
         """
-        date_str = new_date.strftime("%Y-%m-%d %H:%M:%S")
+        date_str = self.format_datetime(new_date)
 
         return self._safe_write(
             model=self.MOVE_MODEL,
@@ -182,7 +182,7 @@ class PurchaseOperations(BaseOperation):
             if isinstance(date_planned, str):
                 date_planned = datetime.strptime(date_planned, "%Y-%m-%d %H:%M:%S")
 
-            date_str = date_planned.strftime("%Y-%m-%d %H:%M:%S")
+            date_str = self.format_datetime(date_planned)
 
             # Find moves linked to this PO line
             moves = self.odoo.search_read(
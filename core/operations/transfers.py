@@ -5,6 +5,7 @@ Operations related to stock transfers and moves.
 """
 
 import logging
+import string
 from typing import Optional
 
 from core.operations.base import BaseOperation
@@ -12,6 +13,15 @@ from core.result import OperationResult
 
 logger = logging.getLogger(__name__)
 
+# Picking chatter body, filled in with string.Template.substitute
+PICKING_MESSAGE_TEMPLATE = string.Template(
+    """<div class="o_mail_notification">
+<b>[SentinelOps] Transfer $action</b><br/>
+<b>Reason:</b> $reason<br/>
+<b>Job:</b> $job_name
+</div>"""
+)
+
 
 class TransferOperations(BaseOperation):
     """
@@ -357,11 +367,11 @@ class TransferOperations(BaseOperation):
         Returns:
             OperationResult indicating success/failure
         """
-        body = f"""<div class="o_mail_notification">
-<b>[SentinelOps] Transfer Cancelled</b><br/>
-<b>Reason:</b> {reason}<br/>
-<b>Job:</b> {job_name}
-</div>"""
+        body = PICKING_MESSAGE_TEMPLATE.substitute(
+            action="Cancelled",
+            reason=reason,
+            job_name=job_name,
+        )
 
         return self._safe_message_post(
             model=self.PICKING_MODEL,
@@ -392,11 +402,11 @@ class TransferOperations(BaseOperation):
         Returns:
             OperationResult indicating success/failure
         """
-        body = f"""<div class="o_mail_notification">
-<b>[SentinelOps] Transfer Deleted</b><br/>
-<b>Reason:</b> {reason}<br/>
-<b>Job:</b> {job_name}
-</div>"""
+        body = PICKING_MESSAGE_TEMPLATE.substitute(
+            action="Deleted",
+            reason=reason,
+            job_name=job_name,
+        )
 
         return self._safe_message_post(
             model=self.PICKING_MODEL,
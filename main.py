@@ -216,6 +216,7 @@ Per-Job Examples (CLI + curl):
   create_documents (validates then creates sale.order/stock.picking from JSON):
     python main.py run create_documents --dry-run file=/path/to/import.json
     python main.py run create_documents file=/path/to/import.json
+    python main.py run create_documents file=/path/to/import.json max_workers=8  # faster; names not in input order
     python main.py run create_documents --dry-run 'json_input={{"metadata":{{"source":"test"}},"documents":[...]}}'
     curl -X POST {base_url}/execute -H "Content-Type: application/json" \\
       -d '{{"job":"create_documents","dry_run":true,"params":{{"file":"/path/to/import.json"}}}}'
@@ -42,6 +42,9 @@ def mock_odoo():
     # Mock search_count
     client.search_count.return_value = 0
 
+    # Mock read_group - no groups by default
+    client.read_group.return_value = []
+
     # Mock write - returns True
     client.write.return_value = True
 
@@ -152,10 +152,6 @@ class TestOrderOperationsFindShippingOnly:
             sample_order_with_shipping_only["pending_shipping_lines"],  # shipping lines
             [],  # non-shipping lines (none, so no pending)
         ]
-        # Return order details
-        mock_odoo.read.return_value = [
-            {"id": 455346, "name": "S00455346"}
-        ]
 
         ops = OrderOperations(mock_odoo, test_context, mock_logger)
         result = ops.find_orders_with_only_shipping_pending(
@@ -166,6 +162,127 @@ class TestOrderOperationsFindShippingOnly:
         assert result[0]["order_id"] == 455346
         assert result[0]["order_name"] == "S00455346"
         assert len(result[0]["pending_shipping_lines"]) == 1
+        # Name comes from the order_id (id, name) pair, no per-order read
+        mock_odoo.read.assert_not_called()
+
+    def test_order_names_read_once_for_bare_ids(
+        self, mock_odoo, test_context, mock_logger, shipping_product_ids
+    ):
+        """Orders returned as bare ids get their names from a single read."""
+        mock_odoo.search_read.side_effect = [
+            [
+                {"id": 1, "order_id": 10, "product_uom_qty": 1.0, "qty_delivered": 0.0},
+                {"id": 2, "order_id": 11, "product_uom_qty": 1.0, "qty_delivered": 0.0},
+            ],
+            [],
+        ]
+        mock_odoo.read.return_value = [
+            {"id": 10, "name": "S010"},
+            {"id": 11, "name": "S011"},
+        ]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        result = ops.find_orders_with_only_shipping_pending(
+            shipping_product_ids=shipping_product_ids
+        )
+
+        mock_odoo.read.assert_called_once_with("sale.order", [10, 11], ["id", "name"])
+        assert [o["order_name"] for o in result] == ["S010", "S011"]
+
+    def test_order_names_read_only_for_qualifying_orders(
+        self, mock_odoo, test_context, mock_logger, shipping_product_ids
+    ):
+        """Orders excluded by pending goods are never read for their name."""
+        mock_odoo.search_read.side_effect = [
+            [
+                {"id": 1, "order_id": 10, "product_uom_qty": 1.0, "qty_delivered": 0.0},
+                {"id": 2, "order_id": 11, "product_uom_qty": 1.0, "qty_delivered": 0.0},
+            ],
+            [{"id": 20, "order_id": 11, "product_uom_qty": 2.0, "qty_delivered": 1.0}],
+        ]
+        mock_odoo.read.return_value = [{"id": 10, "name": "S010"}]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        result = ops.find_orders_with_only_shipping_pending(
+            shipping_product_ids=shipping_product_ids
+        )
+
+        mock_odoo.read.assert_called_once_with("sale.order", [10], ["id", "name"])
+        assert [o["order_name"] for o in result] == ["S010"]
+
+    def test_non_shipping_lines_fetched_in_one_query(
+        self, mock_odoo, test_context, mock_logger, shipping_product_ids
+    ):
+        """Non-shipping lines for every candidate order come from one search_read."""
+        mock_odoo.search_read.side_effect = [
+            [
+                {"id": 1, "order_id": (10, "S010"), "product_uom_qty": 1.0, "qty_delivered": 0.0},
+                {"id": 2, "order_id": (11, "S011"), "product_uom_qty": 1.0, "qty_delivered": 0.0},
+                {"id": 3, "order_id": (12, "S012"), "product_uom_qty": 1.0, "qty_delivered": 0.0},
+            ],
+            [
+                {"id": 20, "order_id": 10, "product_uom_qty": 2.0, "qty_delivered": 2.0},
+                {"id": 21, "order_id": 11, "product_uom_qty": 2.0, "qty_delivered": 1.0},
+            ],
+        ]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        result = ops.find_orders_with_only_shipping_pending(
+            shipping_product_ids=shipping_product_ids
+        )
+
+        assert mock_odoo.search_read.call_count == 2
+        domain = mock_odoo.search_read.call_args.args[1]
+        assert ("order_id", "in", [10, 11, 12]) in domain
+        assert mock_odoo.search_read.call_args.kwargs["load"] == "_classic_write"
+        assert [o["order_id"] for o in result] == [10, 12]
+
+    def test_orders_short_in_total_skip_line_check(
+        self, mock_odoo, test_context, mock_logger, shipping_product_ids
+    ):
+        """Orders whose delivered total is short are excluded before the line read."""
+        mock_odoo.search_read.side_effect = [
+            [
+                {"id": 1, "order_id": (10, "S010"), "product_uom_qty": 1.0, "qty_delivered": 0.0},
+                {"id": 2, "order_id": (11, "S011"), "product_uom_qty": 1.0, "qty_delivered": 0.0},
+            ],
+            [
+                {"id": 20, "order_id": 10, "product_uom_qty": 2.0, "qty_delivered": 2.0},
+            ],
+        ]
+        mock_odoo.read_group.return_value = [
+            {"order_id": (10, "S010"), "product_uom_qty": 2.0, "qty_delivered": 2.0},
+            {"order_id": (11, "S011"), "product_uom_qty": 5.0, "qty_delivered": 1.0},
+        ]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        result = ops.find_orders_with_only_shipping_pending(
+            shipping_product_ids=shipping_product_ids
+        )
+
+        assert mock_odoo.read_group.call_args.kwargs == {"lazy": False}
+        domain = mock_odoo.search_read.call_args.args[1]
+        assert ("order_id", "in", [10]) in domain
+        assert [o["order_id"] for o in result] == [10]
+
+    def test_read_group_sums_tolerate_float_error(
+        self, mock_odoo, test_context, mock_logger, shipping_product_ids
+    ):
+        """Float noise in the summed totals does not mark an order as pending."""
+        mock_odoo.search_read.side_effect = [
+            [{"id": 1, "order_id": (10, "S010"), "product_uom_qty": 1.0, "qty_delivered": 0.0}],
+            [{"id": 20, "order_id": 10, "product_uom_qty": 0.3, "qty_delivered": 0.3}],
+        ]
+        mock_odoo.read_group.return_value = [
+            {"order_id": (10, "S010"), "product_uom_qty": 0.1 + 0.2, "qty_delivered": 0.3},
+        ]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        result = ops.find_orders_with_only_shipping_pending(
+            shipping_product_ids=shipping_product_ids
+        )
+
+        assert [o["order_id"] for o in result] == [10]
 
     def test_filter_orders_with_non_shipping_pending(
         self,
@@ -180,7 +297,7 @@ class TestOrderOperationsFindShippingOnly:
         # Second search_read returns non-shipping line with pending qty
         mock_odoo.search_read.side_effect = [
             sample_order_with_shipping_only["pending_shipping_lines"],  # shipping lines
-            [{"id": 999, "product_uom_qty": 2.0, "qty_delivered": 1.0}],  # pending non-shipping
+            [{"id": 999, "order_id": 455346, "product_uom_qty": 2.0, "qty_delivered": 1.0}],  # pending non-shipping
         ]
 
         ops = OrderOperations(mock_odoo, test_context, mock_logger)
@@ -253,6 +370,26 @@ class TestOrderOperationsCompleteShippingLine:
         )
         assert result.success
 
+    def test_complete_shipping_lines_bulk_one_write_per_qty(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Lines with the same ordered qty are completed in one write."""
+        ops = OrderOperations(mock_odoo, live_context, mock_logger)
+
+        lines = [
+            {"id": 1, "product_uom_qty": 1.0, "qty_delivered": 0.0, "_record_name": "S001/Ship"},
+            {"id": 2, "product_uom_qty": 1.0, "qty_delivered": 0.0, "_record_name": "S002/Ship"},
+            {"id": 3, "product_uom_qty": 2.0, "qty_delivered": 0.0, "_record_name": "S003/Ship"},
+        ]
+        results = ops.complete_shipping_lines_bulk(lines)
+
+        written = sorted(
+            (c.args[1], c.args[2]["qty_delivered"]) for c in mock_odoo.write.call_args_list
+        )
+        assert written == [([1, 2], 1.0), ([3], 2.0)]
+        assert [r.record_name for r in results] == ["S001/Ship", "S002/Ship", "S003/Ship"]
+        assert all(r.action == "complete_shipping_line" for r in results)
+
 
 class TestOrderOperationsPostMessage:
     """Tests for post_shipping_completion_message operation."""
@@ -398,6 +535,33 @@ class TestCompleteShippingOnlyOrdersJob:
         assert result.kpis["orders_completed"] >= 1
         assert result.kpis["lines_completed"] >= 1
 
+    def test_job_completes_all_orders_in_one_write(
+        self, mock_odoo, mock_bq, mock_alerter, mock_logger, live_context
+    ):
+        """Shipping lines across orders are written together; chatter stays per order."""
+        mock_odoo.search_read.side_effect = [
+            [
+                {"id": 1, "order_id": (10, "S010"), "product_uom_qty": 1.0, "qty_delivered": 0.0},
+                {"id": 2, "order_id": (11, "S011"), "product_uom_qty": 1.0, "qty_delivered": 0.0},
+            ],
+            [],
+        ]
+
+        job = CompleteShippingOnlyOrdersJob(
+            ctx=live_context,
+            odoo=mock_odoo,
+            bq=mock_bq,
+            alerter=mock_alerter,
+            log=mock_logger,
+        )
+        result = job.run()
+
+        mock_odoo.write.assert_called_once()
+        assert mock_odoo.write.call_args.args[1] == [1, 2]
+        assert mock_odoo.message_post.call_count == 2
+        assert result.kpis["orders_completed"] == 2
+        assert result.kpis["lines_completed"] == 2
+
     def test_job_with_specific_order_ids(
         self, mock_odoo, mock_bq, mock_alerter, mock_logger, test_context
     ):
@@ -0,0 +1,320 @@
+"""
+Tests for Date Compliance Operations
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from unittest.mock import patch
+
+from core.jobs.check_ar_hold_violations import CheckArHoldViolationsJob
+from core.operations.dates import DateComplianceOperations
+
+
+class TestCalculateNextCommitmentDate:
+    """Tests for calculate_next_commitment_date."""
+
+    def test_recent_cancel_date_uses_first_interval(self, mock_odoo, test_context, mock_logger):
+        """Cancel date a few days ago -> N=1."""
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+        cancel_date = datetime.now() - timedelta(days=3, hours=5)
+
+        new_date, n = ops.calculate_next_commitment_date(cancel_date, interval_days=15)
+
+        assert n == 1
+        assert new_date == cancel_date + timedelta(days=15)
+
+    def test_future_cancel_date_uses_first_interval(self, mock_odoo, test_context, mock_logger):
+        """Cancel date in the future still yields N=1."""
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+        cancel_date = datetime.now() + timedelta(days=2)
+
+        new_date, n = ops.calculate_next_commitment_date(cancel_date, interval_days=15)
+
+        assert n == 1
+        assert new_date == cancel_date + timedelta(days=15)
+
+    @pytest.mark.parametrize("days_past,expected_n", [
+        (15.5, 2),   # partial day past an exact multiple
+        (29.9, 2),
+        (30.1, 3),
+        (44.0, 3),
+    ])
+    def test_result_is_smallest_future_interval(
+        self, mock_odoo, test_context, mock_logger, days_past, expected_n
+    ):
+        """N is the smallest integer that puts the date in the future."""
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+        cancel_date = datetime.now() - timedelta(days=days_past)
+
+        new_date, n = ops.calculate_next_commitment_date(cancel_date, interval_days=15)
+
+        assert n == expected_n
+        assert new_date > datetime.now()
+        assert cancel_date + timedelta(days=15 * (n - 1)) <= datetime.now()
+
+    def test_explicit_now_is_used(self, mock_odoo, test_context, mock_logger):
+        """A fixed reference time makes the result deterministic."""
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+        now = datetime(2025, 6, 1, 12, 0, 0)
+        cancel_date = datetime(2025, 5, 1, 12, 0, 0)  # 31 days before now
+
+        new_date, n = ops.calculate_next_commitment_date(cancel_date, interval_days=15, now=now)
+
+        assert n == 3
+        assert new_date == datetime(2025, 6, 15, 12, 0, 0)
+
+
+class TestArHoldTag:
+    """Tests for AR-HOLD tag parsing."""
+
+    @pytest.mark.parametrize("tags,expected", [
+        ([{"id": 5, "name": "AR-HOLD:3"}], (5, 3, "AR-HOLD:3")),
+        ([{"id": 5, "name": "AR-HOLD:"}, {"id": 6, "name": "AR-HOLD:12"}], (6, 12, "AR-HOLD:12")),
+        ([{"id": 5, "name": "AR-HOLD:3a"}], None),
+        ([{"id": 5, "name": "AR-HOLD:²"}], None),
+        ([], None),
+    ])
+    def test_find_ar_hold_tag_on_order(
+        self, mock_odoo, test_context, mock_logger, tags, expected
+    ):
+        """Only AR-HOLD:<digits> tags are recognised."""
+        mock_odoo.find_tags_by_prefix.return_value = tags
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+
+        assert ops.find_ar_hold_tag_on_order(100) == expected
+
+
+    def test_find_ar_hold_tag_is_memoized(self, mock_odoo, test_context, mock_logger):
+        """Repeated lookups for the same order issue one tag fetch."""
+        mock_odoo.find_tags_by_prefix.return_value = [{"id": 5, "name": "AR-HOLD:3"}]
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+
+        ops.find_ar_hold_tag_on_order(100)
+        ops.find_ar_hold_tag_on_order(100)
+
+        mock_odoo.find_tags_by_prefix.assert_called_once()
+
+    def test_set_ar_hold_tag_invalidates_cache(self, mock_odoo, live_context, mock_logger):
+        """Changing the tag forces the next lookup to re-fetch."""
+        mock_odoo.find_tags_by_prefix.return_value = [{"id": 5, "name": "AR-HOLD:3"}]
+        ops = DateComplianceOperations(mock_odoo, live_context, mock_logger)
+
+        ops.set_ar_hold_tag(100, "S100", target_n=4)
+        ops.find_ar_hold_tag_on_order(100)
+
+        assert mock_odoo.find_tags_by_prefix.call_count == 2
+
+
+class TestDateSync:
+    """Tests for commitment/picking/move date writes."""
+
+    def test_format_datetime_matches_odoo_format(self):
+        """Formatted output matches Odoo's '%Y-%m-%d %H:%M:%S' format."""
+        dt = datetime(2025, 3, 7, 9, 5, 2, 123456)
+
+        assert DateComplianceOperations.format_datetime(dt) == dt.strftime("%Y-%m-%d %H:%M:%S")
+
+    def test_format_datetime_drops_tzinfo(self):
+        """Aware datetimes (e.g. BQ TIMESTAMPs) format like strftime, without offset."""
+        dt = datetime(2025, 3, 7, 9, 5, 2, tzinfo=timezone.utc)
+
+        assert DateComplianceOperations.format_datetime(dt) == "2025-03-07 09:05:02"
+
+    def test_sync_move_dates_uses_precomputed_date_str(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """A pre-formatted date string is written as-is to every move."""
+        mock_odoo.search_read.return_value = [{"id": 1}, {"id": 2}]
+        ops = DateComplianceOperations(mock_odoo, live_context, mock_logger)
+
+        results = ops.sync_move_dates(
+            picking_id=10,
+            new_date=datetime(2025, 1, 1),
+            date_str="2025-01-01 00:00:00",
+        )
+
+        assert len(results) == 2
+        for call in mock_odoo.write.call_args_list:
+            assert call.args[2] == {"date": "2025-01-01 00:00:00"}
+
+    def test_sync_picking_dates_skips_unchanged(self, mock_odoo, live_context, mock_logger):
+        """No write when the picking already has the target dates."""
+        ops = DateComplianceOperations(mock_odoo, live_context, mock_logger)
+        existing = {
+            "id": 10,
+            "scheduled_date": "2025-01-01 00:00:00",
+            "date_deadline": "2025-01-01 00:00:00",
+        }
+
+        result = ops.sync_picking_dates(10, datetime(2025, 1, 1), "WH/OUT/1", existing=existing)
+
+        mock_odoo.write.assert_not_called()
+        assert result.success
+        assert result.action == "picking_dates_unchanged"
+
+    def test_sync_picking_dates_writes_when_different(self, mock_odoo, live_context, mock_logger):
+        """Picking is written when either date differs."""
+        ops = DateComplianceOperations(mock_odoo, live_context, mock_logger)
+        existing = {
+            "id": 10,
+            "scheduled_date": "2025-01-01 00:00:00",
+            "date_deadline": "2024-12-01 00:00:00",
+        }
+
+        result = ops.sync_picking_dates(10, datetime(2025, 1, 1), "WH/OUT/1", existing=existing)
+
+        mock_odoo.write.assert_called_once()
+        assert result.action == "sync_picking_dates"
+
+    def test_apply_picking_syncs_parallel_preserves_order(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Results come back in input order, one (picking, moves) pair each."""
+        mock_odoo.search_read.return_value = [{"id": 1}]
+        ops = DateComplianceOperations(mock_odoo, live_context, mock_logger)
+        items = [
+            {"picking_id": pid, "picking_name": f"P{pid}", "new_date": datetime(2025, 1, 1)}
+            for pid in (10, 11, 12)
+        ]
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            results = ops.apply_picking_syncs_parallel(items, executor=pool)
+
+        assert [r[0].record_id for r in results] == [10, 11, 12]
+        assert all(len(moves) == 1 for _, moves in results)
+        assert mock_odoo.write.call_count == 6
+
+
+class TestPartnerBlockTag:
+    """Tests for check_partner_has_block_tag."""
+
+    def test_reads_partner_and_categories(self, mock_odoo, test_context, mock_logger):
+        """Without preloaded categories, the partner is read first."""
+        mock_odoo.read.side_effect = [
+            [{"id": 7, "category_id": [1, 2]}],
+            [{"id": 1, "name": "VIP"}, {"id": 2, "name": "Credit BLOCK"}],
+        ]
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+
+        assert ops.check_partner_has_block_tag(7) is True
+
+    def test_preloaded_categories_skip_partner_read(self, mock_odoo, test_context, mock_logger):
+        """Preloaded category_ids skip the partner read; names are cached."""
+        mock_odoo.read.return_value = [{"id": 1, "name": "VIP"}]
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+
+        assert ops.check_partner_has_block_tag(7, category_ids=[1]) is False
+        assert ops.check_partner_has_block_tag(8, category_ids=[1]) is False
+
+        mock_odoo.read.assert_called_once_with("res.partner.category", [1], ["name"])
+
+    def test_no_categories(self, mock_odoo, test_context, mock_logger):
+        """Partner without categories is not blocked and needs no RPC."""
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+
+        assert ops.check_partner_has_block_tag(7, category_ids=[]) is False
+        mock_odoo.read.assert_not_called()
+
+
+class TestLoadOrderContext:
+    """Tests for load_order_context."""
+
+    def test_three_rpcs_for_many_orders(self, mock_odoo, test_context, mock_logger):
+        """Orders, tags and partner categories are loaded in bulk."""
+        mock_odoo.search_read.side_effect = [
+            [
+                {"id": 100, "name": "S100", "partner_id": 7, "commitment_date": False,
+                 "ah_cancel_date": "2025-01-01 00:00:00", "ah_sales_order_tags_ids": [5]},
+                {"id": 101, "name": "S101", "partner_id": 7, "commitment_date": False,
+                 "ah_cancel_date": False, "ah_sales_order_tags_ids": []},
+            ],
+            [{"id": 5, "name": "AR-HOLD:2"}],
+        ]
+        mock_odoo.read.return_value = [{"id": 7, "category_id": [1]}]
+        ops = DateComplianceOperations(mock_odoo, test_context, mock_logger)
+
+        context = ops.load_order_context([100, 101, 102])
+
+        assert set(context) == {100, 101}
+        assert context[101]["partner_category_ids"] == [1]
+        assert mock_odoo.search_read.call_count == 2
+        mock_odoo.read.assert_called_once_with("res.partner", [7], ["category_id"])
+        # Tags are cached for the later per-order lookups
+        assert ops.find_ar_hold_tag_on_order(100) == (5, 2, "AR-HOLD:2")
+        assert ops.find_ar_hold_tag_on_order(101) is None
+        mock_odoo.find_tags_by_prefix.assert_not_called()
+        mock_odoo.find_tags_by_prefix.assert_not_called()
+
+
+class TestCheckArHoldViolationsJob:
+    """Tests for CheckArHoldViolationsJob."""
+
+    @staticmethod
+    def _search_read(model, domain, **kwargs):
+        if model == "sale.order":
+            return [{
+                "id": 100, "name": "S100", "partner_id": 7,
+                "commitment_date": "2020-01-01 00:00:00",
+                "ah_cancel_date": "2020-01-01 00:00:00",
+                "ah_sales_order_tags_ids": [],
+            }]
+        if model == "stock.picking":
+            return [{
+                "id": 10, "name": "WH/OUT/10", "origin": "S100",
+                "scheduled_date": "2020-01-01 00:00:00",
+                "date_deadline": "2020-01-01 00:00:00",
+            }]
+        if model == "stock.move":
+            return [{"id": 1000}, {"id": 1001}]
+        return []
+
+    def test_live_run_extends_order(
+        self, mock_odoo, mock_bq, mock_alerter, mock_logger, live_context
+    ):
+        """A blocked partner's order is extended, tagged, synced and messaged."""
+        mock_odoo.search_read.side_effect = self._search_read
+        mock_odoo.read.side_effect = lambda model, ids, fields=None, **kw: (
+            [{"id": 7, "category_id": [1]}] if model == "res.partner"
+            else [{"id": 1, "name": "Credit Block"}]
+        )
+
+        job = CheckArHoldViolationsJob(
+            ctx=live_context, odoo=mock_odoo, bq=mock_bq,
+            alerter=mock_alerter, log=mock_logger,
+        )
+        result = job.run(order_ids=[100])
+
+        assert result.data["processed_order_ids"] == [100]
+        assert result.kpis["pickings_updated"] == 1
+        assert result.kpis["moves_updated"] == 2
+        assert not result.errors
+        # Order + picking messages go out in one batch
+        mock_odoo.message_post_batch.assert_called_once()
+        mock_odoo.message_post.assert_not_called()
+
+    def test_one_sync_pool_per_run(
+        self, mock_odoo, mock_bq, mock_alerter, mock_logger, live_context
+    ):
+        """Picking syncs of every order share one pool; max_workers=1 uses none."""
+        mock_odoo.search_read.side_effect = self._search_read
+        mock_odoo.read.side_effect = lambda model, ids, fields=None, **kw: (
+            [{"id": 7, "category_id": [1]}] if model == "res.partner"
+            else [{"id": 1, "name": "Credit Block"}]
+        )
+        job = CheckArHoldViolationsJob(
+            ctx=live_context, odoo=mock_odoo, bq=mock_bq,
+            alerter=mock_alerter, log=mock_logger,
+        )
+
+        with patch(
+            "core.jobs.check_ar_hold_violations.ThreadPoolExecutor",
+            wraps=ThreadPoolExecutor,
+        ) as pool_cls:
+            job.run(order_ids=[100, 101])
+            pool_cls.assert_called_once_with(max_workers=8)
+
+            pool_cls.reset_mock()
+            job.run(order_ids=[100], max_workers=1)
+            pool_cls.assert_not_called()
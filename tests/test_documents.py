@@ -0,0 +1,1025 @@
+"""
+Tests for Document Creation Operations
+"""
+
+import threading
+
+import pytest
+from unittest.mock import patch
+
+from core.operations.documents import (
+    DocumentCreationOperations,
+    ResolveResult,
+    ValidationError,
+)
+
+
+def _sale_doc(row_number: int, **header) -> dict:
+    """Build a minimal sale.order document with one valid line."""
+    return {
+        "row_number": row_number,
+        "document_type": "sale.order",
+        "header": header,
+        "lines": [{"row_number": row_number, "product_id": 5, "quantity": 1}],
+    }
+
+
+class TestPartnerPrefetch:
+    """Tests for batch partner resolution in validate_all."""
+
+    @staticmethod
+    def _search_read(model, domain, **kwargs):
+        field, op, values = domain[0]
+        if model == "product.product" and field == "id":
+            return [{"id": v} for v in values]
+        if model == "res.partner" and field == "id":
+            return [{"id": v} for v in values if v == 10]
+        if model == "res.partner" and field == "ref":
+            return [{"id": 20, "ref": "C-1"}] if "C-1" in values else []
+        if model == "res.partner" and field == "name":
+            rows = []
+            if "Acme" in values:
+                rows.append({"id": 30, "name": "Acme"})
+            if "Dup" in values:
+                rows += [{"id": 31, "name": "Dup"}, {"id": 32, "name": "Dup"}]
+            return rows
+        return []
+
+    def test_prefetch_issues_one_search_read_per_kind(
+        self, mock_odoo, test_context, mock_logger
+    ):
+        """Three search_read calls regardless of batch size."""
+        mock_odoo.search_read.side_effect = self._search_read
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+        docs = [_sale_doc(i, partner_name="Acme") for i in range(20)]
+        docs += [_sale_doc(100, partner_id=10), _sale_doc(101, partner_ref="C-1")]
+
+        cache = ops._prefetch_partners(docs)
+
+        assert mock_odoo.search_read.call_count == 3
+        assert cache["by_id"] == {10}
+        assert cache["by_ref"]["C-1"] == [20]
+        assert cache["by_name"]["Acme"] == [30]
+
+    def test_resolve_partner_from_cache(self, mock_odoo, test_context, mock_logger):
+        """Cached lookups match the RPC semantics without calling Odoo."""
+        mock_odoo.search_read.side_effect = self._search_read
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+        cache = ops._prefetch_partners([
+            _sale_doc(1, partner_id=10),
+            _sale_doc(2, partner_id=11),
+            _sale_doc(3, partner_ref="missing", partner_name="Acme"),
+            _sale_doc(4, partner_name="Dup"),
+        ])
+
+        assert ops.resolve_partner(10, cache=cache).record_id == 10
+        assert not ops.resolve_partner(11, cache=cache).success
+        # Unknown ref falls through to the name lookup
+        assert ops.resolve_partner(
+            partner_name="Acme", partner_ref="missing", cache=cache
+        ).record_id == 30
+        dup = ops.resolve_partner(partner_name="Dup", cache=cache)
+        assert not dup.success
+        assert dup.matched_count == 2
+        mock_odoo.search.assert_not_called()
+
+    def test_validate_all_reports_unknown_partner(
+        self, mock_odoo, test_context, mock_logger
+    ):
+        """validate_all resolves partners from the prefetch."""
+        mock_odoo.search_read.side_effect = self._search_read
+        mock_odoo.search.return_value = [5]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        all_valid, errors, stats = ops.validate_all([
+            _sale_doc(1, partner_name="Acme"),
+            _sale_doc(2, partner_name="Nobody"),
+        ])
+
+        assert not all_valid
+        assert [e.row_number for e in errors] == [2]
+        assert errors[0].error == "Partner not found: Nobody"
+        assert stats["invalid_count"] == 1
+
+
+class TestResolveMemo:
+    """Tests for per-instance memoization of resolvers."""
+
+    def test_resolve_product_memoized(self, mock_odoo, test_context, mock_logger):
+        """Repeated SKU lookups hit Odoo once."""
+        mock_odoo.search.return_value = [7]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        for _ in range(5):
+            assert ops.resolve_product(product_ref="SKU-1").record_id == 7
+
+        assert mock_odoo.search.call_count == 1
+
+    def test_verify_record_exists_memoized_per_record(
+        self, mock_odoo, test_context, mock_logger
+    ):
+        """Existence is cached per (model, id) and named per field."""
+        mock_odoo.search.return_value = []
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        ops.verify_record_exists("res.partner", 9, "owner_id")
+        result = ops.verify_record_exists("res.partner", 9, "partner_invoice_id")
+
+        assert mock_odoo.search.call_count == 1
+        assert result.error == "partner_invoice_id ID 9 not found in res.partner"
+
+    def test_line_product_details_read_once(
+        self, mock_odoo, test_context, mock_logger
+    ):
+        """Product details are read once per product for the whole run."""
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+        mock_odoo.read.side_effect = lambda model, ids, fields=None: [
+            {"id": i, "name": f"P{i}", "uom_id": [1, "Units"]} for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        ops._resolve_line_products([{"product_id": 5}, {"product_id": 6}])
+        _, products = ops._resolve_line_products([{"product_id": 6}, {"product_id": 7}])
+
+        assert [c.args[1] for c in mock_odoo.read.call_args_list] == [[5, 6], [7]]
+        assert sorted(products) == [6, 7]
+
+    def test_clear_resolve_cache(self, mock_odoo, test_context, mock_logger):
+        """clear_resolve_cache forces a fresh lookup."""
+        mock_odoo.search.return_value = [7]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        ops.resolve_product(product_ref="SKU-1")
+        ops.clear_resolve_cache()
+        ops.resolve_product(product_ref="SKU-1")
+
+        assert mock_odoo.search.call_count == 2
+
+
+class TestGroupedExistenceCheck:
+    """Tests for per-model existence checks in validation."""
+
+    def test_one_search_per_model_for_batch(self, mock_odoo, test_context, mock_logger):
+        """IDs are checked with one search per model across the batch."""
+        def search(model, domain, **kwargs):
+            field, op, values = domain[0]
+            if op == "in":
+                return [v for v in values if v != 99]
+            return [1]
+
+        mock_odoo.search.side_effect = search
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+        docs = [
+            _sale_doc(i, partner_id=1, warehouse_id=7, pricelist_id=3 + i % 2)
+            for i in range(10)
+        ]
+        docs.append(_sale_doc(50, partner_id=1, warehouse_id=99))
+
+        all_valid, errors, _ = ops.validate_all(docs)
+
+        in_searches = [
+            c for c in mock_odoo.search.call_args_list if c.args[1][0][1] == "in"
+        ]
+        assert sorted(c.args[0] for c in in_searches) == [
+            "product.pricelist", "stock.warehouse",
+        ]
+        assert not all_valid
+        assert [(e.row_number, e.field) for e in errors] == [(50, "warehouse_id")]
+        assert errors[0].error == "warehouse_id ID 99 not found in stock.warehouse"
+
+    def test_lookups_run_concurrently(self, mock_odoo, test_context, mock_logger):
+        """Partner prefetch and existence searches overlap in time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search_read(model, domain, **kwargs):
+            if model == "res.partner":
+                barrier.wait()
+            return [{"id": v} for v in domain[0][2]]
+
+        def search(model, domain, **kwargs):
+            barrier.wait()
+            return list(domain[0][2])
+
+        mock_odoo.search_read.side_effect = search_read
+        mock_odoo.search.side_effect = search
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        all_valid, errors, _ = ops.validate_all(
+            [_sale_doc(1, partner_id=1, warehouse_id=7)]
+        )
+
+        assert all_valid, errors
+
+    def test_partner_references_share_one_id_search(
+        self, mock_odoo, test_context, mock_logger
+    ):
+        """Shipping/invoice partner IDs are checked with the partner prefetch."""
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2] if v != 99
+        ]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+        docs = [
+            _sale_doc(1, partner_id=1, partner_shipping_id=1),
+            _sale_doc(2, partner_id=1, partner_shipping_id=2, partner_invoice_id=99),
+        ]
+
+        all_valid, errors, _ = ops.validate_all(docs)
+
+        mock_odoo.search.assert_not_called()
+        partner_calls = [
+            c for c in mock_odoo.search_read.call_args_list
+            if c.args[0] == "res.partner"
+        ]
+        assert len(partner_calls) == 1
+        assert sorted(partner_calls[0].args[1][0][2]) == [1, 2, 99]
+        assert [(e.row_number, e.field) for e in errors] == [(2, "partner_invoice_id")]
+
+    def test_validate_all_rechecks_each_batch(
+        self, mock_odoo, test_context, mock_logger
+    ):
+        """Existence results are not carried over between batches."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: list(domain[0][2])
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+        docs = [_sale_doc(1, partner_id=1, warehouse_id=7)]
+
+        ops.validate_all(docs)
+        ops.validate_all(docs)
+
+        assert mock_odoo.search.call_count == 2
+
+
+class TestProductPrefetch:
+    """Tests for batch product resolution in validate_all."""
+
+    def test_prefetch_products_by_kind(self, mock_odoo, test_context, mock_logger):
+        """Each line contributes only the identifier resolve_product uses."""
+        def search_read(model, domain, **kwargs):
+            field, op, values = domain[0]
+            if field == "default_code":
+                rows = [{"id": 1, "default_code": "A"}]
+                rows += [{"id": 2, "default_code": "B"}, {"id": 3, "default_code": "B"}]
+                return [r for r in rows if r["default_code"] in values]
+            return []
+
+        mock_odoo.search_read.side_effect = search_read
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+        doc = {"header": {}, "lines": [
+            {"product_ref": "A", "product_name": "ignored", "quantity": 1},
+            {"product_sku": "B", "quantity": 1},
+            {"product_sku": "A", "quantity": 1},
+        ]}
+
+        cache = ops._prefetch_products([doc])
+
+        mock_odoo.search_read.assert_called_once()
+        assert ops.resolve_product(product_ref="A", cache=cache).record_id == 1
+        multi = ops.resolve_product(product_ref="B", cache=cache)
+        assert not multi.success
+        assert multi.matched_ids == [2, 3]
+        missing = ops.resolve_product(product_ref="C", cache=cache)
+        assert missing.error == "Product not found: C"
+        mock_odoo.search.assert_not_called()
+
+    def test_id_checks_fetch_at_most_one_row(self, mock_odoo, test_context, mock_logger):
+        """Existence checks by ID cap the search at one result."""
+        mock_odoo.search.return_value = [7]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        ops.resolve_product(product_id=7)
+        ops.resolve_partner(partner_id=7)
+        ops.verify_record_exists("stock.warehouse", 7, "warehouse_id")
+
+        assert all(c.kwargs == {"limit": 1} for c in mock_odoo.search.call_args_list)
+
+
+class TestCreateDocuments:
+    """Tests for document creation RPC batching."""
+
+    def test_sale_order_created_with_inline_lines(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Order lines are sent as order_line commands in the order create."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: (
+            [domain[0][2]] if domain[0][0] == "id" else [1]
+        )
+        mock_odoo.read.return_value = [{"name": "S00042"}]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        lines = [{"product_id": pid, "quantity": 2} for pid in (5, 6, 7)]
+
+        result = ops.create_sale_order({"partner_id": 1}, lines, {"source": "n8n"})
+
+        assert result.success
+        assert result.record_name == "S00042"
+        mock_odoo.create.assert_called_once()
+        model, vals = mock_odoo.create.call_args.args
+        assert model == "sale.order"
+        assert [cmd[:2] for cmd in vals["order_line"]] == [(0, 0)] * 3
+        assert [cmd[2]["product_id"] for cmd in vals["order_line"]] == [5, 6, 7]
+
+    def test_header_passthrough_fields(self, mock_odoo, live_context, mock_logger):
+        """Set header fields are copied; empty ones and unknown keys are not."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        mock_odoo.read.return_value = [{"name": "S00042"}]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        header = {
+            "partner_id": 1,
+            "warehouse_id": 65,
+            "client_order_ref": "P12909",
+            "note": "",
+            "partner_invoice_id": 4,
+            "unknown_field": "x",
+            "custom_fields": {"x_custom": True},
+        }
+
+        ops.create_sale_order(header, [], {"source": "n8n", "filename": "a.tsv"})
+
+        vals = mock_odoo.create.call_args.args[1]
+        assert vals == {
+            "partner_id": 1,
+            "warehouse_id": 65,
+            "client_order_ref": "P12909",
+            "partner_invoice_id": 4,
+            "x_custom": True,
+            "origin": "[n8n] a.tsv",
+        }
+
+    def test_tags_set_on_create(self, mock_odoo, live_context, mock_logger):
+        """Tags are resolved in bulk and linked in the order create."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        mock_odoo.search_read.return_value = [{"id": 30, "name": "intercompany"}]
+        mock_odoo.create.side_effect = lambda model, vals: (
+            [31] if model == "ah_order_tags" else 100
+        )
+        mock_odoo.read.return_value = [{"name": "S00042"}]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        header = {"partner_id": 1, "tags": ["intercompany", "import"]}
+
+        ops.create_sale_order(header, [{"product_id": 5, "quantity": 1}], {})
+
+        mock_odoo.create.assert_any_call("ah_order_tags", [{"name": "import"}])
+        order_vals = mock_odoo.create.call_args_list[-1].args[1]
+        assert order_vals["ah_ops_status_ids"] == [(4, 30), (4, 31)]
+        mock_odoo.write.assert_not_called()
+
+    def test_ensure_tags_existing_only(self, mock_odoo, test_context, mock_logger):
+        """Known tags need one search_read and no create."""
+        mock_odoo.search_read.return_value = [
+            {"id": 1, "name": "a"}, {"id": 2, "name": "b"},
+        ]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        assert ops._ensure_tags(["b", "a", "b"]) == [2, 1, 2]
+        mock_odoo.create.assert_not_called()
+
+    def test_picking_moves_created_in_one_call(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """All stock moves go to Odoo in a single create."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+
+        def read(model, ids, fields=None, **kwargs):
+            if model == "stock.picking":
+                return [{"name": "WH/OUT/1", "location_id": [8, "S"],
+                         "location_dest_id": [9, "C"]}]
+            return [{"id": i, "name": "Shoe", "uom_id": [1, "Units"]} for i in ids]
+
+        mock_odoo.read.side_effect = read
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        lines = [{"product_id": pid, "quantity": 1} for pid in (5, 6)]
+
+        result = ops.create_stock_picking({"picking_type_id": 2}, lines, {})
+
+        assert result.success
+        move_calls = [
+            c for c in mock_odoo.create.call_args_list if c.args[0] == "stock.move"
+        ]
+        assert len(move_calls) == 1
+        assert len(move_calls[0].args[1]) == 2
+
+    def test_purchase_order_created_with_inline_lines(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Purchase order lines are sent as order_line commands in the order create."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+
+        def read(model, ids, fields=None, **kwargs):
+            if model == "purchase.order":
+                return [{"name": "P00001"}]
+            return [{"id": i, "name": "Shoe", "uom_id": [1, "Units"],
+                     "uom_po_id": [2, "Dozens"] if i == 5 else False} for i in ids]
+
+        mock_odoo.read.side_effect = read
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        lines = [{"product_id": pid, "quantity": 1} for pid in (5, 6)]
+
+        header = {"partner_id": 1, "currency_id": 3, "notes": ""}
+
+        result = ops.create_purchase_order(header, lines, {})
+
+        assert result.record_name == "P00001"
+        mock_odoo.create.assert_called_once()
+        model, vals = mock_odoo.create.call_args.args
+        assert model == "purchase.order"
+        assert [v["product_uom"] for _, _, v in vals["order_line"]] == [2, 1]
+        assert all("order_id" not in v for _, _, v in vals["order_line"])
+        assert vals["currency_id"] == 3
+        assert "notes" not in vals
+        product_reads = [
+            c for c in mock_odoo.read.call_args_list if c.args[0] == "product.product"
+        ]
+        assert len(product_reads) == 1
+        assert all(c.args[0] != "product.product" for c in mock_odoo.search.call_args_list)
+
+    def test_purchase_order_unread_name_falls_back(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Without a name read, the result carries the PO #<id> label."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        mock_odoo.create.return_value = 42
+        mock_odoo.read.side_effect = lambda model, ids, fields=None, **kw: [
+            {"id": i, "name": "Shoe", "uom_id": [1, "Units"], "uom_po_id": False}
+            for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+
+        result = ops.create_purchase_order(
+            {"partner_id": 1}, [{"product_id": 5, "quantity": 1}], {}, read_name=False
+        )
+
+        assert result.record_name == "PO #42"
+        assert result.data == {"order_name": "PO #42", "line_count": 1}
+
+    def test_picking_created_with_inline_moves(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Known locations let moves be created inside the picking create."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+
+        def read(model, ids, fields=None, **kwargs):
+            if model == "stock.picking":
+                return [{"name": "WH/OUT/1", "location_id": [8, "S"],
+                         "location_dest_id": [9, "C"]}]
+            return [{"id": i, "name": "Shoe", "uom_id": [1, "Units"]} for i in ids]
+
+        mock_odoo.read.side_effect = read
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        header = {"picking_type_id": 2, "location_id": 8, "location_dest_id": 9}
+
+        result = ops.create_stock_picking(header, [{"product_id": 5, "quantity": 1}], {})
+
+        assert result.record_name == "WH/OUT/1"
+        mock_odoo.create.assert_called_once()
+        model, vals = mock_odoo.create.call_args.args
+        assert model == "stock.picking"
+        (_, _, move), = vals["move_ids_without_package"]
+        assert (move["location_id"], move["location_dest_id"]) == (8, 9)
+        assert "picking_id" not in move
+
+    def test_picking_name_falls_back_when_read_fails(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """A failed batch name read leaves the stock.picking <id> label."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        picking_ids = iter([11, 12])
+        mock_odoo.create.side_effect = lambda model, vals: next(picking_ids)
+
+        def read(model, ids, fields=None, **kwargs):
+            if model == "stock.picking":
+                raise Exception("read failed")
+            return [{"id": ids[0], "name": "Shoe", "uom_id": [1, "Units"]}]
+
+        mock_odoo.read.side_effect = read
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        header = {"picking_type_id": 2, "location_id": 8, "location_dest_id": 9}
+        docs = [
+            {"document_type": "stock.picking", "header": header,
+             "lines": [{"product_id": 5, "quantity": 1}]}
+            for _ in range(2)
+        ]
+
+        results = ops.create_documents(docs, {}, max_workers=1)
+
+        assert [r.record_name for r in results] == [
+            "stock.picking 11", "stock.picking 12",
+        ]
+        assert results[0].data == {"picking_name": "stock.picking 11", "move_count": 1}
+
+    def test_create_documents_reads_picking_names_once(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Batch picking creation reads all names in a single read."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        picking_ids = iter([11, 12, 13])
+        mock_odoo.create.side_effect = lambda model, vals: next(picking_ids)
+
+        def read(model, ids, fields=None, **kwargs):
+            if model == "stock.picking":
+                return [{"id": i, "name": f"WH/OUT/{i}"} for i in ids]
+            return [{"id": ids[0], "name": "Shoe", "uom_id": [1, "Units"]}]
+
+        mock_odoo.read.side_effect = read
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        header = {"picking_type_id": 2, "location_id": 8, "location_dest_id": 9}
+        docs = [
+            {"document_type": "stock.picking", "header": header,
+             "lines": [{"product_id": 5, "quantity": 1}]}
+            for _ in range(3)
+        ]
+
+        results = ops.create_documents(docs, {}, max_workers=1)
+
+        picking_reads = [
+            c for c in mock_odoo.read.call_args_list if c.args[0] == "stock.picking"
+        ]
+        assert len(picking_reads) == 1
+        assert [r.record_name for r in results] == [
+            "WH/OUT/11", "WH/OUT/12", "WH/OUT/13",
+        ]
+        assert results[0].message == "Created WH/OUT/11 with 1 moves"
+        assert results[0].data == {"picking_name": "WH/OUT/11", "move_count": 1}
+
+    def test_read_names_are_not_read_again(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """A read name that looks like the fallback label is still final."""
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+        mock_odoo.create.side_effect = lambda model, vals: [
+            v["partner_id"] for v in vals
+        ]
+        mock_odoo.read.side_effect = lambda model, ids, fields=None: [
+            {"id": i, "name": f"PO #{i}", "uom_id": [1, "Units"], "uom_po_id": False}
+            for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        docs = [
+            dict(_sale_doc(i, partner_id=i), document_type="purchase.order")
+            for i in (1, 2)
+        ]
+
+        results = ops.create_documents(docs, {})
+
+        assert [r.record_name for r in results] == ["PO #1", "PO #2"]
+        po_reads = [
+            c for c in mock_odoo.read.call_args_list if c.args[0] == "purchase.order"
+        ]
+        assert len(po_reads) == 1
+
+    def test_create_documents_parallel_preserves_order(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Concurrent creation returns results in input order."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        mock_odoo.create.side_effect = lambda model, vals: vals["picking_type_id"]
+        mock_odoo.read.side_effect = lambda model, ids, fields=None: [
+            {"id": i, "name": f"P{i}", "uom_id": [1, "Units"]} for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        docs = [
+            {
+                "document_type": "stock.picking",
+                "header": {"picking_type_id": i, "location_id": 2, "location_dest_id": 3},
+                "lines": [{"product_id": 5, "quantity": 1}],
+            }
+            for i in range(1, 13)
+        ]
+        docs.append({"document_type": "account.move", "header": {}, "lines": []})
+
+        results = ops.create_documents(docs, {}, max_workers=4)
+
+        assert [r.record_id for r in results[:-1]] == list(range(1, 13))
+        assert not results[-1].success
+        assert results[-1].error == "Unknown document_type: account.move"
+        mock_odoo.message_post.assert_not_called()
+        (messages, message_type), = (
+            c.args for c in mock_odoo.message_post_batch.call_args_list
+        )
+        assert message_type == "notification"
+        assert [m["record_id"] for m in messages] == list(range(1, 13))
+
+    def test_order_batches_created_concurrently(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Purchase and sale orders are created per type, in parallel."""
+        barrier = threading.Barrier(2, timeout=5)
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+
+        def create(model, vals):
+            barrier.wait()
+            offset = 100 if model == "sale.order" else 0
+            return [offset + v["partner_id"] for v in vals]
+
+        mock_odoo.create.side_effect = create
+        mock_odoo.read.side_effect = lambda model, ids, fields=None: [
+            {"id": i, "name": f"R{i}", "uom_id": [1, "Units"], "uom_po_id": False}
+            for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        docs = [
+            dict(_sale_doc(i, partner_id=i), document_type="purchase.order")
+            for i in (1, 2)
+        ]
+        docs.insert(1, _sale_doc(3, partner_id=3))
+        docs.append(_sale_doc(4, partner_id=4))
+
+        results = ops.create_documents(docs, {}, max_workers=4)
+
+        assert [r.record_id for r in results] == [1, 103, 2, 104]
+        assert [r.record_name for r in results] == ["R1", "R103", "R2", "R104"]
+        assert [c.args[0] for c in mock_odoo.create.call_args_list].count(
+            "purchase.order"
+        ) == 1
+        po_reads = [
+            c.args for c in mock_odoo.read.call_args_list if c.args[0] == "purchase.order"
+        ]
+        assert po_reads == [("purchase.order", [1, 2], ["name"])]
+
+    def test_create_documents_dry_run_makes_no_calls(
+        self, mock_odoo, test_context, mock_logger
+    ):
+        """A dry run skips every document without touching Odoo."""
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+        docs = [_sale_doc(1, partner_id=1), _sale_doc(2, partner_id=2)]
+        docs.append({
+            "document_type": "stock.picking",
+            "header": {"picking_type_id": 2},
+            "lines": [{"product_id": 5, "quantity": 1}],
+        })
+
+        results = ops.create_documents(docs, {}, max_workers=4)
+
+        assert [r.action for r in results] == ["skipped"] * 3
+        assert not mock_odoo.method_calls
+
+    def test_sale_orders_created_in_one_call(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Sale orders are created and named with one create and one read."""
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2] if v != 99
+        ]
+        mock_odoo.create.side_effect = lambda model, vals: (
+            [100 + v["partner_id"] for v in vals] if model == "sale.order" else 1
+        )
+        mock_odoo.read.side_effect = lambda model, ids, fields=None: [
+            {"id": i, "name": f"S{i}"} for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        docs = [_sale_doc(i, partner_id=i) for i in (1, 2, 3)]
+        docs.insert(1, _sale_doc(9, partner_id=99))  # unknown partner
+
+        results = ops.create_documents(docs, {}, max_workers=4)
+
+        so_creates = [
+            c for c in mock_odoo.create.call_args_list if c.args[0] == "sale.order"
+        ]
+        assert len(so_creates) == 1
+        assert [v["partner_id"] for v in so_creates[0].args[1]] == [1, 2, 3]
+        assert so_creates[0].args[1][0]["order_line"] == [
+            (0, 0, {"product_id": 5, "product_uom_qty": 1})
+        ]
+        mock_odoo.read.assert_called_once_with("sale.order", [101, 102, 103], ["name"])
+        mock_odoo.search.assert_not_called()
+        assert [r.record_name for r in results] == ["S101", None, "S102", "S103"]
+        assert results[1].error == "Partner resolution failed: Partner ID 99 not found"
+
+    def test_sale_orders_bulk_falls_back_per_order(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """A rejected batch create is retried one order at a time."""
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+
+        def create(model, vals):
+            if isinstance(vals, list):
+                raise Exception("batch rejected")
+            if vals["partner_id"] == 2:
+                raise Exception("bad order")
+            return 100 + vals["partner_id"]
+
+        mock_odoo.create.side_effect = create
+        mock_odoo.read.side_effect = lambda model, ids, fields=None: [
+            {"id": i, "name": f"S{i}"} for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+
+        results = ops.create_sale_orders_bulk(
+            [_sale_doc(i, partner_id=i) for i in (1, 2, 3)], {}
+        )
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "bad order"
+        assert results[2].record_name == "S103"
+
+    def test_bulk_create_reuses_validated_partners(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """Partners resolved during validation are not searched for again."""
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2]
+        ]
+        mock_odoo.create.side_effect = lambda model, vals: [
+            100 + v["partner_id"] for v in vals
+        ]
+        mock_odoo.read.side_effect = lambda model, ids, fields=None: [
+            {"id": i, "name": f"S{i}"} for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        docs = [_sale_doc(i, partner_id=i) for i in (1, 2)]
+        ops.validate_all(docs)
+        mock_odoo.search_read.reset_mock()
+
+        results = ops.create_sale_orders_bulk(docs + [_sale_doc(3, partner_id=3)], {})
+
+        assert [r.record_id for r in results] == [101, 102, 103]
+        partner_searches = [
+            c.args[1] for c in mock_odoo.search_read.call_args_list
+            if c.args[0] == "res.partner"
+        ]
+        assert partner_searches == [[("id", "in", [3])]]
+
+
+class TestIterValidate:
+    """Tests for streaming validation."""
+
+    def test_yields_errors_and_updates_stats(self, mock_odoo, test_context, mock_logger):
+        """Errors stream out in order while stats accumulate."""
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2] if v != 2
+        ]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+        docs = [_sale_doc(1, partner_id=1), _sale_doc(2, partner_id=2)]
+        docs[0]["lines"][0]["quantity"] = 0
+        stats: dict = {}
+
+        errors = ops.iter_validate(docs, stats)
+        first = next(errors)
+
+        assert (first.row_number, first.field) == (1, "quantity")
+        assert stats["invalid_count"] == 1
+        assert [(e.row_number, e.field) for e in errors] == [(2, "partner_id")]
+        assert stats == {"valid_count": 0, "invalid_count": 2, "total_count": 2}
+
+
+class TestResultTypes:
+    """Tests for the validation value types."""
+
+    def test_slotted_dataclasses(self):
+        """ValidationError and ResolveResult carry no per-instance __dict__."""
+        error = ValidationError(row_number=1, field="f", value="v", error="e")
+        result = ResolveResult.multiple(list(range(12)))
+
+        assert not hasattr(error, "__dict__")
+        assert not hasattr(result, "__dict__")
+        assert error.to_dict() == {
+            "row_number": 1, "field": "f", "value": "v", "error": "e",
+        }
+        assert result.matched_count == 12
+        assert result.matched_ids == list(range(10))
+
+    def test_origin_from_metadata(self):
+        """Origin joins a bracketed source and the filename when present."""
+        origin = DocumentCreationOperations._origin_from_metadata
+
+        assert origin({"source": "upload", "filename": "a.csv"}) == "[upload] a.csv"
+        assert origin({"source": "upload"}) == "[upload]"
+        assert origin({"filename": "a.csv"}) == "a.csv"
+        assert origin({}) == ""
+
+
+class TestTagCache:
+    """Tests for run-wide tag caching."""
+
+    def test_ensure_tags_cached_across_calls(self, mock_odoo, test_context, mock_logger):
+        """Known tags are not looked up again; only new names hit Odoo."""
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": 1, "name": "vip"}
+        ] if "vip" in domain[0][2] else []
+        mock_odoo.create.return_value = [2]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        assert ops._ensure_tags(["vip"]) == [1]
+        assert ops._ensure_tag("vip") == 1
+        assert ops._ensure_tags(["vip", "new"]) == [1, 2]
+        assert ops._ensure_tags(["new", "vip"]) == [2, 1]
+
+        assert mock_odoo.search_read.call_count == 2
+        assert mock_odoo.search_read.call_args.args[1] == [("name", "in", ["new"])]
+        mock_odoo.create.assert_called_once_with("ah_order_tags", [{"name": "new"}])
+
+    def test_clear_tag_cache(self, mock_odoo, test_context, mock_logger):
+        """clear_tag_cache forces a fresh lookup."""
+        mock_odoo.search_read.return_value = [{"id": 1, "name": "vip"}]
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        ops._ensure_tag("vip")
+        ops.clear_tag_cache()
+        ops._ensure_tag("vip")
+
+        assert mock_odoo.search_read.call_count == 2
+
+
+class TestStrictValidation:
+    """Tests for fail_fast and max_errors."""
+
+    @staticmethod
+    def _docs():
+        doc = _sale_doc(1, partner_id=2, warehouse_id=99)
+        doc["lines"].append({"row_number": 2, "product_id": 5, "quantity": 0})
+        return [doc, _sale_doc(3, partner_id=2), _sale_doc(4, partner_id=1)]
+
+    @staticmethod
+    def _lookup(mock_odoo):
+        mock_odoo.search_read.side_effect = lambda model, domain, **kw: [
+            {"id": v} for v in domain[0][2] if v != 2
+        ]
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [
+            v for v in domain[0][2] if v != 99
+        ]
+
+    def test_default_reports_everything(self, mock_odoo, test_context, mock_logger):
+        """Without strict options every error is reported."""
+        self._lookup(mock_odoo)
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        _, errors, stats = ops.validate_all(self._docs())
+
+        assert [e.field for e in errors] == [
+            "partner_id", "warehouse_id", "quantity", "partner_id",
+        ]
+        assert stats["invalid_count"] == 2
+
+    def test_fail_fast_one_error_per_document(self, mock_odoo, test_context, mock_logger):
+        """fail_fast stops each document at its first error."""
+        self._lookup(mock_odoo)
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        _, errors, stats = ops.validate_all(self._docs(), fail_fast=True)
+
+        assert [(e.row_number, e.field) for e in errors] == [
+            (1, "partner_id"), (3, "partner_id"),
+        ]
+        assert stats == {"valid_count": 1, "invalid_count": 2, "total_count": 3}
+
+    def test_max_errors_below_one_rejected(self, mock_odoo, test_context, mock_logger):
+        """A zero or negative error budget is refused before anything is validated."""
+        self._lookup(mock_odoo)
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        for max_errors in (0, -1):
+            with pytest.raises(ValueError, match="max_errors"):
+                ops.validate_all(self._docs(), max_errors=max_errors)
+        assert not mock_odoo.method_calls
+
+    def test_exhausted_budget_still_invalid(self, mock_odoo, test_context, mock_logger):
+        """Once the budget is spent the batch is still reported invalid."""
+        self._lookup(mock_odoo)
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        all_valid, errors, stats = ops.validate_all(self._docs(), max_errors=1)
+
+        assert not all_valid
+        assert [e.field for e in errors] == ["partner_id"]
+        assert stats["invalid_count"] == 1
+
+    def test_max_errors_stops_batch(self, mock_odoo, test_context, mock_logger):
+        """max_errors caps the number of errors and stops validating."""
+        self._lookup(mock_odoo)
+        ops = DocumentCreationOperations(mock_odoo, test_context, mock_logger)
+
+        all_valid, errors, stats = ops.validate_all(self._docs(), max_errors=2)
+
+        assert not all_valid
+        assert [e.field for e in errors] == ["partner_id", "warehouse_id"]
+        assert stats["invalid_count"] == 1
+        assert stats["valid_count"] == 0
+
+
+class TestCreationMessage:
+    """Tests for the creation chatter message."""
+
+    def test_body_lists_set_metadata(self, mock_odoo, live_context, mock_logger):
+        """Only metadata that is set is listed, in a fixed order."""
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+
+        ops._post_creation_message(
+            "sale.order", 1, {"filename": "a.csv", "source": "n8n"}, 3
+        )
+
+        body = mock_odoo.message_post.call_args.args[2]
+        assert "<li><strong>Lines:</strong> 3</li>" in body
+        assert (
+            "<li><strong>Source:</strong> n8n</li>\n"
+            "<li><strong>File:</strong> a.csv</li>"
+        ) in body
+        assert "Owner" not in body
+        assert f"Request ID: {live_context.request_id}" in body
+
+    def test_meta_html_built_once_per_batch(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """create_documents builds the metadata fragment once and passes it down."""
+        mock_odoo.search.side_effect = lambda model, domain, **kw: [domain[0][2]]
+        picking_ids = iter([11, 12, 13])
+        mock_odoo.create.side_effect = lambda model, vals: next(picking_ids)
+        mock_odoo.read.side_effect = lambda model, ids, fields=None: [
+            {"id": i, "name": f"WH/OUT/{i}", "uom_id": [1, "Units"]} for i in ids
+        ]
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+        header = {"picking_type_id": 2, "location_id": 8, "location_dest_id": 9}
+        docs = [
+            {"document_type": "stock.picking", "header": header,
+             "lines": [{"product_id": 5, "quantity": 1}]}
+            for _ in range(3)
+        ]
+        metadata = {"source": "n8n"}
+
+        with patch.object(
+            ops, "_creation_meta_html", wraps=ops._creation_meta_html
+        ) as build:
+            ops.create_documents(docs, metadata, max_workers=1)
+
+        build.assert_called_once_with(metadata)
+        (messages, _), = (c.args for c in mock_odoo.message_post_batch.call_args_list)
+        assert all("n8n" in m["body"] for m in messages)
+
+        # A later message reflects the metadata as it is now
+        metadata["source"] = "changed"
+        ops._post_creation_message("stock.picking", 11, metadata, 1)
+        assert "changed" in mock_odoo.message_post.call_args.args[2]
+
+    def test_body_without_metadata(self, mock_odoo, live_context, mock_logger):
+        """Empty metadata is shown as N/A."""
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+
+        ops._post_creation_message("sale.order", 1, {}, 0)
+
+        assert "<li>N/A</li>" in mock_odoo.message_post.call_args.args[2]
+
+
+class TestConfirmDocuments:
+    """Tests for batched confirmation."""
+
+    def test_one_call_per_batch(self, mock_odoo, live_context, mock_logger):
+        """All records of a type are confirmed with one RPC."""
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+
+        results = ops.confirm_documents("purchase.order", [1, 2, 3])
+
+        mock_odoo.execute.assert_called_once_with(
+            "purchase.order", "button_confirm", [[1, 2, 3]]
+        )
+        assert [r.message for r in results] == [
+            "Confirmed purchase.order 1",
+            "Confirmed purchase.order 2",
+            "Confirmed purchase.order 3",
+        ]
+
+    def test_failed_batch_retried_per_record(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """A failing batch is retried record by record."""
+        def execute(model, method, ids):
+            if len(ids[0]) > 1 or ids[0] == [2]:
+                raise Exception("cannot confirm")
+
+        mock_odoo.execute.side_effect = execute
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+
+        results = ops.confirm_documents("sale.order", [1, 2, 3])
+
+        assert [r.success for r in results] == [True, False, True]
+        assert results[1].error == "cannot confirm"
+
+    def test_single_wrapper(self, mock_odoo, live_context, mock_logger):
+        """confirm_document confirms one record through the batch path."""
+        ops = DocumentCreationOperations(mock_odoo, live_context, mock_logger)
+
+        result = ops.confirm_document("stock.picking", 7)
+
+        mock_odoo.execute.assert_called_once_with(
+            "stock.picking", "action_assign", [[7]]
+        )
+        assert result.message == "Reserved stock for picking 7"
+        assert not ops.confirm_document("account.move", 7).success
@@ -45,7 +45,7 @@ class TestCleanOldOrdersJob:
         self, mock_odoo, mock_bq, mock_alerter, mock_logger, test_context
     ):
         """Test job execution with no records found."""
-        mock_odoo.search.return_value = []
+        mock_odoo.search_read.return_value = []
 
         job = CleanOldOrdersJob(
             ctx=test_context,
@@ -73,7 +73,6 @@ class TestCleanOldOrdersJob:
     ):
         """Test job execution with records in dry-run mode."""
         # Setup mocks
-        mock_odoo.search.return_value = [100, 101]
         mock_odoo.search_read.return_value = sample_order_lines[:2]
         mock_odoo.search_count.return_value = 0  # No open moves
 
@@ -104,7 +103,6 @@ class TestCleanOldOrdersJob:
     ):
         """Test job execution in live mode."""
         # Setup mocks
-        mock_odoo.search.return_value = [100, 101]
         mock_odoo.search_read.return_value = sample_order_lines[:2]
         mock_odoo.search_count.return_value = 0  # No open moves
 
@@ -134,7 +132,6 @@ class TestCleanOldOrdersJob:
     ):
         """Test that job skips lines with open stock moves."""
         # Setup mocks
-        mock_odoo.search.return_value = [100, 101]
         mock_odoo.search_read.return_value = sample_order_lines[:2]
         # First line has open moves, second doesn't
         mock_odoo.search_count.side_effect = [1, 0]
@@ -162,7 +159,7 @@ class TestCleanOldOrdersJob:
         live_context,  # Use live context for this test
     ):
         """Test that job returns KPIs in expected format."""
-        mock_odoo.search.return_value = []
+        mock_odoo.search_read.return_value = []
 
         job = CleanOldOrdersJob(
             ctx=live_context,
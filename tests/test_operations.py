@@ -2,9 +2,16 @@
 Tests for Operations Module
 """
 
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from unittest.mock import Mock
 
+from core.clients.bigquery import BigQueryClient
+from core.clients.odoo import OdooClient
+from core.logging.sentinel_logger import SentinelLogger
 from core.operations.orders import OrderOperations
 from core.operations.transfers import TransferOperations
 from core.result import OperationResult
@@ -15,7 +22,7 @@ class TestOrderOperations:
 
     def test_find_partial_orders_empty(self, mock_odoo, test_context, mock_logger):
         """Test finding partial orders when none exist."""
-        mock_odoo.search.return_value = []
+        mock_odoo.search_read.return_value = []
 
         ops = OrderOperations(mock_odoo, test_context, mock_logger)
         result = ops.find_partial_orders_older_than(days=30)
@@ -23,13 +30,20 @@ class TestOrderOperations:
         assert result == []
         mock_logger.info.assert_called()
 
+    def test_find_partial_orders_filters_orders_in_domain(self, mock_odoo, test_context, mock_logger):
+        """Order state and age are line-domain filters, with no separate order search."""
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        ops.find_partial_orders_older_than(days=30)
+
+        mock_odoo.search.assert_not_called()
+        domain = mock_odoo.search_read.call_args.args[1]
+        assert ("order_id.state", "=", "sale") in domain
+        assert any(term[:2] == ("order_id.date_order", "<") for term in domain)
+
     def test_find_partial_orders_with_results(
         self, mock_odoo, test_context, mock_logger, sample_order_lines
     ):
         """Test finding partial orders with results."""
-        # Mock order search
-        mock_odoo.search.return_value = [100, 101, 102]
-
         # Mock line search - return only partial lines
         mock_odoo.search_read.return_value = sample_order_lines
 
@@ -40,6 +54,49 @@ class TestOrderOperations:
         assert len(result) == 2
         assert all(r["qty_delivered"] < r["product_uom_qty"] for r in result)
 
+    def test_find_partial_orders_pages_until_limit(self, mock_odoo, test_context, mock_logger):
+        """With a limit, pages are fetched until enough partial lines are found."""
+        def page(model, domain, fields=None, offset=0, limit=None, order=None):
+            # First page: all fully delivered; second page: all partial
+            qty_delivered = 1.0 if offset == 0 else 0.5
+            return [
+                {"id": offset + i, "order_id": (100, "S100"),
+                 "product_uom_qty": 1.0, "qty_delivered": qty_delivered}
+                for i in range(limit)
+            ]
+
+        mock_odoo.search_read.side_effect = page
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        result = ops.find_partial_orders_older_than(days=30, limit=5)
+
+        offsets = [c.kwargs["offset"] for c in mock_odoo.search_read.call_args_list]
+        assert offsets == [0, 200]
+        assert mock_odoo.search_read.call_args.kwargs["order"] == "id"
+        assert [line["id"] for line in result] == [200, 201, 202, 203, 204]
+
+    def test_find_partial_orders_unlimited_scan_is_paged(self, mock_odoo, test_context, mock_logger):
+        """Without a limit, candidates are still read page by page to the end."""
+        page_size = OrderOperations.PARTIAL_SCAN_PAGE_SIZE
+
+        def page(model, domain, fields=None, offset=0, limit=None, order=None):
+            count = limit if offset == 0 else 3
+            return [
+                {"id": offset + i, "order_id": (100, "S100"),
+                 "product_uom_qty": 1.0, "qty_delivered": 0.5 if i % 2 else 1.0}
+                for i in range(count)
+            ]
+
+        mock_odoo.search_read.side_effect = page
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        result = ops.find_partial_orders_older_than(days=30)
+
+        offsets = [c.kwargs["offset"] for c in mock_odoo.search_read.call_args_list]
+        assert offsets == [0, page_size]
+        assert mock_odoo.search_read.call_args.kwargs["limit"] == page_size
+        assert len(result) == page_size // 2 + 1
+
     def test_adjust_line_qty_dry_run(self, mock_odoo, test_context, mock_logger):
         """Test adjusting line qty in dry-run mode."""
         ops = OrderOperations(mock_odoo, test_context, mock_logger)
@@ -73,6 +130,38 @@ class TestOrderOperations:
         )
         assert result.success
 
+    def test_post_qty_adjustment_message_lists_lines(self, mock_odoo, live_context, mock_logger):
+        """Each adjusted line gets a list item, with a breakdown when moves are open."""
+        ops = OrderOperations(mock_odoo, live_context, mock_logger)
+
+        ops.post_qty_adjustment_message(
+            order_id=10,
+            order_name="S010",
+            adjusted_lines=[
+                {"id": 1, "name": "Sandal", "product_uom_qty": 3.0,
+                 "qty_delivered": 2.0, "_target_qty": 2.0},
+                {"id": 2, "product_uom_qty": 5.0, "qty_delivered": 1.0,
+                 "_target_qty": 3.0, "_open_move_qty": 2.0},
+            ],
+        )
+
+        body = mock_odoo.message_post.call_args.args[2]
+        assert "Adjusted 2 line(s)" in body
+        assert "<li>Sandal: 3.0 → 2.0</li>" in body
+        assert "<li>Line #2: 5.0 → 3.0 (delivered: 1.0 + pending: 2.0)</li>" in body
+        assert "Request ID: live-request-456" in body
+
+    def test_get_order_details_default_fields(self, mock_odoo, test_context, mock_logger):
+        """The default projection leaves out amount_total."""
+        mock_odoo.read.return_value = [{"id": 10, "name": "S010"}]
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+
+        ops.get_order_details(10)
+
+        fields = mock_odoo.read.call_args.args[2]
+        assert "name" in fields
+        assert "amount_total" not in fields
+
     def test_tag_order_exception_dry_run(self, mock_odoo, test_context, mock_logger):
         """Test tagging order exception in dry-run mode."""
         ops = OrderOperations(mock_odoo, test_context, mock_logger)
@@ -84,6 +173,194 @@ class TestOrderOperations:
         mock_odoo.add_tag.assert_not_called()
         assert result.success
 
+    def test_adjust_line_qty_result_data(self, mock_odoo, live_context, test_context, mock_logger):
+        """Adjustment results carry old/new qty alongside the written values."""
+        line = {"id": 1, "product_uom_qty": 3.0, "qty_delivered": 2.0}
+
+        live = OrderOperations(mock_odoo, live_context, mock_logger)
+        assert live.adjust_line_qty_to_delivered_qty(line).data == {
+            "values": {"product_uom_qty": 2.0},
+            "old_qty": 3.0,
+            "new_qty": 2.0,
+        }
+
+        dry = OrderOperations(mock_odoo, test_context, mock_logger)
+        assert dry.adjust_line_qty_to_delivered_qty(line).data == {"old_qty": 3.0, "new_qty": 2.0}
+
+    def test_adjust_lines_bulk_groups_by_qty(self, mock_odoo, live_context, mock_logger):
+        """Lines sharing a delivered qty are written in a single call."""
+        ops = OrderOperations(mock_odoo, live_context, mock_logger)
+
+        lines = [
+            {"id": 1, "name": "A", "product_uom_qty": 3.0, "qty_delivered": 2.0},
+            {"id": 2, "name": "B", "product_uom_qty": 5.0, "qty_delivered": 0.0},
+            {"id": 3, "name": "C", "product_uom_qty": 4.0, "qty_delivered": 2.0},
+        ]
+        results = ops.adjust_lines_qty_to_delivered_bulk(lines, order_name="S001")
+
+        written = sorted(
+            (c.args[1], c.args[2]["product_uom_qty"]) for c in mock_odoo.write.call_args_list
+        )
+        assert written == [([1, 3], 2.0), ([2], 0.0)]
+        assert [r.record_id for r in results] == [1, 2, 3]
+        assert [r.record_name for r in results] == ["S001/A", "S001/B", "S001/C"]
+        assert results[2].data["old_qty"] == 4.0
+        assert results[2].data["new_qty"] == 2.0
+        assert all(r.success for r in results)
+
+    def test_precomputed_record_name_used(self, mock_odoo, test_context, mock_logger):
+        """A _record_name set at discovery is used as-is by the write operations."""
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        line = {"id": 1, "name": "A", "product_uom_qty": 1.0, "qty_delivered": 0.0,
+                "_record_name": "S001/A"}
+
+        assert ops.adjust_line_qty_to_delivered(line).record_name == "S001/A"
+        assert ops.complete_shipping_line(line).record_name == "S001/A"
+
+    def test_adjust_lines_bulk_retries_failed_group(self, mock_odoo, live_context, mock_logger):
+        """A rejected grouped write falls back to per-line writes."""
+        mock_odoo.write.side_effect = [Exception("constraint"), True, Exception("bad line")]
+        ops = OrderOperations(mock_odoo, live_context, mock_logger)
+
+        lines = [
+            {"id": 1, "product_uom_qty": 3.0, "qty_delivered": 2.0},
+            {"id": 2, "product_uom_qty": 4.0, "qty_delivered": 2.0},
+        ]
+        results = ops.adjust_lines_qty_to_delivered_bulk(lines)
+
+        assert mock_odoo.write.call_count == 3
+        assert [r.success for r in results] == [True, False]
+        assert results[1].error == "bad line"
+
+    def test_adjust_lines_bulk_dry_run(self, mock_odoo, test_context, mock_logger):
+        """Dry run returns a skipped result per line without writing."""
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+
+        lines = [
+            {"id": 1, "product_uom_qty": 3.0, "qty_delivered": 2.0},
+            {"id": 2, "product_uom_qty": 4.0, "qty_delivered": 2.0},
+            {"id": 3, "product_uom_qty": 1.0, "qty_delivered": -1.0},
+        ]
+        results = ops.adjust_lines_qty_to_delivered_bulk(lines)
+
+        mock_odoo.write.assert_not_called()
+        assert [r.record_id for r in results] == [1, 2, 3]
+        assert all(r.action == "skipped" for r in results)
+
+    def test_tag_order_exception_failed_note_skips_tag(
+        self, mock_odoo, live_context, mock_logger
+    ):
+        """The tag is only added once the note is posted."""
+        mock_odoo.message_post.side_effect = Exception("chatter down")
+
+        ops = OrderOperations(mock_odoo, live_context, mock_logger)
+        result = ops.tag_order_exception(100, "Test error", order_name="S100")
+
+        mock_odoo.add_tag.assert_not_called()
+        assert not result.success
+        assert "chatter down" in result.error
+
+
+class TestFindClosedOrdersWithQtyMismatch:
+    """Tests for OrderOperations.find_closed_orders_with_qty_mismatch."""
+
+    @pytest.fixture(autouse=True)
+    def _read_line_details(self, mock_odoo):
+        """Answer order name and line detail reads with a record per id."""
+        mock_odoo.read.side_effect = lambda model, ids, fields: [
+            {"id": i, "name": f"S{i:03d}"} if model == "sale.order"
+            else {"id": i, "name": f"Line {i}", "product_id": (7, "P")}
+            for i in ids
+        ]
+
+    def test_negative_delivered_filtered_in_domain(self, mock_odoo, test_context, mock_logger):
+        """The non-negative guard is part of the domain, not a Python post-filter."""
+        mock_odoo.search_read.return_value = [
+            {"id": 1, "name": "A", "product_id": (7, "P"), "order_id": 10,
+             "product_uom_qty": 3.0, "qty_delivered": 2.0},
+            {"id": 2, "name": "B", "product_id": (7, "P"), "order_id": 10,
+             "product_uom_qty": 1.0, "qty_delivered": 1.0},
+        ]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        orders, stats = ops.find_closed_orders_with_qty_mismatch()
+
+        domain = mock_odoo.search_read.call_args.args[1]
+        assert ("qty_delivered", ">=", 0) in domain
+        assert [o["order_id"] for o in orders] == [10]
+        assert [l["id"] for l in orders[0]["mismatched_lines"]] == [1]
+        assert stats["lines_from_query"] == 2
+        assert stats["lines_with_mismatch"] == 1
+
+    def test_details_read_only_for_kept_lines(self, mock_odoo, test_context, mock_logger):
+        """Discovery skips name/product_id; they are read for surviving lines only."""
+        mock_odoo.search_read.return_value = [
+            {"id": 1, "order_id": 10, "product_uom_qty": 3.0, "qty_delivered": 2.0},
+            {"id": 2, "order_id": 10, "product_uom_qty": 1.0, "qty_delivered": 1.0},
+            {"id": 3, "order_id": 11, "product_uom_qty": 2.0, "qty_delivered": 0.0},
+        ]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        orders, _ = ops.find_closed_orders_with_qty_mismatch()
+
+        assert "name" not in mock_odoo.search_read.call_args.kwargs["fields"]
+        mock_odoo.read.assert_any_call("sale.order", [10, 11], ["name"])
+        mock_odoo.read.assert_called_with(
+            "sale.order.line", [1, 3], ["name", "product_id"]
+        )
+        assert mock_odoo.search_read.call_args.kwargs["load"] == "_classic_write"
+        assert orders[0]["order_name"] == "S010"
+        assert orders[0]["mismatched_lines"][0]["_record_name"] == "S010/Line 1"
+        assert orders[0]["mismatched_lines"][0]["name"] == "Line 1"
+
+    def test_groups_lines_per_order(self, mock_odoo, test_context, mock_logger):
+        """Lines are grouped per order even if an order's lines are split."""
+        mock_odoo.search_read.return_value = [
+            {"id": 1, "order_id": 10, "product_uom_qty": 3.0, "qty_delivered": 2.0},
+            {"id": 2, "order_id": 10, "product_uom_qty": 2.0, "qty_delivered": 0.0},
+            {"id": 3, "order_id": 11, "product_uom_qty": 1.0, "qty_delivered": 1.0},
+            {"id": 4, "order_id": 10, "product_uom_qty": 4.0, "qty_delivered": 1.0},
+        ]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        orders, stats = ops.find_closed_orders_with_qty_mismatch()
+
+        assert mock_odoo.search_read.call_args.kwargs["order"] == "order_id, id"
+        assert [o["order_name"] for o in orders] == ["S010"]
+        assert [l["id"] for l in orders[0]["mismatched_lines"]] == [1, 2, 4]
+        assert stats["lines_with_mismatch"] == 3
+
+    def test_default_excludes_sent_as_list(self, mock_odoo, test_context, mock_logger):
+        """The default exclusion set is passed to the domain as a plain list."""
+        mock_odoo.search_read.return_value = []
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        ops.find_closed_orders_with_qty_mismatch()
+
+        domain = mock_odoo.search_read.call_args.args[1]
+        excluded = next(term[2] for term in domain if term[:2] == ("product_id", "not in"))
+        assert isinstance(excluded, list)
+        assert set(excluded) == OrderOperations.DEFAULT_EXCLUDE_PRODUCT_IDS
+        assert 15743 in OrderOperations.DEFAULT_EXCLUDE_PRODUCT_IDS
+
+    def test_limit_samples_orders(self, mock_odoo, test_context, mock_logger):
+        """A limit keeps a random subset of distinct qualifying orders."""
+        mock_odoo.search_read.return_value = [
+            {"id": oid, "name": "L", "product_id": (7, "P"), "order_id": oid,
+             "product_uom_qty": 2.0, "qty_delivered": 1.0}
+            for oid in range(1, 51)
+        ]
+
+        ops = OrderOperations(mock_odoo, test_context, mock_logger)
+        orders, stats = ops.find_closed_orders_with_qty_mismatch(limit=5, days=7)
+
+        assert len({o["order_id"] for o in orders}) == 5
+        assert stats["orders_with_mismatch"] == 50
+        assert stats["limit_reached"] is True
+        domain = mock_odoo.search_read.call_args.args[1]
+        cutoff = next(term[2] for term in domain if term[0] == "order_id.date_order")
+        assert len(cutoff) == 10 and cutoff[4] == "-"
+
 
 class TestTransferOperations:
     """Tests for TransferOperations class."""
@@ -129,3 +406,106 @@ class TestTransferOperations:
 
         assert len(result) == 2
         mock_odoo.search_read.assert_called_once()
+
+
+class TestChatterBatcher:
+    """Tests for BaseOperation.chatter_batch."""
+
+    def test_batches_messages_into_one_rpc(self, mock_odoo, live_context, mock_logger):
+        """Fragments per record are joined and all records posted at once."""
+        ops = TransferOperations(mock_odoo, live_context, mock_logger)
+
+        with ops.chatter_batch() as chatter:
+            chatter.add("stock.picking", 1, "<p>a</p>", "PICK001")
+            chatter.add("stock.picking", 1, "<p>b</p>")
+            chatter.add("sale.order", 2, "<p>c</p>", "SO002")
+
+        mock_odoo.message_post_batch.assert_called_once()
+        messages = mock_odoo.message_post_batch.call_args.args[0]
+        assert [(m["model"], m["record_id"], m["body"]) for m in messages] == [
+            ("stock.picking", 1, "<p>a</p>\n<p>b</p>"),
+            ("sale.order", 2, "<p>c</p>"),
+        ]
+        assert [r.record_name for r in chatter.results] == ["PICK001", "SO002"]
+        assert all(r.success for r in chatter.results)
+        mock_odoo.message_post.assert_not_called()
+
+    def test_dry_run_posts_nothing(self, mock_odoo, test_context, mock_logger):
+        """Dry run returns skipped results without RPCs."""
+        ops = TransferOperations(mock_odoo, test_context, mock_logger)
+
+        with ops.chatter_batch() as chatter:
+            chatter.add("stock.picking", 1, "<p>a</p>")
+
+        mock_odoo.message_post_batch.assert_not_called()
+        assert chatter.results[0].action == "skipped"
+
+
+class TestSentinelLoggerLazyData:
+    """Tests for callable log data in SentinelLogger."""
+
+    def test_callable_data_built_only_when_audited(self, test_context):
+        """Unaudited entries never call the data builder; audited ones do."""
+        bq = Mock()
+        log = SentinelLogger(test_context, bq_client=bq)
+        build = Mock(return_value={"count": 3})
+
+        log.info("not audited", data=build)
+        build.assert_not_called()
+
+        log.info("audited", audit=True, data=build)
+        build.assert_called_once()
+        assert bq.log_audit.call_args.args[2] == {"message": "audited", "count": 3}
+
+    def test_audit_inserts_serialized_across_threads(self, live_context):
+        """Worker threads sharing a logger never insert audit rows concurrently."""
+        active, overlaps = [], []
+
+        def insert(table_id, rows):
+            active.append(1)
+            if len(active) > 1:
+                overlaps.append(1)
+            time.sleep(0.001)
+            active.pop()
+            return []
+
+        bq = BigQueryClient("project")
+        bq._client = Mock(insert_rows_json=Mock(side_effect=insert))
+        log = SentinelLogger(live_context, bq_client=bq)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: log.success(i, "done"), range(32)))
+
+        assert bq._client.insert_rows_json.call_count == 32
+        assert not overlaps
+
+
+
+class TestOdooClientReauth:
+    """Tests for OdooClient re-authentication under concurrency."""
+
+    def test_idle_errors_reauthenticate_once(self):
+        """Threads failing on idle connections together share one re-auth."""
+        client = OdooClient("http://odoo", "db", "user", "secret")
+        client._common = Mock()
+        client._common.authenticate.return_value = 7
+        client.authenticate()
+
+        barrier = threading.Barrier(4, timeout=5)
+
+        def idle(*args):
+            barrier.wait()
+            raise Exception("Idle connection closed")
+
+        client._idle_models.extend(Mock(execute_kw=Mock(side_effect=idle)) for _ in range(4))
+        fresh = Mock()
+        fresh.execute_kw.return_value = [1]
+        client._new_models = lambda: fresh
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(
+                lambda _: client.execute("res.partner", "search", []), range(4)
+            ))
+
+        assert results == [[1]] * 4
+        assert client._common.authenticate.call_count == 2